@@ -0,0 +1,39 @@
+import os
+import threading
+
+# Where the app keeps state between runs; each file can be moved with its own env var
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "data_fill_automation")
+CONFIG_ROOT = os.path.join(os.path.expanduser("~"), ".config", "data_fill_automation")
+
+
+def cache_path(name, env_var=None):
+    """Path of name under CACHE_ROOT, or $env_var when it is set"""
+    return _path(CACHE_ROOT, name, env_var)
+
+
+def config_path(name, env_var=None):
+    """Path of name under CONFIG_ROOT, or $env_var when it is set"""
+    return _path(CONFIG_ROOT, name, env_var)
+
+
+def _path(root, name, env_var):
+    if env_var and os.environ.get(env_var):
+        return os.environ[env_var]
+    return os.path.join(root, name)
+
+
+class ProcessDefault:
+    """Mixin giving a class one lazily created, process-wide instance: cls.default()"""
+
+    # Reentrant, so a default instance may use other defaults while it is built
+    _default_lock = threading.RLock()
+
+    @classmethod
+    def default(cls):
+        with ProcessDefault._default_lock:
+            # Looked up on cls itself so a subclass never gets its parent's instance
+            instance = cls.__dict__.get("_default")
+            if instance is None:
+                instance = cls()
+                cls._default = instance
+            return instance
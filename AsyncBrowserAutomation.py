@@ -0,0 +1,433 @@
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from urllib.parse import urlsplit
+
+from wsproto import ConnectionType, WSConnection
+from wsproto.events import AcceptConnection, CloseConnection, Ping, RejectConnection, Request, TextMessage
+
+from DriverLocator import DriverLocator, DriverNotFoundError
+from FlowConfig import DEFAULT_TIMEOUTS
+from FormScripts import ACCEPT_COOKIES_SCRIPT, FILL_FORM_SCRIPT, FIRST_FORM_SCRIPT, FORM_READY_SCRIPT
+from Instrumentation import Tracer
+from LaunchProfiles import get_profile
+from RecordValidator import REQUIRED_FIELDS
+
+# Automation backends selectable at runtime ($DATA_FILL_BACKEND or --backend)
+AUTOMATION_BACKENDS = ("selenium", "cdp")
+
+
+def backend_from_env(default="selenium"):
+    """The backend named by $DATA_FILL_BACKEND, falling back to default"""
+    backend = os.environ.get("DATA_FILL_BACKEND", default).strip().lower()
+    if backend not in AUTOMATION_BACKENDS:
+        raise ValueError(f"Unknown automation backend: {backend}")
+    return backend
+
+
+class CdpError(Exception):
+    """A Chrome DevTools Protocol command failed or the connection dropped"""
+
+
+class CdpConnection:
+    """Minimal asyncio Chrome DevTools Protocol client over one websocket
+
+    Commands are multiplexed by id, so any number of page sessions can
+    have commands in flight on the same connection at once. Events are
+    delivered to futures registered with wait_for_event().
+    """
+
+    def __init__(self, reader, writer, ws):
+        self.reader = reader
+        self.writer = writer
+        self.ws = ws
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._event_waiters = []
+        self._reader_task = None
+
+    @classmethod
+    async def connect(cls, url):
+        parts = urlsplit(url)
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+        ws = WSConnection(ConnectionType.CLIENT)
+        writer.write(ws.send(Request(host=parts.netloc, target=parts.path)))
+        await writer.drain()
+
+        # Read until the handshake is answered
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                raise CdpError("DevTools closed the connection during the handshake")
+            ws.receive_data(data)
+            for event in ws.events():
+                if isinstance(event, AcceptConnection):
+                    connection = cls(reader, writer, ws)
+                    connection._reader_task = asyncio.create_task(connection._read_loop())
+                    return connection
+                if isinstance(event, RejectConnection):
+                    raise CdpError(f"DevTools rejected the websocket (HTTP {event.status_code})")
+
+    async def send(self, method, params=None, session_id=None):
+        """Send a command and return its result (raises CdpError on a protocol error)"""
+        command_id = next(self._ids)
+        message = {"id": command_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[command_id] = future
+        self.writer.write(self.ws.send(TextMessage(data=json.dumps(message))))
+        await self.writer.drain()
+        return await future
+
+    def wait_for_event(self, method, session_id=None):
+        """Future resolving with the params of the next `method` event (register before triggering it)"""
+        future = asyncio.get_running_loop().create_future()
+        self._event_waiters.append((method, session_id, future))
+        return future
+
+    async def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        try:
+            self.writer.write(self.ws.send(CloseConnection(code=1000)))
+            self.writer.close()
+        except Exception:
+            pass
+        self._fail_pending(CdpError("DevTools connection closed"))
+
+    async def _read_loop(self):
+        buffer = []
+        try:
+            while True:
+                data = await self.reader.read(1 << 20)
+                self.ws.receive_data(data or None)
+                for event in self.ws.events():
+                    if isinstance(event, TextMessage):
+                        buffer.append(event.data)
+                        if event.message_finished:
+                            self._dispatch(json.loads("".join(buffer)))
+                            buffer = []
+                    elif isinstance(event, Ping):
+                        self.writer.write(self.ws.send(event.response()))
+                    elif isinstance(event, CloseConnection):
+                        raise CdpError("DevTools closed the connection")
+                if not data:
+                    raise CdpError("DevTools connection lost")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_pending(e if isinstance(e, CdpError) else CdpError(str(e)))
+
+    def _dispatch(self, message):
+        if "id" in message:
+            future = self._pending.pop(message["id"], None)
+            if future is None or future.done():
+                return
+            if "error" in message:
+                future.set_exception(CdpError(message["error"].get("message", "CDP error")))
+            else:
+                future.set_result(message.get("result", {}))
+            return
+
+        method = message.get("method")
+        session_id = message.get("sessionId")
+        for waiter in list(self._event_waiters):
+            wanted_method, wanted_session, future = waiter
+            if future.done():
+                self._event_waiters.remove(waiter)
+            elif wanted_method == method and wanted_session in (None, session_id):
+                self._event_waiters.remove(waiter)
+                future.set_result(message.get("params", {}))
+
+    def _fail_pending(self, error):
+        for future in list(self._pending.values()) + [waiter[2] for waiter in self._event_waiters]:
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        self._event_waiters.clear()
+
+
+class AsyncPage:
+    """One browser tab, driven through a flattened CDP target session"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, session_id=self.session_id)
+
+    async def goto(self, url, timeout):
+        """Navigate and wait for the load event; False on timeout"""
+        loaded = self.connection.wait_for_event("Page.loadEventFired", self.session_id)
+        result = await self.send("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            loaded.cancel()
+            raise CdpError(f"Navigation failed: {result['errorText']}")
+        try:
+            await asyncio.wait_for(loaded, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def evaluate(self, script, *args):
+        """Run a FormScripts-style script (uses `arguments`, ends in `return`)"""
+        expression = f"(function() {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        return await self._evaluate(expression)
+
+    async def evaluate_async(self, script, *args):
+        """Run a FormScripts async script, which reports through its last argument"""
+        expression = (
+            "new Promise(done => (function() {\n" + script + "\n})"
+            f".apply(null, {json.dumps(list(args))}.concat([done])))"
+        )
+        return await self._evaluate(expression)
+
+    async def wait_for_form_ready(self, selector, timeout):
+        return bool(await self.evaluate_async(FORM_READY_SCRIPT, selector, int(timeout * 1000)))
+
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+    async def _evaluate(self, expression):
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression, "returnByValue": True, "awaitPromise": True,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise CdpError(details.get("exception", {}).get("description") or details.get("text", "script error"))
+        return result.get("result", {}).get("value")
+
+
+class AsyncBrowser:
+    """A Chrome process controlled over CDP; every session is a tab on one connection"""
+
+    def __init__(self, process, connection, profile, profile_dir, owns_profile, stderr_task=None):
+        self.process = process
+        self.connection = connection
+        # Keeps draining Chrome's stderr; held here so it is not garbage-collected mid-run
+        self._stderr_task = stderr_task
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self._owns_profile = owns_profile
+
+    @classmethod
+    async def launch(cls, chrome_path=None, profile="lean", extra_args=(), timeout=30):
+        """Start Chrome with remote debugging on a free port and connect to it"""
+        chrome_path = chrome_path or DriverLocator.default().chrome()
+        if not chrome_path:
+            raise DriverNotFoundError("Chrome not found; set CHROME_PATH")
+        profile = get_profile(profile)
+        profile_dir = profile.claim_slot()
+        owns_profile = profile_dir is None
+        profile_dir = profile_dir or tempfile.mkdtemp(prefix="data-fill-cdp-")
+        args = [
+            chrome_path, "--remote-debugging-port=0", "--no-first-run", "--no-default-browser-check",
+            *profile.chrome_arguments(profile_dir), *extra_args, "about:blank",
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            url = await asyncio.wait_for(cls._devtools_url(process), timeout)
+        except Exception:
+            process.kill()
+            cls._release_profile(profile, profile_dir, owns_profile)
+            raise
+        # Keep draining stderr so Chrome never blocks on a full pipe
+        stderr_task = asyncio.create_task(_drain(process.stderr))
+        try:
+            connection = await CdpConnection.connect(url)
+        except Exception:
+            stderr_task.cancel()
+            process.kill()
+            cls._release_profile(profile, profile_dir, owns_profile)
+            raise
+        return cls(process, connection, profile, profile_dir, owns_profile, stderr_task)
+
+    @staticmethod
+    def _release_profile(profile, profile_dir, owns_profile):
+        if owns_profile:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        else:
+            profile.release_slot(profile_dir)
+
+    @staticmethod
+    async def _devtools_url(process):
+        """Read Chrome's stderr until it prints the browser websocket URL"""
+        prefix = "DevTools listening on "
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                raise CdpError("Chrome exited before opening the DevTools port")
+            line = line.decode("utf-8", "replace").strip()
+            if line.startswith(prefix):
+                return line[len(prefix):]
+
+    async def new_page(self):
+        target = await self.connection.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        page = AsyncPage(self.connection, target["targetId"], attached["sessionId"])
+        await page.send("Page.enable")
+        patterns = self.profile.url_block_patterns
+        if patterns:
+            await page.send("Network.enable")
+            await page.send("Network.setBlockedURLs", {"urls": patterns})
+        return page
+
+    async def close(self):
+        try:
+            await asyncio.wait_for(self.connection.send("Browser.close"), 5)
+        except Exception:
+            self.process.kill()
+        await self.connection.close()
+        await self.process.wait()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+        self._release_profile(self.profile, self.profile_dir, self._owns_profile)
+
+
+async def _drain(stream):
+    while await stream.readline():
+        pass
+
+
+class AsyncBrowserAutomation:
+    """The non-interactive part of the flow (open page, cookies, first form, fill) on asyncio
+
+    Mirrors BrowserAutomation's stages and reuses the same FormScripts, but
+    drives a tab of a shared AsyncBrowser over CDP instead of a chromedriver
+    session, so many applicants can be filled concurrently from one event
+    loop. The OTP hand-off and the review/submission step stay on the
+    Selenium backend: fill_record closes its tab after filling, so this
+    backend is for dry runs and benchmarks only.
+    """
+
+    def __init__(self, browser, timeouts=None, tracer=None):
+        self.browser = browser
+        self.page = None
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        # Per-field status of the last insert_data call ("ok", "missing", ...)
+        self.fill_results = {}
+        self.tracer = tracer or Tracer.from_env()
+
+    async def setup_browser(self):
+        with self.tracer.span("setup_browser", backend="cdp") as span:
+            try:
+                self.page = await self.browser.new_page()
+                return True
+            except Exception as e:
+                print(f"❌ Error opening a browser tab: {e}")
+                span["ok"] = False
+                return False
+
+    async def open_page(self, url):
+        with self.tracer.span("open_page", backend="cdp") as span:
+            try:
+                if not await self.page.goto(url, self.timeouts["page_load"]):
+                    print(f"⚠️  Page still loading after {self.timeouts['page_load']}s")
+                await self.handle_cookies_and_popups()
+                return True
+            except Exception as e:
+                print(f"❌ Error opening page: {e}")
+                span["ok"] = False
+                return False
+
+    async def handle_cookies_and_popups(self):
+        """Accept the OneTrust banner if it shows up within the cookie timeout"""
+        with self.tracer.span("cookie_handling", backend="cdp"):
+            try:
+                if await self.page.wait_for_form_ready("#onetrust-accept-btn-handler", self.timeouts["cookie_banner"]):
+                    await self.page.evaluate(ACCEPT_COOKIES_SCRIPT)
+                    print("✅ Accepted all cookies")
+            except Exception as e:
+                print(f"ℹ️ No cookie banner found or already dismissed: {e}")
+            return True
+
+    async def handle_first_form(self):
+        """Select 'i am an agency' and '1' applicant, then wait for the main form"""
+        with self.tracer.span("first_form", backend="cdp") as span:
+            try:
+                if not await self.page.wait_for_form_ready("[name='user_type']", self.timeouts["element"]):
+                    raise CdpError("first form not found")
+                if not await self.page.evaluate(FIRST_FORM_SCRIPT, "i am an agency", "1"):
+                    raise CdpError("first form controls missing")
+                if not await self.page.wait_for_form_ready("[name='surname']", self.timeouts["form_ready"]):
+                    raise CdpError("main form did not become visible")
+                return True
+            except Exception as e:
+                print(f"❌ Error handling first form: {e}")
+                span["ok"] = False
+                return False
+
+    async def insert_data(self, data):
+        """Fill every field in one script call, like BrowserAutomation.insert_data"""
+        with self.tracer.span("insert_data", backend="cdp") as span:
+            values = {name: str(value) for name, value in data.items() if not (value == '' or value == [])}
+            try:
+                filled = await self.page.evaluate(FILL_FORM_SCRIPT, values)
+            except Exception as e:
+                print(f"❌ Error filling the form: {e}")
+                span["ok"] = False
+                return False
+            self.fill_results = filled["results"]
+            for name, duration_ms in filled["timings"].items():
+                self.tracer.record(f"field:{name}", duration_ms, mode="script", backend="cdp",
+                                   ok=self.fill_results[name] == "ok")
+            for name, status in self.fill_results.items():
+                if status != "ok":
+                    print(f"⚠️  Could not fill {name}: {status}")
+            filled_count = sum(1 for status in self.fill_results.values() if status == "ok")
+            print(f"✅ Successfully filled {filled_count} fields!")
+            return True
+
+    def required_fields_filled(self):
+        """True when the last insert_data filled every required field ("ok")"""
+        return all(self.fill_results.get(name) == "ok" for name in REQUIRED_FIELDS)
+
+    async def fill_record(self, url, data):
+        """Open url in a fresh tab, answer the first form and fill data; the tab is closed unsubmitted"""
+        if not await self.setup_browser():
+            return False
+        try:
+            return (await self.open_page(url)
+                    and await self.handle_first_form()
+                    and await self.insert_data(data)
+                    and self.required_fields_filled())
+        finally:
+            await self.close_browser()
+
+    async def close_browser(self):
+        if self.page is not None:
+            try:
+                await self.page.close()
+            except Exception:
+                pass
+            self.page = None
+
+
+async def fill_records(url, records, sessions=4, browser=None, timeouts=None, tracer=None, **launch_options):
+    """Fill records against url with up to `sessions` tabs of one Chrome; returns True/False per record"""
+    owns_browser = browser is None
+    browser = browser or await AsyncBrowser.launch(**launch_options)
+    slots = asyncio.Semaphore(sessions)
+
+    async def fill_one(record):
+        async with slots:
+            automation = AsyncBrowserAutomation(browser, timeouts=timeouts, tracer=tracer)
+            return await automation.fill_record(url, record)
+
+    try:
+        return list(await asyncio.gather(*(fill_one(record) for record in records)))
+    finally:
+        if owns_browser:
+            await browser.close()
@@ -0,0 +1,109 @@
+import queue
+import threading
+
+from BrowserAutomation import BrowserAutomation
+
+
+class AutomationWorker:
+    """Run the browser automation on a background thread, reporting to the Tk loop
+
+    The worker thread never touches widgets. It pushes (kind, payload) events
+    onto a queue which the Tk main loop drains every poll_ms via root.after and
+    hands to on_event(kind, payload):
+
+        ("progress", (stage, message, record_number, record_count))
+        ("review", record_number)   - form filled, waiting for finish_review()
+        ("done", results)           - list of True/False, one per record
+    """
+
+    def __init__(self, root, on_event, poll_ms=100):
+        self.root = root
+        self.on_event = on_event
+        self.poll_ms = poll_ms
+        self.events = queue.Queue()
+        self.thread = None
+        self.automation = None
+        self.cancel_event = threading.Event()
+        self.review_done = threading.Event()
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, records, automation_options=None):
+        """Fill records one after another on a background thread"""
+        if self.running:
+            return False
+        self.cancel_event.clear()
+        self.review_done.clear()
+        self.thread = threading.Thread(
+            target=self._run, args=(list(records), automation_options or {}),
+            name="automation-worker", daemon=True
+        )
+        self.thread.start()
+        self.root.after(self.poll_ms, self._drain)
+        return True
+
+    def cancel(self):
+        """Stop after the current stage and close the browser"""
+        self.cancel_event.set()
+        self.review_done.set()
+        if self.automation is not None:
+            self.automation.cancel()
+
+    def stop(self, timeout=10):
+        """Cancel and wait up to timeout seconds for the thread; quit its browser if it is still busy"""
+        self.cancel()
+        if self.thread is not None:
+            self.thread.join(timeout)
+        automation = self.automation
+        if self.running and automation is not None and automation.driver is not None:
+            # Stuck in a long wait: quit Chrome outright rather than leave it orphaned
+            try:
+                automation.driver.quit()
+            except Exception:
+                pass
+
+    def finish_review(self):
+        """Tell a flow waiting in the review step that the operator is done"""
+        self.review_done.set()
+
+    def _run(self, records, automation_options):
+        results = []
+        for number, record in enumerate(records, 1):
+            if self.cancel_event.is_set():
+                results.append(False)
+                continue
+            self.review_done.clear()
+
+            def progress(stage, message, number=number):
+                self.events.put(("progress", (stage, message, number, len(records))))
+
+            def review(automation, number=number):
+                self.events.put(("review", number))
+                self.review_done.wait()
+
+            self.automation = BrowserAutomation(progress_callback=progress, **automation_options)
+            # Share the cancel flag so a cancel that races the constructor is still seen
+            self.automation.cancel_event = self.cancel_event
+            try:
+                results.append(self.automation.execute_full_flow(record, review_hook=review))
+            except Exception as e:
+                print(f"❌ Automation error: {e}")
+                self.automation.close_browser()
+                results.append(False)
+        self.automation = None
+        self.events.put(("done", results))
+
+    def _drain(self):
+        """Deliver queued events on the Tk thread, then reschedule while running"""
+        finished = False
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.on_event(kind, payload)
+            finished = finished or kind == "done"
+        if not finished:
+            self.root.after(self.poll_ms, self._drain)
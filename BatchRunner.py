@@ -0,0 +1,173 @@
+"""Command-line batch runs without the Tk GUI
+
+Goes straight from a workbook to the automation, without importing
+customtkinter or building any widgets, for unattended servers:
+
+    python -m BatchRunner run workbook.xlsx --sessions 4
+    python -m BatchRunner run workbook.xlsx --no-otp --dry-run --url https://...
+    python -m BatchRunner run workbook.xlsx --backend cdp --dry-run --url http://localhost:8000/index.html
+    python -m BatchRunner validate workbook.xlsx
+
+Every filled form stays open until the operator has submitted it in its
+browser window; only then is the record journaled "filled". --dry-run fills
+the forms, closes them unsubmitted and leaves the journal's "filled" entries
+alone. The CDP backend closes its tabs after filling, so it only runs with
+--dry-run.
+
+The exit status is 0 when every record was filled (or validated), 1 otherwise.
+"""
+import argparse
+import asyncio
+import sys
+
+from ExcelReader import ExcelReader
+from Instrumentation import InMemoryAggregator, JsonLinesSink, Tracer
+from ProgressJournal import ProgressJournal
+from RecordCache import RecordCache
+from RecordValidator import DEFAULT_VALIDATOR
+
+
+def load_records(path, orientation="column", use_cache=True):
+    """Records of a workbook (or CSV) as a list of dicts; None if it cannot be read"""
+    reader = ExcelReader(orientation=orientation, cache=RecordCache() if use_cache else None)
+    return reader.records if reader.select_file(path) else None
+
+
+def build_tracer(trace_path):
+    if trace_path:
+        return Tracer([JsonLinesSink(trace_path)])
+    return Tracer.from_env()
+
+
+def run_selenium(records, args, tracer, journal):
+    # Imported here so `validate` never loads the browser stack
+    from FillScheduler import FillScheduler
+
+    options = {"target_url": args.url} if args.url else {}
+    if args.typed_fields:
+        options["typed_fields"] = args.typed_fields.split(",")
+    scheduler_options = {"handoff": None} if args.no_otp else {}
+    if args.dry_run:
+        scheduler_options["review"] = None
+    if args.global_limit:
+        FillScheduler.set_global_limit(args.global_limit)
+    scheduler = FillScheduler(
+        sessions=args.sessions, automation_options=options, tracer=tracer,
+        journal=journal, profile=args.profile, **scheduler_options
+    )
+    return scheduler.run(records)
+
+
+def run_cdp(records, args, tracer, journal):
+    """Dry run on the CDP backend: its tabs close after filling, so no record is journaled as filled"""
+    from AsyncBrowserAutomation import fill_records
+
+    # FillScheduler does validation and the journal check for Selenium; do the same here
+    report = DEFAULT_VALIDATOR.validate(records)
+    report.print_report()
+    queued = [
+        index for index in report.valid_indexes
+        if journal is None or not journal.is_filled(records[index])
+    ]
+    results = [False] * len(records)
+    for index in set(report.valid_indexes) - set(queued):
+        results[index] = True
+    if len(queued) < len(report.valid_indexes):
+        print(f"⏩ Skipping {len(report.valid_indexes) - len(queued)} record(s) already filled in a previous run")
+
+    timings = tracer.add_sink(InMemoryAggregator())
+    print(f"🚀 Filling {len(queued)} record(s) with {args.sessions} tab(s)...")
+    filled = asyncio.run(fill_records(
+        args.url, [records[index] for index in queued], sessions=args.sessions,
+        tracer=tracer, profile=args.profile or "lean"
+    ))
+    for index, ok in zip(queued, filled):
+        results[index] = ok
+    timings.report()
+    print("ℹ️ Dry run: each form was closed unsubmitted, so the journal was not updated")
+    return results
+
+
+def run_command(args):
+    records = load_records(args.workbook, args.orientation, use_cache=not args.no_cache)
+    if records is None:
+        return 1
+    if args.limit:
+        records = records[:args.limit]
+
+    journal = None if args.no_journal else ProgressJournal.default()
+    if journal is not None and args.restart:
+        journal.forget(records)
+
+    tracer = build_tracer(args.trace)
+    if args.backend == "cdp":
+        if not args.url:
+            print("❌ --url is required with --backend cdp")
+            return 2
+        if not args.dry_run:
+            print("❌ The CDP backend closes each form unsubmitted; run it with --dry-run or use selenium")
+            return 2
+        results = run_cdp(records, args, tracer, journal)
+    else:
+        results = run_selenium(records, args, tracer, journal)
+
+    filled = sum(1 for result in results if result)
+    print(f"✅ {filled}/{len(results)} record(s) {'filled (dry run, not submitted)' if args.dry_run else 'filled and submitted'}")
+    return 0 if filled == len(results) else 1
+
+
+def validate_command(args):
+    records = load_records(args.workbook, args.orientation, use_cache=not args.no_cache)
+    if records is None:
+        return 1
+    report = DEFAULT_VALIDATOR.validate(records)
+    print(report.describe(limit=args.show))
+    return 0 if not report.rejected_count else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m BatchRunner", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_workbook_arguments(command):
+        command.add_argument("workbook", help="Excel workbook (or .csv) with one applicant per column or row")
+        command.add_argument("--orientation", choices=["column", "row"], default="column",
+                             help="applicants per column (default) or per row")
+        command.add_argument("--no-cache", action="store_true", help="re-parse the workbook instead of using the record cache")
+
+    run = commands.add_parser("run", help="fill every record of a workbook")
+    add_workbook_arguments(run)
+    run.add_argument("--sessions", type=int, default=2, help="browser sessions (or CDP tabs) in parallel")
+    run.add_argument("--global-limit", type=int, help="process-wide cap on running browsers")
+    run.add_argument("--backend", choices=["selenium", "cdp"], default=None,
+                     help="automation backend (default: $DATA_FILL_BACKEND or selenium)")
+    run.add_argument("--url", help="page to open (the target site, or a local copy for the CDP backend)")
+    run.add_argument("--profile", help="launch profile name (interactive, lean)")
+    run.add_argument("--no-otp", action="store_true", help="the flow has no OTP step; fill as soon as the page is ready")
+    run.add_argument("--dry-run", action="store_true",
+                     help="fill the forms, then close them unsubmitted without journaling them as filled")
+    run.add_argument("--typed-fields", metavar="FIELD,...",
+                     help="fields to type with keystrokes instead of setting by script (Selenium backend)")
+    run.add_argument("--limit", type=int, help="only fill the first N records")
+    run.add_argument("--no-journal", action="store_true", help="do not read or write the progress journal")
+    run.add_argument("--restart", action="store_true", help="forget journaled progress for these records first")
+    run.add_argument("--trace", help="write timing spans to this .jsonl file")
+    run.set_defaults(handler=run_command)
+
+    validate = commands.add_parser("validate", help="check records against the form schema without a browser")
+    add_workbook_arguments(validate)
+    validate.add_argument("--show", type=int, default=20, help="rejected records to list")
+    validate.set_defaults(handler=validate_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "backend", "selenium") is None:
+        from AsyncBrowserAutomation import backend_from_env
+        args.backend = backend_from_env()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,49 +1,150 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchElementException, NoSuchWindowException, TimeoutException
+)
 import threading
+import time
+from DriverLocator import DriverLocator
+from FlowConfig import DEFAULT_TIMEOUTS, FORM_PAGE_SELECTOR
+from FormPlan import FormPlanCache, iso_date
+from FormScripts import (
+    ACCEPT_COOKIES_SCRIPT, FILL_FORM_SCRIPT, FILL_PLANNED_SCRIPT, FORM_GONE_SCRIPT, FORM_READY_SCRIPT
+)
+from Instrumentation import Tracer, traced
+from LaunchProfiles import get_profile
+from RecordValidator import REQUIRED_FIELDS
 
 class BrowserAutomation:
-    def __init__(self):
+    def __init__(self, timeouts=None, pool=None, progress_callback=None, tracer=None, form_plans=None,
+                 journal=None, target_url=None, typed_fields=()):
         self.driver = None
+        # Optional DriverPool to lease warm sessions from instead of launching Chrome
+        self.pool = pool
         self.main_window = None
         self.booking_window = None
-        # Update this to the actual VFS legalization page
-        self.target_url = ""
+        # Update this to the actual VFS legalization page (or pass target_url)
+        self.target_url = target_url or ""
         self.booking_url = ""
         self.automation_paused = False
+        # Set by the form-page monitor (or manual override) to resume after OTP
+        self.form_detected = threading.Event()
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        # Per-field status of the last insert_data call ("ok", "missing", ...)
+        self.fill_results = {}
+        # progress_callback(stage, message) is called from the automation thread
+        self.progress_callback = progress_callback
+        self.cancel_event = threading.Event()
+        # Timing spans for every stage (no-op unless sinks or $DATA_FILL_TRACE are set)
+        self.tracer = tracer or Tracer.from_env()
+        # Cached per-layout fill plans; pass form_plans=False to detect widgets on every fill
+        self.form_plans = FormPlanCache.default() if form_plans is None else form_plans
+        # Optional ProgressJournal recording each record's state for resumable batches
+        self.journal = journal
+        # Fields typed with real keystrokes instead of set by script, for pages
+        # that only react to typing
+        self.typed_fields = tuple(typed_fields)
+
+    def report_progress(self, stage, message):
+        """Forward a stage update to progress_callback, if any"""
+        if self.progress_callback is not None:
+            try:
+                self.progress_callback(stage, message)
+            except Exception as e:
+                print(f"⚠️  Progress callback failed: {e}")
+
+    def cancel(self):
+        """Ask a running flow to stop at the next stage boundary"""
+        self.cancel_event.set()
+        # Wake up a flow blocked waiting for OTP
+        self.form_detected.set()
 
+    def journal_state(self, data, state):
+        """Record data's progress in the journal, if any"""
+        if self.journal is not None:
+            self.journal.mark(data, state)
+
+    def _stop_if_cancelled(self):
+        """Close the browser and return True when cancel() has been called"""
+        if not self.cancel_event.is_set():
+            return False
+        print("⏹️ Automation cancelled")
+        self.report_progress("cancelled", "Automation cancelled")
+        self.close_browser()
+        return True
+
+    @staticmethod
+    def create_driver(profile="interactive"):
+        """Launch a Chrome session with the named LaunchProfile (headed "interactive" for OTP, or "lean")"""
+        profile = get_profile(profile)
+        # Resolved locally and cached on disk; never downloads a driver
+        locator = DriverLocator.default()
+        service = Service(locator.chromedriver())
+        locator.check_versions()
+        profile_dir = profile.claim_slot()
+        options = profile.selenium_options(profile_dir)
+        if locator.chrome():
+            options.binary_location = locator.chrome()
+        try:
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            profile.release_slot(profile_dir)
+            raise
+        if profile_dir is not None:
+            # Free the persistent profile slot once this session is gone
+            quit_driver = driver.quit
+
+            def quit_and_release():
+                try:
+                    quit_driver()
+                finally:
+                    profile.release_slot(profile_dir)
+            driver.quit = quit_and_release
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Kept on the driver so tabs opened later (the booking tab) get it too
+        driver.launch_profile = profile
+        profile.apply_to_driver(driver)
+        return driver
+
+    def apply_launch_profile(self):
+        """Apply the driver's launch profile (URL blocking) to the current tab"""
+        profile = getattr(self.driver, "launch_profile", None)
+        if profile is None:
+            return
+        try:
+            profile.apply_to_driver(self.driver)
+        except Exception as e:
+            print(f"⚠️ Could not apply launch profile to this tab: {e}")
+
+    @traced("setup_browser")
     def setup_browser(self):
-        chromedriver_path = 'C:/Program Files/Google/chromedriver-win64/chromedriver.exe'
-        service = Service(chromedriver_path)
-        options = Options()
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        # Don't use headless mode - user needs to interact with OTP
         try:
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            print("✅ Chrome browser initialized successfully!")
+            if self.pool is not None:
+                self.driver = self.pool.lease()
+                print("✅ Chrome session leased from pool!")
+            else:
+                self.driver = self.create_driver()
+                print("✅ Chrome browser initialized successfully!")
             return True
         except Exception as e:
             print(f"❌ Error initializing browser: {e}")
             return False
 
     
+    @traced("cookie_handling")
     def handle_cookies_and_popups(self):
         """Handle OneTrust cookie banner - click 'Accept All Cookies'."""
         try:
             print("🍪 Waiting for cookie banner...")
 
-            # Wait up to 10 seconds for the accept button to be present and clickable
-            accept_button = WebDriverWait(self.driver, 10).until(
+            # Wait for the accept button to be present and clickable
+            accept_button = WebDriverWait(self.driver, self.timeouts["cookie_banner"]).until(
                 EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
             )
 
@@ -55,6 +156,7 @@ class BrowserAutomation:
             print(f"ℹ️ No cookie banner found or already dismissed: {e}")
             return True
 
+    @traced("open_page")
     def open_legalization_page(self):
         """Open the main legalization page"""
         if not self.driver:
@@ -66,9 +168,7 @@ class BrowserAutomation:
             self.main_window = self.driver.current_window_handle
             
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            self.wait_for_document_ready()
             
             # Handle cookies immediately after page load
             self.handle_cookies_and_popups()
@@ -79,6 +179,7 @@ class BrowserAutomation:
             print(f"❌ Error opening legalization page: {e}")
             return False
 
+    @traced("book_now")
     def click_book_now(self):
         """Click the 'Book now' button"""
         try:
@@ -88,7 +189,7 @@ class BrowserAutomation:
             self.handle_cookies_and_popups()
             
             # Wait for and click the "Book now" button
-            book_now_button = WebDriverWait(self.driver, 15).until(
+            book_now_button = WebDriverWait(self.driver, self.timeouts["book_now"]).until(
                 EC.element_to_be_clickable((By.CLASS_NAME, "lets-get-started"))
             )
             
@@ -96,24 +197,24 @@ class BrowserAutomation:
             
             # Scroll to button to ensure it's visible
             self.driver.execute_script("arguments[0].scrollIntoView(true);", book_now_button)
-            time.sleep(1)
+            known_windows = self.driver.window_handles
             
             # Click using JavaScript to avoid interception
             self.driver.execute_script("arguments[0].click();", book_now_button)
             
-            # Handle the new tab that opens
-            time.sleep(3)  # Wait for new tab to open
-            
-            # Switch to the new booking tab
-            all_windows = self.driver.window_handles
-            for window in all_windows:
-                if window != self.main_window:
-                    self.booking_window = window
-                    self.driver.switch_to.window(window)
-                    break
+            # Switch to the new booking tab as soon as it opens
+            new_window = self.wait_for_new_window(known_windows)
+            if new_window:
+                self.booking_window = new_window
+                self.driver.switch_to.window(new_window)
+                # URL blocking is per tab; turn it on for the booking tab as well
+                self.apply_launch_profile()
+            else:
+                # Booking page opened in the same tab
+                self.booking_window = self.driver.current_window_handle
             
             # Handle cookies on the new page too
-            time.sleep(2)
+            self.wait_for_document_ready()
             self.handle_cookies_and_popups()
             
             print("✅ Switched to booking page tab")
@@ -123,6 +224,7 @@ class BrowserAutomation:
             print(f"❌ Error clicking 'Book now' button: {e}")
             return False
 
+    @traced("otp_wait")
     def wait_for_otp_completion(self):
         """Wait for user to complete email/OTP verification"""
         print("\n" + "="*60)
@@ -137,63 +239,91 @@ class BrowserAutomation:
         print("="*60)
         
         # Monitor for form page in a separate thread
+        self.form_detected.clear()
         self.automation_paused = True
         monitor_thread = threading.Thread(target=self._monitor_for_form_page)
         monitor_thread.daemon = True
         monitor_thread.start()
         
-        # Wait for user input or automatic detection
-        while self.automation_paused:
-            time.sleep(2)
-            # Check if user wants to manually signal completion
-            try:
-                # Non-blocking input check (you might want to implement this differently)
-                pass
-            except:
-                pass
+        # Block until the monitor (or manual override) signals the form page
+        self.form_detected.wait()
+        if self.cancel_event.is_set():
+            return False
         
         print("✅ Form page detected! Resuming automation...")
         return True
 
     def _monitor_for_form_page(self):
         """Monitor for form page appearance (runs in background thread)"""
-        while self.automation_paused:
+        # The manual override sets form_detected too, which stops the watch
+        if self.watch_for_form_page(stop_event=self.form_detected):
+            self.automation_paused = False
+            self.form_detected.set()
+
+    def watch_for_form_page(self, stop_event=None):
+        """Block until the form page appears (True), or the tab closes / stop_event is set (False)"""
+        # Each cycle is a MutationObserver wait in the page; a navigation starts a new cycle
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
             try:
-                # Handle cookies on any new pages
-                self.handle_cookies_and_popups()
-                
-                # Check for form indicators - update these selectors based on your form page
-                form_indicators = [
-                    (By.NAME, "surname"),  # From your original code
-                    (By.NAME, "user_type"),  # From your original code
-                    (By.TAG_NAME, "form"),
-                    (By.CSS_SELECTOR, "input[type='text']"),
-                ]
-                
-                for by_method, selector in form_indicators:
-                    try:
-                        element = self.driver.find_element(by_method, selector)
-                        if element and element.is_displayed():
-                            print(f"✅ Form detected using selector: {selector}")
-                            self.automation_paused = False
-                            return
-                    except:
-                        continue
-                        
-                time.sleep(3)  # Check every 3 seconds
-                
-            except Exception as e:
-                # Browser might be closed or page changed
-                time.sleep(5)
-                continue
+                # Dismiss cookie banners on any new pages
+                self.driver.execute_script(ACCEPT_COOKIES_SCRIPT)
+
+                # Resolves as soon as the page mutates into the form page
+                if self.wait_for_form_ready(FORM_PAGE_SELECTOR, timeout=self.timeouts["otp_check"]):
+                    print(f"✅ Form detected using selector: {FORM_PAGE_SELECTOR}")
+                    return True
+
+            except (NoSuchWindowException, InvalidSessionIdException):
+                # The operator closed the window, or the browser is gone
+                return False
+            except Exception:
+                # Navigation interrupted the observer - wait for the next document
+                try:
+                    self.wait_for_document_ready()
+                except (NoSuchWindowException, InvalidSessionIdException):
+                    return False
+                except Exception:
+                    # Browser might be closed; back off before retrying
+                    stop_event.wait(5)
+        return False
+
+    def form_submitted(self):
+        """True if the filled form has left the page (submitted); False if it is still there or the tab is gone"""
+        try:
+            return not self.driver.find_elements(By.CSS_SELECTOR, FORM_PAGE_SELECTOR)
+        except Exception:
+            return False
+
+    def watch_for_submission(self, stop_event=None):
+        """Block until the filled form leaves the page (True), or the tab closes / stop_event is set (False)"""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                if self.wait_for_form_gone(FORM_PAGE_SELECTOR, timeout=self.timeouts["otp_check"]):
+                    return True
+            except (NoSuchWindowException, InvalidSessionIdException):
+                return False
+            except Exception:
+                # Navigation interrupted the observer - submitted if the new page has no form
+                try:
+                    self.wait_for_document_ready()
+                    if not self.driver.find_elements(By.CSS_SELECTOR, FORM_PAGE_SELECTOR):
+                        return True
+                except (NoSuchWindowException, InvalidSessionIdException):
+                    return False
+                except Exception:
+                    stop_event.wait(5)
+        return False
 
+    @traced("first_form")
     def handle_first_form(self):
         """Handle the first form: select 'i am an agency' and '1' applicant"""
         try:
             print("🔍 Looking for first form...")
             
             # Wait for the first form to be present
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(self.driver, self.timeouts["element"]).until(
                 EC.presence_of_element_located((By.NAME, "user_type"))
             )
             
@@ -212,58 +342,65 @@ class BrowserAutomation:
             proceed_button.click()
             print("✅ Clicked proceed button")
             
-            # Wait for the second form to appear
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "surname"))
-            )
+            # Wait for the second form to be rendered, not just present in the DOM
+            if not self.wait_for_form_ready("[name='surname']"):
+                raise TimeoutException("main form did not become visible")
             print("✅ Main form appeared successfully!")
-            time.sleep(1)  # Small delay for form to fully load
             return True
             
         except Exception as e:
             print(f"❌ Error handling first form: {e}")
             return False
 
-    def insert_data(self, data):
-        """Fill the main form with data from Excel"""
+    @traced("insert_data")
+    def insert_data(self, data, typed_fields=None):
+        """Fill the main form in one script call using the cached FormPlan; typed_fields are typed instead"""
+        if typed_fields is None:
+            typed_fields = self.typed_fields
         try:
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(self.driver, self.timeouts["element"]).until(
                 EC.presence_of_element_located((By.TAG_NAME, "form"))
             )
             
             print("🔄 Filling form with data...")
+            values = {
+                field_name: value for field_name, value in data.items()
+                if not (value == '' or value == [])
+            }
+            script_values = {
+                field_name: str(value) for field_name, value in values.items()
+                if field_name not in typed_fields
+            }
+
+            plan = self._form_plan()
+            results = {}
+            if script_values:
+                if plan is not None:
+                    rows, statuses = plan.prepare(script_values)
+                    results.update(statuses)
+                    filled = self.driver.execute_script(FILL_PLANNED_SCRIPT, rows)
+                else:
+                    filled = self.driver.execute_script(FILL_FORM_SCRIPT, script_values)
+                results.update(filled["results"])
+                for field_name, duration_ms in filled["timings"].items():
+                    self.tracer.record(f"field:{field_name}", duration_ms, mode="script",
+                                       ok=filled["results"][field_name] == "ok")
+            for field_name in typed_fields:
+                if field_name in values:
+                    started = time.perf_counter()
+                    field = plan.fields.get(field_name) if plan is not None else None
+                    results[field_name] = self._type_field(field_name, values[field_name], field)
+                    self.tracer.record(f"field:{field_name}", (time.perf_counter() - started) * 1000,
+                                       mode="typed", ok=results[field_name] == "ok")
+
             filled_count = 0
-            
-            for field_name, value in data.items():
-                if value == '' or value == []:
-                    continue
-                    
-                try:
-                    if field_name in ['sex', 'marital']:
-                        select_element = Select(self.driver.find_element(By.NAME, field_name))
-                        select_element.select_by_value(value)
-                        print(f"✅ Filled dropdown {field_name}: {value}")
-                    elif field_name in ['dob', 'P_exp']:
-                        date = ((value.split(" "))[0]).split('-')
-                        act_date = ""
-                        for i in reversed(date):
-                            act_date = act_date + i + "/"
-                        act_date = act_date.strip("/")
-                        input_element = self.driver.find_element(By.NAME, field_name)
-                        input_element.send_keys(act_date)
-                        print(f"✅ Filled date {field_name}: {act_date}")
-                    else:
-                        input_element = self.driver.find_element(By.NAME, field_name)
-                        input_element.clear()
-                        input_element.send_keys(value)
-                        print(f"✅ Filled text {field_name}: {value}")
-                    
+            for field_name, status in results.items():
+                if status == "ok":
                     filled_count += 1
-                    time.sleep(0.5)  # Small delay between fields
-                    
-                except Exception as field_error:
-                    print(f"⚠️  Could not fill {field_name}: {field_error}")
-                    continue
+                    print(f"✅ Filled {field_name}: {values[field_name]}")
+                else:
+                    print(f"⚠️  Could not fill {field_name}: {status}")
+            self.fill_results = results
             
             print(f"✅ Successfully filled {filled_count} fields!")
             print("📝 Form filling completed (form NOT submitted automatically)")
@@ -273,6 +410,52 @@ class BrowserAutomation:
             print(f"❌ Error filling the form: {e}")
             return False
 
+    def required_fields_filled(self):
+        """True when the last insert_data filled every required field ("ok")"""
+        return all(self.fill_results.get(name) == "ok" for name in REQUIRED_FIELDS)
+
+    def _form_plan(self):
+        """The cached FormPlan for the current page, or None to fall back to in-page detection"""
+        if not self.form_plans:
+            return None
+        try:
+            return self.form_plans.plan_for(self.driver)
+        except Exception as e:
+            print(f"⚠️  Could not build a form plan, detecting fields in the page: {e}")
+            return None
+
+    def _type_field(self, field_name, value, field=None):
+        """Fill one field with real keystrokes; returns "ok" or the error text"""
+        try:
+            # Wait until the field can actually take input
+            element = WebDriverWait(self.driver, self.timeouts["element"]).until(
+                EC.element_to_be_clickable((By.NAME, field_name))
+            )
+            if field is not None:
+                widget = field.widget
+            elif field_name in ['sex', 'marital']:
+                widget = "select"
+            elif field_name in ['dob', 'P_exp']:
+                widget = "date"
+            else:
+                widget = "text"
+
+            if widget == "select":
+                option_value = field.resolve(value) if field is not None else value
+                if option_value is None:
+                    return "no-option"
+                Select(element).select_by_value(option_value)
+            elif widget == "date":
+                # Date inputs take keystrokes in the browser's dd/mm/yyyy order
+                year, month, day = iso_date(value).split("-")
+                element.send_keys(f"{day}/{month}/{year}")
+            else:
+                element.clear()
+                element.send_keys(value)
+            return "ok"
+        except Exception as field_error:
+            return str(field_error)
+
     def smart_retry_mechanism(self, max_retries=5):
         """Handle page reloads and server busy situations"""
         for attempt in range(max_retries):
@@ -283,52 +466,139 @@ class BrowserAutomation:
             except:
                 print(f"🔄 Attempt {attempt + 1}: Page not responsive, refreshing...")
                 self.driver.refresh()
-                time.sleep(3)
+                self.wait_for_document_ready()
         
         print("❌ Page still not responsive after retries")
         return False
 
+    def wait_for_document_ready(self, timeout=None):
+        """Wait until document.readyState is 'complete'; returns False on timeout"""
+        timeout = timeout or self.timeouts["page_load"]
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except TimeoutException:
+            print(f"⚠️  Page still loading after {timeout}s")
+            return False
+
+    def wait_for_new_window(self, known_windows, timeout=None):
+        """Wait for a window handle not in known_windows; returns it, or None on timeout"""
+        timeout = timeout or self.timeouts["new_window"]
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.new_window_is_opened(known_windows))
+        except TimeoutException:
+            return None
+        for window in self.driver.window_handles:
+            if window not in known_windows:
+                return window
+        return None
+
+    def wait_for_form_ready(self, selector, timeout=None):
+        """Wait, via a MutationObserver in the page, until selector is rendered and enabled"""
+        timeout = timeout or self.timeouts["form_ready"]
+        # Leave the driver a little headroom so the script's own timeout fires first
+        self.driver.set_script_timeout(timeout + 5)
+        return bool(self.driver.execute_async_script(FORM_READY_SCRIPT, selector, int(timeout * 1000)))
+
+    def wait_for_form_gone(self, selector, timeout=None):
+        """Wait, via a MutationObserver in the page, until nothing matches selector"""
+        timeout = timeout or self.timeouts["form_ready"]
+        self.driver.set_script_timeout(timeout + 5)
+        return bool(self.driver.execute_async_script(FORM_GONE_SCRIPT, selector, int(timeout * 1000)))
+
     def close_browser(self):
-        """Close the browser when done"""
+        """Close the browser when done, or hand a pooled session back"""
         if self.driver:
-            self.driver.quit()
-            print("🔒 Browser closed.")
+            if self.pool is not None:
+                self.pool.release(self.driver)
+                print("♻️ Browser session returned to pool.")
+            else:
+                self.driver.quit()
+                print("🔒 Browser closed.")
+            self.driver = None
+            self.main_window = None
+            self.booking_window = None
 
-    def execute_full_flow(self, data):
-        """Execute the complete visa automation flow"""
+    @traced("full_flow")
+    def execute_full_flow(self, data, review_hook=None):
+        """Execute the complete visa automation flow; returns whether the form was filled"""
         print("🚀 Starting Visa Automation Flow...")
         print("=" * 50)
         
+        # Steps 1-3: Setup browser, open the page and click "Book now"
+        if not self.start_booking():
+            if not self.cancel_event.is_set():
+                self.journal_state(data, "failed")
+            return False
+        
+        # Step 4: Wait for human to complete OTP
+        self.journal_state(data, "needs-OTP")
+        self.report_progress("otp", "Waiting for email/OTP verification in the browser")
+        if not self.wait_for_otp_completion():
+            if not self._stop_if_cancelled():
+                self.close_browser()
+            return False
+        
+        # Steps 5-7: Fill the form and keep it open for review
+        return self.complete_form(data, review_hook)
+
+    def start_booking(self):
+        """Steps 1-3: set up the browser, open the page and click 'Book now'"""
         # Step 1: Setup browser
-        if not self.setup_browser():
+        self.report_progress("setup", "Starting browser")
+        if self.cancel_event.is_set() or not self.setup_browser():
+            self._stop_if_cancelled()
             return False
         
         # Step 2: Open legalization page
+        self.report_progress("open_page", "Opening legalization page")
+        if self._stop_if_cancelled():
+            return False
         if not self.open_legalization_page():
             self.close_browser()
             return False
         
         # Step 3: Click "Book now" button
-        if not self.click_book_now():
-            self.close_browser()
+        self.report_progress("book_now", "Opening the booking page")
+        if self._stop_if_cancelled():
             return False
-        
-        # Step 4: Wait for human to complete OTP
-        if not self.wait_for_otp_completion():
+        if not self.click_book_now():
             self.close_browser()
             return False
-        
+        return True
+
+    def fill_form(self, data):
+        """Steps 5-6: answer the first form and fill the main form; the session stays open"""
         # Step 5: Handle first form (if it appears)
+        self.report_progress("first_form", "Selecting applicant type")
+        if self._stop_if_cancelled():
+            return False
+        self.journal_state(data, "filling")
+        filled = False
         try:
             if self.handle_first_form():
                 # Step 6: Fill main form
-                self.insert_data(data)
+                self.report_progress("fill", "Filling the application form")
+                filled = self.insert_data(data)
             else:
                 # Maybe we're already at the main form
                 print("ℹ️  No first form found, attempting to fill main form directly...")
-                self.insert_data(data)
+                self.report_progress("fill", "Filling the application form")
+                filled = self.insert_data(data)
         except Exception as e:
             print(f"⚠️  Form handling error: {e}")
+        # insert_data succeeds even when the page had none of the fields
+        filled = filled and self.required_fields_filled()
+        self.journal_state(data, "in-review" if filled else "failed")
+        return filled
+
+    def complete_form(self, data, review_hook=None):
+        """Steps 5-7: fill the form once past OTP, wait for review, then close"""
+        filled = self.fill_form(data)
+        if self.driver is None:
+            return False
         
         # Step 7: Keep browser open for final review
         print("\n" + "="*60)
@@ -337,11 +607,21 @@ class BrowserAutomation:
         print("📝 The form has NOT been automatically submitted")
         print("▶️  Submit manually when ready")
         print("="*60)
-        print("Press Enter when you want to close the browser...")
-        input()
-        
+        self.report_progress("review", "Review the filled form and submit it manually")
+        if review_hook is None:
+            print("Submit the form, then press Enter to close the browser...")
+            input()
+        else:
+            review_hook(self)
+
+        # Only a submitted form counts as filled; otherwise the record stays "in-review"
+        if filled and not self.cancel_event.is_set():
+            if self.form_submitted():
+                self.journal_state(data, "filled")
+            else:
+                print("⚠️ The form was not submitted; the record stays in review")
         self.close_browser()
-        return True
+        return filled
 
     def manual_continue_option(self):
         """Provide manual override for OTP completion"""
@@ -353,6 +633,7 @@ class BrowserAutomation:
             user_input = input().strip().lower()
             if user_input == 'c':
                 self.automation_paused = False
+                self.form_detected.set()
                 break
             elif user_input == 'q':
                 print("❌ Automation cancelled by user")
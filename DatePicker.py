@@ -0,0 +1,244 @@
+import calendar
+from datetime import datetime
+
+import customtkinter as ctk
+
+DATE_FORMAT = "%Y-%m-%d"
+WEEKS = 6  # the most weeks any month spans, so the grid never changes shape
+
+
+class DatePicker:
+    """Calendar popup shared by every date field, built once and reused
+
+    The Toplevel and its 6 x 7 grid of day buttons are created on the first
+    open. After that, changing month or year only reconfigures the cells whose
+    day number or highlight changed, and Cancel/OK withdraw the window instead
+    of destroying it. open(entry) points the same popup at any date entry
+    (dob, P_exp) and OK writes the chosen date back into it.
+    """
+
+    def __init__(self, root, colors, width=380, height=480):
+        self.root = root
+        self.colors = colors
+        self.width = width
+        self.height = height
+        self.window = None
+        self.target_entry = None
+        self.current_year = None
+        self.current_month = None
+        self.selected_day = None
+        self.day_buttons = []  # [week * 7 + weekday] -> CTkButton
+        self._cell_looks = []  # [cell] -> (day, selected) last applied, to skip no-op configures
+
+    def open(self, target_entry):
+        """Show the picker on the date in target_entry (today if it has none)"""
+        try:
+            current_date = datetime.strptime(target_entry.get(), DATE_FORMAT)
+        except ValueError:
+            current_date = datetime.now()
+        self.target_entry = target_entry
+        self.current_year = current_date.year
+        self.current_month = current_date.month
+        self.selected_day = current_date.day
+
+        if self.window is None:
+            self.create_window()
+        else:
+            self.window.deiconify()
+
+        # Center the window over the main window
+        x = (self.root.winfo_x() + (self.root.winfo_width() // 2)) - (self.width // 2)
+        y = (self.root.winfo_y() + (self.root.winfo_height() // 2)) - (self.height // 2)
+        self.window.geometry(f"{self.width}x{self.height}+{x}+{y}")
+        self.window.lift()
+        self.update_calendar()
+        self.window.after(100, self.grab_focus)
+
+    def create_window(self):
+        self.window = ctk.CTkToplevel(self.root)
+        self.window.title("Select Date")
+        self.window.resizable(False, False)
+        self.window.transient(self.root)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Header frame with year and month navigation
+        header_frame = ctk.CTkFrame(self.window, fg_color=self.colors['primary'], height=90)
+        header_frame.pack(fill="x", padx=15, pady=15)
+        header_frame.pack_propagate(False)
+
+        year_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
+        year_frame.pack(fill="x", pady=(8, 0))
+        ctk.CTkButton(
+            year_frame, text="<<", width=40, height=28,
+            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
+            font=ctk.CTkFont(family="Arial", size=11),
+            command=self.prev_year
+        ).pack(side="left", padx=(15, 8))
+        self.year_label = ctk.CTkLabel(
+            year_frame, text="",
+            font=ctk.CTkFont(family="Arial", size=16, weight="bold"),
+            text_color="white"
+        )
+        self.year_label.pack(side="left", expand=True)
+        ctk.CTkButton(
+            year_frame, text=">>", width=40, height=28,
+            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
+            font=ctk.CTkFont(family="Arial", size=11),
+            command=self.next_year
+        ).pack(side="right", padx=(8, 15))
+
+        month_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
+        month_frame.pack(fill="x", pady=(8, 8))
+        ctk.CTkButton(
+            month_frame, text="◀", width=40, height=32,
+            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
+            font=ctk.CTkFont(family="Arial", size=12),
+            command=self.prev_month
+        ).pack(side="left", padx=(15, 8))
+        self.month_label = ctk.CTkLabel(
+            month_frame, text="",
+            font=ctk.CTkFont(family="Arial", size=18, weight="bold"),
+            text_color="white"
+        )
+        self.month_label.pack(side="left", expand=True)
+        ctk.CTkButton(
+            month_frame, text="▶", width=40, height=32,
+            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
+            font=ctk.CTkFont(family="Arial", size=12),
+            command=self.next_month
+        ).pack(side="right", padx=(8, 15))
+
+        # Calendar grid: weekday headers plus a fixed pool of day buttons
+        calendar_frame = ctk.CTkFrame(self.window, fg_color=self.colors['surface_variant'])
+        calendar_frame.pack(fill="both", expand=True, padx=15, pady=8)
+        for i in range(7):
+            calendar_frame.grid_columnconfigure(i, weight=1, uniform="col")
+        for i in range(WEEKS + 1):
+            calendar_frame.grid_rowconfigure(i, weight=1)
+
+        for i, day in enumerate(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']):
+            ctk.CTkLabel(
+                calendar_frame, text=day,
+                font=ctk.CTkFont(family="Arial", size=13, weight="bold"),
+                text_color=self.colors['text_primary'],
+                width=45, height=35
+            ).grid(row=0, column=i, padx=3, pady=3, sticky="nsew")
+
+        day_font = ctk.CTkFont(family="Arial", size=13)
+        for cell in range(WEEKS * 7):
+            button = ctk.CTkButton(
+                calendar_frame, text="", width=45, height=40, font=day_font,
+                fg_color="transparent", hover_color=self.colors['accent'],
+                text_color="white", state="disabled",
+                command=lambda cell=cell: self.select_day(self._cell_looks[cell][0])
+            )
+            button.grid(row=cell // 7 + 1, column=cell % 7, padx=3, pady=3, sticky="nsew")
+            self.day_buttons.append(button)
+            self._cell_looks.append((0, False))
+
+        # Action buttons
+        action_frame = ctk.CTkFrame(self.window, fg_color="transparent", height=60)
+        action_frame.pack(fill="x", padx=15, pady=15)
+        action_frame.pack_propagate(False)
+        ctk.CTkButton(
+            action_frame, text="Cancel", width=90, height=35,
+            fg_color=self.colors['surface_variant'], hover_color=self.colors['surface'],
+            font=ctk.CTkFont(family="Arial", size=12),
+            command=self.close
+        ).pack(side="left", padx=8)
+        ctk.CTkButton(
+            action_frame, text="Today", width=90, height=35,
+            fg_color=self.colors['accent'], hover_color=self.colors['primary'],
+            font=ctk.CTkFont(family="Arial", size=12),
+            command=self.select_today
+        ).pack(side="left", padx=8)
+        ctk.CTkButton(
+            action_frame, text="OK", width=90, height=35,
+            fg_color=self.colors['success'], hover_color='#45a049',
+            font=ctk.CTkFont(family="Arial", size=12),
+            command=self.confirm_date
+        ).pack(side="right", padx=8)
+
+    def update_calendar(self):
+        """Show current_month/current_year, reconfiguring only the cells that changed"""
+        # Keep the selection valid when moving e.g. from the 31st into a shorter month
+        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
+        self.selected_day = min(self.selected_day, days_in_month)
+
+        self.year_label.configure(text=str(self.current_year))
+        self.month_label.configure(text=calendar.month_name[self.current_month])
+
+        days = [day for week in calendar.monthcalendar(self.current_year, self.current_month) for day in week]
+        days += [0] * (WEEKS * 7 - len(days))
+        for cell, day in enumerate(days):
+            looks = (day, day == self.selected_day)
+            if looks == self._cell_looks[cell]:
+                continue
+            self._cell_looks[cell] = looks
+            if day == 0:
+                self.day_buttons[cell].configure(text="", state="disabled", fg_color="transparent")
+            else:
+                self.day_buttons[cell].configure(
+                    text=str(day), state="normal",
+                    fg_color=self.colors['primary'] if looks[1] else self.colors['surface']
+                )
+
+    def grab_focus(self):
+        """Safely grab focus after window is displayed"""
+        try:
+            if self.window.winfo_viewable():
+                self.window.grab_set()
+                self.window.focus_set()
+        except Exception:
+            pass  # Ignore if grab fails
+
+    def close(self):
+        """Hide the picker; it is kept for the next open"""
+        if self.window is not None:
+            try:
+                self.window.grab_release()
+            except Exception:
+                pass
+            self.window.withdraw()
+
+    def prev_month(self):
+        if self.current_month == 1:
+            self.current_month = 12
+            self.current_year -= 1
+        else:
+            self.current_month -= 1
+        self.update_calendar()
+
+    def next_month(self):
+        if self.current_month == 12:
+            self.current_month = 1
+            self.current_year += 1
+        else:
+            self.current_month += 1
+        self.update_calendar()
+
+    def prev_year(self):
+        self.current_year -= 1
+        self.update_calendar()
+
+    def next_year(self):
+        self.current_year += 1
+        self.update_calendar()
+
+    def select_day(self, day):
+        self.selected_day = day
+        self.update_calendar()
+
+    def select_today(self):
+        today = datetime.now()
+        self.current_year = today.year
+        self.current_month = today.month
+        self.selected_day = today.day
+        self.update_calendar()
+
+    def confirm_date(self):
+        """Write the selected date into the target entry and hide the picker"""
+        selected_date = datetime(self.current_year, self.current_month, self.selected_day)
+        self.target_entry.delete(0, "end")
+        self.target_entry.insert(0, selected_date.strftime(DATE_FORMAT))
+        self.close()
@@ -0,0 +1,182 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+
+import AppState
+from AppState import ProcessDefault
+
+# Executable names tried on PATH, most specific first
+CHROMEDRIVER_NAMES = ["chromedriver"]
+CHROME_NAMES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+# Usual install locations when nothing is configured or on PATH
+KNOWN_LOCATIONS = {
+    "win32": {
+        "chromedriver": [
+            "C:/Program Files/Google/chromedriver-win64/chromedriver.exe",
+            "C:/chromedriver/chromedriver.exe",
+        ],
+        "chrome": [
+            "C:/Program Files/Google/Chrome/Application/chrome.exe",
+            "C:/Program Files (x86)/Google/Chrome/Application/chrome.exe",
+        ],
+    },
+    "darwin": {
+        "chromedriver": ["/opt/homebrew/bin/chromedriver", "/usr/local/bin/chromedriver"],
+        "chrome": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+    },
+    "linux": {
+        "chromedriver": ["/usr/bin/chromedriver", "/usr/lib/chromium/chromedriver", "/snap/bin/chromium.chromedriver"],
+        "chrome": ["/usr/bin/google-chrome", "/opt/google/chrome/chrome", "/usr/bin/chromium", "/snap/bin/chromium"],
+    },
+}
+
+ENV_VARS = {"chromedriver": "CHROMEDRIVER_PATH", "chrome": "CHROME_PATH"}
+
+
+class DriverNotFoundError(Exception):
+    """No chromedriver/Chrome binary could be found locally"""
+
+
+class DriverLocator(ProcessDefault):
+    """Find chromedriver and Chrome on this machine without touching the network
+
+    Each binary is resolved from, in order: the config file
+    ({"chromedriver": path, "chrome": path}), $CHROMEDRIVER_PATH /
+    $CHROME_PATH, the path cached by the last run, PATH, then the usual
+    install locations for the platform. The resolved paths and their
+    `--version` output are cached on disk. The version subprocess only runs
+    again when a binary's size or modification time changes, so a launch
+    costs a few stat() calls.
+    """
+
+    def __init__(self, config_path=None, cache_path=None):
+        self.config_path = config_path or AppState.config_path("drivers.json", "DATA_FILL_DRIVER_CONFIG")
+        self.cache_path = cache_path or AppState.cache_path("drivers.json")
+        self._lock = threading.Lock()
+        self.config = self._read_json(self.config_path)
+        self.cache = self._read_json(self.cache_path)
+        self._resolved = {}
+        self._versions_match = None
+
+    def chromedriver(self):
+        """Path to chromedriver; raises DriverNotFoundError if there is none"""
+        path = self.locate("chromedriver")
+        if path is None:
+            raise DriverNotFoundError(
+                f"chromedriver not found. Put it on PATH, set {ENV_VARS['chromedriver']} "
+                f"or add \"chromedriver\" to {self.config_path}"
+            )
+        return path
+
+    def chrome(self):
+        """Path to the Chrome binary, or None to let chromedriver pick its default"""
+        return self.locate("chrome")
+
+    def locate(self, binary):
+        """Resolve 'chromedriver' or 'chrome' to an executable path (None if not found)"""
+        with self._lock:
+            if binary not in self._resolved:
+                self._resolved[binary] = self._resolve(binary)
+            return self._resolved[binary]
+
+    def version(self, binary):
+        """'major.minor.build.patch' of a located binary, from the on-disk cache when unchanged"""
+        path = self.locate(binary)
+        if path is None:
+            return None
+        with self._lock:
+            entry = self.cache.get(binary, {})
+            stamp = self._stamp(path)
+            if entry.get("path") == path and entry.get("stamp") == stamp and "version" in entry:
+                return entry["version"]
+            version = self._read_version(path)
+            self.cache[binary] = {"path": path, "stamp": stamp, "version": version}
+            self._save_cache()
+            return version
+
+    def check_versions(self):
+        """Warn (once per locator) when chromedriver and Chrome have different major versions"""
+        if self._versions_match is None:
+            driver_version = self.version("chromedriver")
+            chrome_version = self.version("chrome")
+            self._versions_match = not (
+                driver_version and chrome_version
+                and driver_version.split(".")[0] != chrome_version.split(".")[0]
+            )
+            if not self._versions_match:
+                print(f"⚠️ chromedriver {driver_version} does not match Chrome {chrome_version}")
+        return self._versions_match
+
+    def _resolve(self, binary):
+        cached = self.cache.get(binary, {})
+        for candidate in self._candidates(binary, cached):
+            if candidate and os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                path = os.path.abspath(candidate)
+                if cached.get("path") != path:
+                    self.cache[binary] = {"path": path, "stamp": self._stamp(path)}
+                    self._save_cache()
+                return path
+        return None
+
+    def _candidates(self, binary, cached):
+        """Paths to try, in order; generated lazily so a cache hit never searches PATH"""
+        # An explicit setting still wins over the cache; reading it costs no filesystem lookup
+        yield self.config.get(binary)
+        yield os.environ.get(ENV_VARS[binary])
+        if cached.get("path") and cached.get("stamp") == self._stamp(cached["path"]):
+            yield cached["path"]
+        names = CHROMEDRIVER_NAMES if binary == "chromedriver" else CHROME_NAMES
+        for name in names:
+            yield shutil.which(name)
+        yield from KNOWN_LOCATIONS.get(_platform(), {}).get(binary, [])
+
+    @staticmethod
+    def _stamp(path):
+        """Cheap change detector for a binary: [size, mtime]"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_size, int(stat.st_mtime)]
+
+    @staticmethod
+    def _read_version(path):
+        try:
+            output = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = re.search(r"\d+(?:\.\d+){1,3}", output)
+        return match.group(0) if match else None
+
+    @staticmethod
+    def _read_json(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self.cache, f, indent=2)
+            os.replace(self.cache_path + ".tmp", self.cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not save driver cache: {e}")
+
+
+def _platform():
+    if sys.platform.startswith("win"):
+        return "win32"
+    if sys.platform == "darwin":
+        return "darwin"
+    return "linux"
@@ -0,0 +1,121 @@
+import queue
+import threading
+import time
+
+
+class DriverPool:
+    """Pool of long-lived WebDriver sessions leased out one applicant at a time
+
+    Sessions are created lazily by factory() up to max_size, health-checked on
+    lease and reset to a single blank tab on release, so Chrome's cold start is
+    paid once per session instead of once per form.
+    """
+
+    def __init__(self, factory, max_size=1, reset_cookies=False):
+        self.factory = factory
+        self.max_size = max_size
+        # Keep cookies by default so site sessions stay warm between applicants
+        self.reset_cookies = reset_cookies
+        # LIFO so the most recently used (warmest) session is handed out first
+        self._idle = []
+        # Guards _idle/_created/_closed; notified whenever a session is released
+        # or discarded, so a lease waiting at capacity can take or create one
+        self._condition = threading.Condition()
+        self._created = 0
+        self._closed = False
+
+    def lease(self, timeout=None):
+        """Return a healthy driver, creating one if the pool has room
+
+        Blocks until a session is released or discarded when all max_size
+        sessions are in use; raises queue.Empty if timeout expires first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            driver = self._take_or_create(deadline)
+            if self.is_healthy(driver):
+                return driver
+            print("♻️ Discarding unresponsive browser session")
+            self._discard(driver)
+
+    def release(self, driver):
+        """Return a leased driver to the pool after resetting its tabs"""
+        if driver is None:
+            return
+        if self._closed or not self._reset(driver):
+            self._discard(driver)
+            return
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def close(self):
+        """Quit every idle session; leased sessions are quit when released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    @property
+    def size(self):
+        """Number of live sessions (idle + leased)"""
+        return self._created
+
+    @staticmethod
+    def is_healthy(driver):
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _take_or_create(self, deadline):
+        """An idle session, or a new one once there is room; waits until deadline"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.max_size:
+                    self._created += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._condition.wait(remaining)
+        try:
+            print("🚀 Starting new pooled browser session...")
+            return self.factory()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def _reset(self, driver):
+        """Close extra tabs and park the session on about:blank"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            if self.reset_cookies:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not reset browser session: {e}")
+            return False
+
+    def _discard(self, driver):
+        with self._condition:
+            self._created -= 1
+            # Frees a slot: a lease waiting at capacity can now create a session
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
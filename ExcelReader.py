@@ -1,8 +1,27 @@
-import pandas as pd
+import csv
+import os
+
+from FieldTransforms import DEFAULT_PIPELINE
+from FormBinding import ObservableRecord
+from RecordStore import RecordStore
+from LazyImports import lazy_import
+
+# Imported on first use so the GUI can open before pandas has loaded
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Formats stream_records() reads without pandas; anything else (.xls) goes through read_excel
+STREAMED_EXTENSIONS = (".xlsx", ".xlsm", ".csv")
+# stream_records() default: the reader's own sheet_name (None already means "every sheet")
+_READER_SHEET = object()
 
 class ExcelReader:
-    def __init__(self):
-        self.raw_data = {
+    # Bump whenever record extraction changes so stale cache entries are ignored
+    CACHE_VERSION = 3
+
+    def __init__(self, orientation="column", cache=None, pipeline=DEFAULT_PIPELINE, sheet_name=0):
+        # Observable so the GUI form only redraws the fields that change
+        self.raw_data = ObservableRecord({
             "surname": "",
             "other_name": "",
             "dob": "",
@@ -21,29 +40,186 @@ class ExcelReader:
             "d_name": "",
             "d_passport": "",
             "dnic": "",
-        }
+        })
+        self.field_keys = list(self.raw_data.keys())
+        # "column": one applicant per column (fields down the rows, the original layout)
+        # "row": one applicant per row (fields across the columns)
+        self.orientation = orientation
+        # Optional RecordCache of parsed records, keyed by file contents
+        self.cache = cache
+        # Compiled per-field transforms (dates, phones, enums) run over each batch
+        self.pipeline = pipeline
+        # Worksheet to read, by position or name (None: every sheet); the same for both readers
+        self.sheet_name = sheet_name
         self.data_frame = None
+        # Columnar store of the loaded batch; records[i] is a dict-like row view
+        self.records = RecordStore(self.field_keys)
+        self.current_index = 0
 
     def select_file(self, file_path):
         try:
-            self.data_frame = pd.read_excel(file_path, header=None)
-            self.read_data()
+            if self.cache is not None:
+                records = self.cache.get(file_path, self._cache_variant())
+                if records is not None:
+                    self.data_frame = None
+                    self.load_records(records)
+                    return True
+
+            if os.path.splitext(file_path)[1].lower() in STREAMED_EXTENSIONS:
+                self.data_frame = None
+                self.load_records(self.stream_records(file_path))
+            else:
+                frames = pd.read_excel(file_path, header=None, sheet_name=self.sheet_name)
+                if isinstance(frames, dict):
+                    # sheet_name=None: every sheet in order, as stream_records reads them
+                    self.data_frame = None
+                    self.load_records(
+                        record for frame in frames.values() for record in self._frame_records(frame)
+                    )
+                else:
+                    self.data_frame = frames
+                    self.read_data()
+            if self.cache is not None:
+                self.cache.put(file_path, self.records, self.field_keys, self._cache_variant())
             return True
         except Exception as e:
             print(f"Error reading file: {e}")
             return False
 
     def read_data(self):
-        key_list = list(self.raw_data.keys())
-        # Loop over each key and assign the first cell in the corresponding row to the raw_data dictionary
-        for i, key in enumerate(key_list):
-            if i < len(self.data_frame):
-                cell_value = self.data_frame.iloc[i, 0]
-                # Handle NaN values
-                if pd.isna(cell_value):
-                    self.raw_data[key] = ""
-                else:
-                    self.raw_data[key] = str(cell_value)
-            else:
+        """Build one record per applicant and load the first one into raw_data"""
+        self.load_records(self.iter_records())
+
+    def load_records(self, records):
+        """Replace the loaded batch and show its first record in raw_data"""
+        if not isinstance(records, RecordStore):
+            records = RecordStore.from_records(self.field_keys, records)
+        self.records = records
+        self.current_index = 0
+        if self.records:
+            self.raw_data.update(self.records[0])
+        else:
+            for key in self.raw_data:
                 self.raw_data[key] = ""
-        print("Data loaded:", self.raw_data)
\ No newline at end of file
+        print(f"Data loaded: {len(self.records)} record(s)")
+        print("Current record:", self.raw_data)
+
+    def iter_records(self):
+        """Yield every applicant in the loaded sheet as a separate record dict"""
+        if self.data_frame is None:
+            return
+        yield from self._frame_records(self.data_frame)
+
+    def _frame_records(self, frame):
+        """Records of one sheet read as a DataFrame (header=None)"""
+        block = frame.to_numpy(dtype=object)
+        if self.orientation != "row":
+            block = block[:len(self.field_keys)].T
+        return self._records_from_block(block)
+
+    def stream_records(self, file_path, sheet_name=_READER_SHEET):
+        """Lazily yield records from a workbook without loading it into a DataFrame
+
+        Uses openpyxl read-only mode, so only the rows currently being turned
+        into records are held in memory. sheet_name (a position or a name)
+        defaults to the reader's sheet_name; with None every sheet of the
+        workbook is read in order. In "column" orientation a record spans
+        the first len(field_keys) rows, so only those rows are ever read.
+        .csv files are streamed with the csv module.
+        """
+        if os.path.splitext(file_path)[1].lower() == ".csv":
+            with open(file_path, newline="", encoding="utf-8-sig") as f:
+                yield from self._records_from_rows(csv.reader(f))
+            return
+
+        from openpyxl import load_workbook
+
+        if sheet_name is _READER_SHEET:
+            sheet_name = self.sheet_name
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if sheet_name is None:
+                worksheets = workbook.worksheets
+            elif isinstance(sheet_name, int):
+                worksheets = [workbook.worksheets[sheet_name]]
+            else:
+                worksheets = [workbook[sheet_name]]
+            for worksheet in worksheets:
+                if self.orientation == "row":
+                    rows = worksheet.iter_rows(values_only=True)
+                else:
+                    rows = worksheet.iter_rows(max_row=len(self.field_keys), values_only=True)
+                yield from self._records_from_rows(rows)
+        finally:
+            workbook.close()
+
+    def _records_from_rows(self, rows, chunk_size=1000):
+        """Turn an iterable of row tuples into records for the current orientation"""
+        width = len(self.field_keys)
+        if self.orientation == "row":
+            # Convert rows in fixed-size chunks so memory stays bounded
+            chunk = []
+            for row in rows:
+                row = tuple(row)[:width]
+                chunk.append(row + (None,) * (width - len(row)))
+                if len(chunk) == chunk_size:
+                    yield from self._records_from_block(np.array(chunk, dtype=object))
+                    chunk = []
+            if chunk:
+                yield from self._records_from_block(np.array(chunk, dtype=object))
+            return
+
+        # Column orientation: each column across the field rows is one applicant
+        field_rows = [tuple(row) for _, row in zip(self.field_keys, rows)]
+        record_count = max((len(row) for row in field_rows), default=0)
+        block = np.full((width, record_count), None, dtype=object)
+        for i, row in enumerate(field_rows):
+            block[i, :len(row)] = row
+        yield from self._records_from_block(block.T)
+
+    def _records_from_block(self, block):
+        """Convert a 2-D (records x fields) cell block into record dicts in one pass
+
+        The transform pipeline runs column by column over the whole block,
+        then NaN/None become "", every other cell is str()-coerced, and
+        applicants whose cells are all empty are dropped.
+        """
+        width = len(self.field_keys)
+        if block.ndim != 2 or block.shape[0] == 0:
+            return []
+        if block.shape[1] < width:
+            padding = np.full((block.shape[0], width - block.shape[1]), None, dtype=object)
+            block = np.hstack([block, padding])
+
+        block = block[:, :width]
+        if self.pipeline is not None:
+            frame = self.pipeline.apply(pd.DataFrame(block, columns=self.field_keys, dtype=object))
+            block = frame.to_numpy(dtype=object)
+
+        values = block.astype(str)
+        values[pd.isna(block)] = ""
+        values = values[(values != "").any(axis=1)]
+        return [dict(zip(self.field_keys, row)) for row in values.tolist()]
+
+    def _cache_variant(self):
+        # Cached records come from one sheet, post-transform: both are part of the key
+        pipeline = self.pipeline.identifier if self.pipeline is not None else "raw"
+        sheet = "all" if self.sheet_name is None else f"sheet:{self.sheet_name!r}"
+        return f"{self.orientation}-{sheet}-{pipeline}-v{self.CACHE_VERSION}"
+
+    @property
+    def record_count(self):
+        return len(self.records)
+
+    def select_record(self, index):
+        """Load the record at index into raw_data"""
+        if not 0 <= index < len(self.records):
+            return False
+        self.current_index = index
+        self.raw_data.update(self.records[index])
+        return True
+
+    def save_current_record(self):
+        """Write raw_data back into the currently selected record"""
+        if 0 <= self.current_index < len(self.records):
+            self.records[self.current_index] = self.raw_data
@@ -1,6 +1,7 @@
 import customtkinter as ctk
-import calendar
 from datetime import datetime
+from DatePicker import DatePicker
+from FormBinding import FormBinding
 from ExcelReaderFrontEndController import ExcelReaderFrontEndController
 
 ctk.set_appearance_mode("Dark")  # Modern dark theme
@@ -38,14 +39,23 @@ class ExcelReaderFrontEnd:
         ]
 
         self.entries = {}
+        # Writes record changes into self.entries, only for fields that changed
+        self.form_binding = FormBinding(
+            self.root, self.raw_data, self.entries, defaults={"sex": "M", "marital": "Single"}
+        )
         self.editing = False
-        self.date_popup = None
+        self.date_picker = None  # shared by every date field, built on first use
+        self.records_window = None
+        self.record_browser = None
         
         self.controller = ExcelReaderFrontEndController(self.excel_reader, self)
 
+        self.fields_built = False
+
         self.create_widgets()
-        self.set_fields_state(editable=False)
-        self.bind_mouse_wheel()
+        self.root.protocol("WM_DELETE_WINDOW", self.controller.shutdown)
+        # Paint the window first; the field rows are built once it is on screen
+        self.root.bind("<Map>", self._on_first_map, add="+")
 
     @property
     def raw_data(self):
@@ -104,282 +114,10 @@ class ExcelReaderFrontEnd:
         return container
 
     def show_date_picker(self, target_entry):
-        """Show modern date picker popup with proper sizing"""
-        if self.date_popup:
-            self.date_popup.destroy()
-            
-        # Parse current date
-        try:
-            current_date = datetime.strptime(target_entry.get(), "%Y-%m-%d")
-        except:
-            current_date = datetime.now()
-            
-        # Create popup window with larger size
-        self.date_popup = ctk.CTkToplevel(self.root)
-        self.date_popup.title("Select Date")
-        self.date_popup.geometry("380x480")  # Increased from 320x400
-        self.date_popup.resizable(False, False)
-        
-        # Center the popup relative to parent
-        self.date_popup.transient(self.root)
-        
-        # Update window to ensure it's displayed
-        self.date_popup.update_idletasks()
-        
-        # Center the window with new dimensions
-        x = (self.root.winfo_x() + (self.root.winfo_width() // 2)) - (380 // 2)
-        y = (self.root.winfo_y() + (self.root.winfo_height() // 2)) - (480 // 2)
-        self.date_popup.geometry(f"380x480+{x}+{y}")
-        
-        # Current year and month
-        self.current_year = current_date.year
-        self.current_month = current_date.month
-        self.selected_day = current_date.day
-        
-        # Header frame with increased height
-        header_frame = ctk.CTkFrame(self.date_popup, fg_color=self.colors['primary'], height=90)
-        header_frame.pack(fill="x", padx=15, pady=15)
-        header_frame.pack_propagate(False)
-        
-        # Year navigation row
-        year_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-        year_frame.pack(fill="x", pady=(8, 0))
-        
-        prev_year_btn = ctk.CTkButton(
-            year_frame, text="<<", width=40, height=28,
-            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
-            font=ctk.CTkFont(family="Arial", size=11),
-            command=self.prev_year
-        )
-        prev_year_btn.pack(side="left", padx=(15, 8))
-        
-        self.year_label = ctk.CTkLabel(
-            year_frame,
-            text=str(self.current_year),
-            font=ctk.CTkFont(family="Arial", size=16, weight="bold"),
-            text_color="white"
-        )
-        self.year_label.pack(side="left", expand=True)
-        
-        next_year_btn = ctk.CTkButton(
-            year_frame, text=">>", width=40, height=28,
-            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
-            font=ctk.CTkFont(family="Arial", size=11),
-            command=self.next_year
-        )
-        next_year_btn.pack(side="right", padx=(8, 15))
-        
-        # Month navigation row
-        month_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-        month_frame.pack(fill="x", pady=(8, 8))
-        
-        prev_btn = ctk.CTkButton(
-            month_frame, text="◀", width=40, height=32,
-            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
-            font=ctk.CTkFont(family="Arial", size=12),
-            command=self.prev_month
-        )
-        prev_btn.pack(side="left", padx=(15, 8))
-        
-        self.month_label = ctk.CTkLabel(
-            month_frame,
-            text=calendar.month_name[self.current_month],
-            font=ctk.CTkFont(family="Arial", size=18, weight="bold"),
-            text_color="white"
-        )
-        self.month_label.pack(side="left", expand=True)
-        
-        next_btn = ctk.CTkButton(
-            month_frame, text="▶", width=40, height=32,
-            fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
-            font=ctk.CTkFont(family="Arial", size=12),
-            command=self.next_month
-        )
-        next_btn.pack(side="right", padx=(8, 15))
-        
-        # Calendar grid container with more space
-        self.calendar_frame = ctk.CTkFrame(self.date_popup, fg_color=self.colors['surface_variant'])
-        self.calendar_frame.pack(fill="both", expand=True, padx=15, pady=8)
-        
-        # Configure grid columns
-        for i in range(7):
-            self.calendar_frame.grid_columnconfigure(i, weight=1, uniform="col")
-        
-        # Day headers with larger size
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for i, day in enumerate(days):
-            label = ctk.CTkLabel(
-                self.calendar_frame, text=day,
-                font=ctk.CTkFont(family="Arial", size=13, weight="bold"),
-                text_color=self.colors['text_primary'],
-                width=45, height=35
-            )
-            label.grid(row=0, column=i, padx=3, pady=3, sticky="nsew")
-        
-        self.day_buttons = []
-        self.target_entry = target_entry
-        self.update_calendar()
-        
-        # Action buttons with more space
-        action_frame = ctk.CTkFrame(self.date_popup, fg_color="transparent", height=60)
-        action_frame.pack(fill="x", padx=15, pady=15)
-        action_frame.pack_propagate(False)
-        
-        cancel_btn = ctk.CTkButton(
-            action_frame, text="Cancel", width=90, height=35,
-            fg_color=self.colors['surface_variant'], hover_color=self.colors['surface'],
-            font=ctk.CTkFont(family="Arial", size=12),
-            command=self.close_date_picker
-        )
-        cancel_btn.pack(side="left", padx=8)
-        
-        today_btn = ctk.CTkButton(
-            action_frame, text="Today", width=90, height=35,
-            fg_color=self.colors['accent'], hover_color=self.colors['primary'],
-            font=ctk.CTkFont(family="Arial", size=12),
-            command=self.select_today
-        )
-        today_btn.pack(side="left", padx=8)
-        
-        ok_btn = ctk.CTkButton(
-            action_frame, text="OK", width=90, height=35,
-            fg_color=self.colors['success'], hover_color='#45a049',
-            font=ctk.CTkFont(family="Arial", size=12),
-            command=self.confirm_date
-        )
-        ok_btn.pack(side="right", padx=8)
-        
-        # Now grab focus after everything is set up
-        self.date_popup.after(100, self.grab_focus)
-
-    def update_calendar(self):
-        """Update calendar display with proper button sizing"""
-        # Clear existing buttons
-        for btn in self.day_buttons:
-            btn.destroy()
-        self.day_buttons.clear()
-        
-        # Get calendar for current month
-        cal = calendar.monthcalendar(self.current_year, self.current_month)
-        
-        # Get currently selected date for highlighting
-        try:
-            current_selected = datetime.strptime(self.target_entry.get(), "%Y-%m-%d")
-            is_same_month = (self.current_month == current_selected.month and 
-                        self.current_year == current_selected.year)
-        except:
-            is_same_month = False
-            current_selected = None
-        
-        for week_num, week in enumerate(cal, 1):
-            for day_num, day in enumerate(week):
-                if day == 0:
-                    # Empty cell
-                    label = ctk.CTkLabel(
-                        self.calendar_frame, 
-                        text="", 
-                        width=45, 
-                        height=40,
-                        fg_color="transparent"
-                    )
-                    label.grid(row=week_num, column=day_num, padx=3, pady=3, sticky="nsew")
-                    self.day_buttons.append(label)
-                else:
-                    # Day button with larger size
-                    is_selected = (is_same_month and current_selected and day == current_selected.day)
-                    
-                    btn = ctk.CTkButton(
-                        self.calendar_frame, 
-                        text=str(day), 
-                        width=45, 
-                        height=40,
-                        font=ctk.CTkFont(family="Arial", size=13),
-                        fg_color=self.colors['primary'] if is_selected else self.colors['surface'],
-                        hover_color=self.colors['accent'],
-                        text_color="white",
-                        command=lambda d=day: self.select_day(d)
-                    )
-                    btn.grid(row=week_num, column=day_num, padx=3, pady=3, sticky="nsew")
-                    self.day_buttons.append(btn)
-        
-        # Configure grid rows
-        for i in range(len(cal) + 1):
-            self.calendar_frame.grid_rowconfigure(i, weight=1)
-
-    def grab_focus(self):
-        """Safely grab focus after window is displayed"""
-        try:
-            if self.date_popup and self.date_popup.winfo_exists():
-                self.date_popup.grab_set()
-                self.date_popup.focus_set()
-        except:
-            pass  # Ignore if grab fails
-
-    def close_date_picker(self):
-        """Close the date picker safely"""
-        if self.date_popup:
-            try:
-                self.date_popup.grab_release()
-            except:
-                pass
-            self.date_popup.destroy()
-            self.date_popup = None
-
-    def prev_month(self):
-        """Navigate to previous month"""
-        if self.current_month == 1:
-            self.current_month = 12
-            self.current_year -= 1
-            self.year_label.configure(text=str(self.current_year))
-        else:
-            self.current_month -= 1
-        self.month_label.configure(text=calendar.month_name[self.current_month])
-        self.update_calendar()
-
-    def next_month(self):
-        """Navigate to next month"""
-        if self.current_month == 12:
-            self.current_month = 1
-            self.current_year += 1
-            self.year_label.configure(text=str(self.current_year))
-        else:
-            self.current_month += 1
-        self.month_label.configure(text=calendar.month_name[self.current_month])
-        self.update_calendar()
-
-    def prev_year(self):
-        """Navigate to previous year"""
-        self.current_year -= 1
-        self.year_label.configure(text=str(self.current_year))
-        self.update_calendar()
-
-    def next_year(self):
-        """Navigate to next year"""
-        self.current_year += 1
-        self.year_label.configure(text=str(self.current_year))
-        self.update_calendar()
-
-    def select_day(self, day):
-        """Select a specific day"""
-        self.selected_day = day
-        self.update_calendar()
-
-    def select_today(self):
-        """Select today's date"""
-        today = datetime.now()
-        self.current_year = today.year
-        self.current_month = today.month
-        self.selected_day = today.day
-        self.year_label.configure(text=str(self.current_year))
-        self.month_label.configure(text=calendar.month_name[self.current_month])
-        self.update_calendar()
-
-    def confirm_date(self):
-        """Confirm date selection"""
-        selected_date = datetime(self.current_year, self.current_month, self.selected_day)
-        self.target_entry.delete(0, "end")
-        self.target_entry.insert(0, selected_date.strftime("%Y-%m-%d"))
-        self.close_date_picker()
+        """Open the shared date picker on target_entry"""
+        if self.date_picker is None:
+            self.date_picker = DatePicker(self.root, self.colors)
+        self.date_picker.open(target_entry)
 
     def create_widgets(self):
         # Main container
@@ -419,6 +157,54 @@ class ExcelReaderFrontEnd:
         )
         self.select_file_btn.pack(side="left", padx=10, pady=10)
 
+        # Record navigation for multi-applicant workbooks
+        self.prev_record_btn = ctk.CTkButton(
+            nav_frame,
+            text="◀",
+            command=self.controller.prev_record_clicked,
+            corner_radius=8,
+            font=ctk.CTkFont(family="Arial", size=14, weight="bold"),
+            width=40,
+            height=40,
+            fg_color=self.colors['secondary'],
+            hover_color=self.colors['accent']
+        )
+        self.prev_record_btn.pack(side="left", padx=(10, 5), pady=10)
+
+        self.record_label = ctk.CTkLabel(
+            nav_frame,
+            text="No records",
+            font=ctk.CTkFont(family="Arial", size=13),
+            text_color=self.colors['text_secondary']
+        )
+        self.record_label.pack(side="left", padx=5, pady=10)
+
+        self.next_record_btn = ctk.CTkButton(
+            nav_frame,
+            text="▶",
+            command=self.controller.next_record_clicked,
+            corner_radius=8,
+            font=ctk.CTkFont(family="Arial", size=14, weight="bold"),
+            width=40,
+            height=40,
+            fg_color=self.colors['secondary'],
+            hover_color=self.colors['accent']
+        )
+        self.next_record_btn.pack(side="left", padx=(5, 10), pady=10)
+
+        self.browse_records_btn = ctk.CTkButton(
+            nav_frame,
+            text="📋 Records",
+            command=self.controller.browse_records_clicked,
+            corner_radius=8,
+            font=ctk.CTkFont(family="Arial", size=14, weight="bold"),
+            width=110,
+            height=40,
+            fg_color=self.colors['secondary'],
+            hover_color=self.colors['accent']
+        )
+        self.browse_records_btn.pack(side="left", padx=10, pady=10)
+
         # Proceed button (right side)
         self.proceed_btn = ctk.CTkButton(
             nav_frame,
@@ -433,6 +219,53 @@ class ExcelReaderFrontEnd:
         )
         self.proceed_btn.pack(side="right", padx=20, pady=10)
 
+        # Live automation status panel
+        status_frame = ctk.CTkFrame(main_container, fg_color=self.colors['surface_variant'], height=50, corner_radius=0)
+        status_frame.pack(fill="x", padx=0, pady=(1, 0))
+        status_frame.pack_propagate(False)
+
+        self.all_records_var = ctk.BooleanVar(value=False)
+        self.all_records_check = ctk.CTkCheckBox(
+            status_frame,
+            text="All records",
+            variable=self.all_records_var,
+            font=ctk.CTkFont(family="Arial", size=12),
+            checkbox_width=20,
+            checkbox_height=20
+        )
+        self.all_records_check.pack(side="left", padx=20, pady=10)
+
+        self.automation_status_label = ctk.CTkLabel(
+            status_frame,
+            text="⏸️ Automation idle",
+            font=ctk.CTkFont(family="Arial", size=12),
+            text_color=self.colors['text_secondary'],
+            anchor="w"
+        )
+        self.automation_status_label.pack(side="left", fill="x", expand=True, padx=10, pady=10)
+
+        self.cancel_automation_btn = ctk.CTkButton(
+            status_frame,
+            text="⏹️ Cancel",
+            command=self.controller.cancel_automation_clicked,
+            corner_radius=8,
+            font=ctk.CTkFont(family="Arial", size=12, weight="bold"),
+            width=140,
+            height=30,
+            fg_color=self.colors['danger'],
+            hover_color='#d32f2f',
+            state="disabled"
+        )
+        self.cancel_automation_btn.pack(side="right", padx=20, pady=10)
+
+        self.automation_progress = ctk.CTkProgressBar(
+            status_frame,
+            width=160,
+            progress_color=self.colors['success']
+        )
+        self.automation_progress.set(0)
+        self.automation_progress.pack(side="right", padx=10, pady=10)
+
         # Content area with modern card design
         content_frame = ctk.CTkFrame(main_container, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=30, pady=30)
@@ -447,6 +280,20 @@ class ExcelReaderFrontEnd:
         )
         self.frame.pack(fill="both", expand=True)
 
+    def _on_first_map(self, event):
+        if event.widget is self.root and not self.fields_built:
+            self.fields_built = True
+            # Queued behind the redraw Tk schedules for the newly mapped window
+            self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        """Build the field rows after the first frame, then lock them read-only"""
+        self.create_field_widgets()
+        self.set_fields_state(editable=False)
+        self.bind_mouse_wheel()
+
+    def create_field_widgets(self):
+        """One label and input per record field, plus the edit button"""
         # Configure grid with better spacing
         self.frame.grid_columnconfigure(0, weight=0, minsize=200)
         self.frame.grid_columnconfigure(1, weight=1)
@@ -585,6 +432,54 @@ class ExcelReaderFrontEnd:
         for entry in self.entries.values():
             _bind_to_mousewheel(entry)
 
+    def show_record_browser(self):
+        """Open the record table window; it is built once and hidden, not destroyed, on close"""
+        if self.records_window is None:
+            # Imported on first use, like the other widgets that are not on the startup path
+            from RecordBrowser import RecordBrowser
+
+            self.records_window = ctk.CTkToplevel(self.root)
+            self.records_window.title("Records")
+            self.records_window.configure(fg_color=self.colors['surface'])
+            self.records_window.protocol("WM_DELETE_WINDOW", self.records_window.withdraw)
+            self.record_browser = RecordBrowser(
+                self.records_window,
+                lambda: self.excel_reader.records,
+                self.colors,
+                on_select=self.controller.record_browser_selected,
+                on_edit=self.controller.record_browser_edited
+            )
+            self.record_browser.pack(fill="both", expand=True, padx=15, pady=15)
+        else:
+            self.records_window.deiconify()
+        self.records_window.lift()
+        self.record_browser.refresh(self.excel_reader.current_index)
+
+    def refresh_record_browser(self):
+        """Re-render the record table if it is open"""
+        if self.records_window is not None and self.records_window.winfo_viewable():
+            self.record_browser.refresh(self.excel_reader.current_index)
+
+    def show_automation_status(self, text, fraction, running, review=False):
+        """Update the automation status panel; fraction=None keeps the current progress"""
+        self.automation_status_label.configure(
+            text=text,
+            text_color=self.colors['text_primary'] if running else self.colors['text_secondary']
+        )
+        if fraction is not None:
+            self.automation_progress.set(fraction)
+        if review:
+            self.cancel_automation_btn.configure(
+                text="✅ Close Browser", state="normal",
+                fg_color=self.colors['success'], hover_color='#45a049'
+            )
+        else:
+            self.cancel_automation_btn.configure(
+                text="⏹️ Cancel", state="normal" if running else "disabled",
+                fg_color=self.colors['danger'], hover_color='#d32f2f'
+            )
+        self.proceed_btn.configure(state="disabled" if running else "normal")
+
     def set_fields_state(self, editable):
         for key, entry in self.entries.items():
             if hasattr(entry, 'date_entry'):  # Custom date selector
@@ -1,10 +1,18 @@
 from tkinter import messagebox, filedialog
-from BrowserAutomation import BrowserAutomation
+from ProgressJournal import ProgressJournal
+from RecordValidator import DEFAULT_VALIDATOR
 
 class ExcelReaderFrontEndController:
     def __init__(self, excel_reader, frontend_app):
         self.excel_reader = excel_reader  # Reference to ExcelReader instance
         self.frontend_app = frontend_app  # Reference to frontend app
+        # Warm browser sessions reused across applicants, created on first Proceed
+        self.driver_pool = None
+        # Runs the automation off the Tk thread; created with the first Proceed
+        self.worker = None
+        self.in_review = False
+        # Fields the automation types with real keystrokes instead of setting by script
+        self.typed_fields = ()
         
     @property
     def raw_data(self):
@@ -43,6 +51,7 @@ class ExcelReaderFrontEndController:
             # Clear raw_data in ExcelReader
             for key in self.raw_data:
                 self.raw_data[key] = ""
+            self.excel_reader.save_current_record()
 
             self.update_ui_with_data()
             
@@ -87,7 +96,9 @@ class ExcelReaderFrontEndController:
                 
                 messagebox.showinfo(
                     "✅ File Loaded",
-                    f"File loaded successfully:\n\n{file_path}\n\nData has been populated in the form.",
+                    f"File loaded successfully:\n\n{file_path}\n\n"
+                    f"{self.excel_reader.record_count} record(s) found. "
+                    f"The first record has been populated in the form.",
                     parent=self.root
                 )
             else:
@@ -97,42 +108,59 @@ class ExcelReaderFrontEndController:
                     parent=self.root
                 )
 
+    def prev_record_clicked(self):
+        """Show the previous record of the loaded batch"""
+        self._show_record(self.excel_reader.current_index - 1)
+
+    def next_record_clicked(self):
+        """Show the next record of the loaded batch"""
+        self._show_record(self.excel_reader.current_index + 1)
+
+    def _show_record(self, index):
+        if self.editing:
+            messagebox.showwarning(
+                "⚠️ Warning",
+                "Please save or cancel your current edits before switching records.",
+                parent=self.root
+            )
+            return
+        if self.excel_reader.select_record(index):
+            self.update_ui_with_data()
+
+    def browse_records_clicked(self):
+        """Open the scrollable table of every loaded record"""
+        self.frontend_app.show_record_browser()
+
+    def record_browser_selected(self, index):
+        """Show the record clicked in the record table in the form"""
+        self._show_record(index)
+
+    def record_browser_edited(self, index, key, value):
+        """Write a cell edited in the record table back to its record"""
+        records = self.excel_reader.records
+        records[index][key] = value
+        if index == self.excel_reader.current_index:
+            # The form binding shows it, or holds it back while the form is being edited
+            self.raw_data[key] = value
+
+    def update_record_label(self):
+        """Refresh the 'Record x / n' indicator in the navigation bar"""
+        count = self.excel_reader.record_count
+        if count:
+            text = f"Record {self.excel_reader.current_index + 1} / {count}"
+        else:
+            text = "No records"
+        self.frontend_app.record_label.configure(text=text)
+
     def update_ui_with_data(self):
-        """Update the UI fields with data from ExcelReader"""
-        self.frontend_app.set_fields_state(editable=True)
-        for key, entry in self.entries.items():
-            value = self.raw_data.get(key, "")
-
-            # For a custom date selector widget
-            if hasattr(entry, 'date_entry'):  
-                # Make sure date_entry is a widget supporting delete/insert
-                entry.date_entry.delete(0, "end")
-                if value:
-                    entry.date_entry.insert(0, str(value))
-            
-            # For a ComboBox widget
-            elif hasattr(entry, 'set'):  
-                if value:
-                    entry.set(str(value))
-                else:
-                    # Set default values for dropdowns
-                    if key == "sex":
-                        entry.set("M")
-                    elif key == "marital":
-                        entry.set("Single")
-                    else:
-                        entry.set("")  # Clear if no default
-            
-            # For a regular Entry widget
-            else:  
-                entry.delete(0, "end")
-                if value:
-                    entry.insert(0, str(value))
-                else:
-                    entry.insert(0, "")  # Clear the entry
-        
-        self.frontend_app.set_fields_state(editable=False)
+        """Refresh the record indicator and table after raw_data changed
 
+        The field widgets are not redrawn here: the form binding already
+        queued the fields whose values changed and writes just those in one
+        idle callback.
+        """
+        self.update_record_label()
+        self.frontend_app.refresh_record_browser()
 
     def proceed_button_clicked(self):
         if self.editing:
@@ -141,22 +169,56 @@ class ExcelReaderFrontEndController:
                     f"Unable to Proceed in Editing Mode Please Save the data and proceed",
                     parent=self.root
                 )
+        elif self.worker is not None and self.worker.running:
+            messagebox.showwarning(
+                "⚠️ Busy",
+                "Automation is already running. Cancel it or wait for it to finish.",
+                parent=self.root
+            )
         else:
-            automation = BrowserAutomation()
             print("Proceed button clicked")
             print("Current data:", self.raw_data)
+
+            if self.frontend_app.all_records_var.get() and self.excel_reader.record_count:
+                records = [dict(record) for record in self.excel_reader.records]
+                # Resume an interrupted batch: skip records filled in an earlier run
+                journal = ProgressJournal.default()
+                pending_indexes = journal.pending_indexes(records)
+                summary = f"{len(pending_indexes)} record(s) will be filled one after another."
+                if len(pending_indexes) < len(records):
+                    summary += f"\n{len(records) - len(pending_indexes)} record(s) already filled earlier will be skipped."
+                records = [records[index] for index in pending_indexes]
+                # Report problems against the record numbers shown in the navigation bar
+                numbers = [index + 1 for index in pending_indexes]
+            else:
+                records = [dict(self.raw_data)]
+                numbers = [self.excel_reader.current_index + 1]
+                # Show current data in a message box
+                summary = "\n".join([f"{key}: {value}" for key, value in self.raw_data.items() if value])
             
-            # Show current data in a message box
-            data_summary = "\n".join([f"{key}: {value}" for key, value in self.raw_data.items() if value])
-            
-            if data_summary:
+            if summary:
+                records, report = DEFAULT_VALIDATOR.filter(records, numbers)
+                report.print_report()
+                if report.rejected_count:
+                    messagebox.showwarning(
+                        "⚠️ Invalid Records",
+                        f"These records will be skipped:\n\n{report.describe()}",
+                        parent=self.root
+                    )
+                if not records:
+                    messagebox.showinfo(
+                        "ℹ️ Nothing to Fill",
+                        "No records are left to fill: they were all filled earlier or failed validation.",
+                        parent=self.root
+                    )
+                    return
+
                 messagebox.showinfo(
                     "📋 Current Data",
-                    f"Data ready for processing:\n\n{data_summary}",
+                    f"Data ready for processing:\n\n{summary}",
                     parent=self.root
                 )
-                data = self.raw_data
-                automation.execute_full_flow(data)
+                self.start_automation(records)
             else:
                 messagebox.showwarning(
                     "⚠️ No Data",
@@ -164,13 +226,68 @@ class ExcelReaderFrontEndController:
                     parent=self.root
                 )
 
+    def start_automation(self, records):
+        """Run the automation for records on the worker thread"""
+        # Selenium is imported on the first Proceed, not at startup
+        from AutomationWorker import AutomationWorker
+        from BrowserAutomation import BrowserAutomation
+        from DriverPool import DriverPool
+
+        if self.driver_pool is None:
+            self.driver_pool = DriverPool(BrowserAutomation.create_driver)
+        if self.worker is None:
+            self.worker = AutomationWorker(self.root, self.handle_automation_event)
+        self.in_review = False
+        self.frontend_app.show_automation_status("🚀 Starting automation...", 0, running=True)
+        self.worker.start(records, {
+            "pool": self.driver_pool, "journal": ProgressJournal.default(), "typed_fields": self.typed_fields,
+        })
+
+    def cancel_automation_clicked(self):
+        """Cancel the running automation, or close the browser after review"""
+        if self.worker is None or not self.worker.running:
+            return
+        if self.in_review:
+            self.in_review = False
+            self.worker.finish_review()
+            self.frontend_app.show_automation_status("🔒 Closing browser...", None, running=True)
+        else:
+            self.worker.cancel()
+            self.frontend_app.show_automation_status("⏹️ Cancelling...", None, running=True)
+
+    def handle_automation_event(self, kind, payload):
+        """Apply a worker event to the status panel (runs on the Tk thread)"""
+        from FlowConfig import FLOW_STAGES
+
+        if kind == "progress":
+            stage, message, number, count = payload
+            prefix = f"Record {number}/{count}: " if count > 1 else ""
+            if stage in FLOW_STAGES:
+                stage_fraction = (FLOW_STAGES.index(stage) + 1) / len(FLOW_STAGES)
+                fraction = (number - 1 + stage_fraction) / count
+            else:
+                fraction = None
+            self.frontend_app.show_automation_status(f"{prefix}{message}", fraction, running=True)
+        elif kind == "review":
+            self.in_review = True
+            self.frontend_app.show_automation_status(
+                f"🔍 Record {payload}: review and submit the form, then close the browser",
+                None, running=True, review=True
+            )
+        elif kind == "done":
+            self.in_review = False
+            filled = sum(1 for result in payload if result)
+            self.frontend_app.show_automation_status(
+                f"✅ Finished: {filled}/{len(payload)} record(s) filled", 1, running=False
+            )
+
     def save_changes(self):
         """Save changes from UI back to ExcelReader"""
-        for key, entry in self.entries.items():
-            if hasattr(entry, 'date_entry'):  # Custom date selector
-                self.raw_data[key] = entry.date_entry.get()
-            else:
-                self.raw_data[key] = entry.get()
+        # Only the fields edited in the form: the others may have been changed
+        # in the record table meanwhile, and the frozen widgets still show the old value
+        self.raw_data.update(self.frontend_app.form_binding.edited_keys())
+        self.excel_reader.save_current_record()
+        self.frontend_app.refresh_record_browser()
         
         print("Updated data:", self.raw_data)
         
@@ -183,6 +300,7 @@ class ExcelReaderFrontEndController:
 
     def toggle_edit(self):
         if not self.editing:
+            self.frontend_app.form_binding.freeze()
             self.frontend_app.set_fields_state(editable=True)
             self.frontend_app.action_btn.configure(
                 text="💾 Save Changes",
@@ -196,6 +314,7 @@ class ExcelReaderFrontEndController:
             self.frontend_app.editing = True
         else:
             self.save_changes()
+            self.frontend_app.form_binding.thaw()
             self.frontend_app.set_fields_state(editable=False)
             self.frontend_app.action_btn.configure(
                 text="✏️ Edit Data",
@@ -206,4 +325,13 @@ class ExcelReaderFrontEndController:
                 text="🔒 Read-only mode",
                 text_color=self.frontend_app.colors['text_secondary']
             )
-            self.frontend_app.editing = False
\ No newline at end of file
+            self.frontend_app.editing = False
+
+    def shutdown(self):
+        """Quit pooled browser sessions and close the window"""
+        if self.worker is not None and self.worker.running:
+            # Wait for the worker to hand back its browser, so no Chrome is left running
+            self.worker.stop()
+        if self.driver_pool is not None:
+            self.driver_pool.close()
+        self.root.destroy()
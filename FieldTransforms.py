@@ -0,0 +1,98 @@
+from LazyImports import lazy_import
+
+pd = lazy_import("pandas")
+
+# Declarative per-field transforms applied to every loaded record.
+# Each value names an entry of TRANSFORM_BUILDERS.
+FIELD_TRANSFORMS = {
+    "dob": "date",
+    "P_exp": "date",
+    "phone1": "phone",
+    "phone2": "phone",
+    "sex": "sex",
+    "marital": "marital",
+}
+
+# Lower-cased spellings -> the values the form's dropdowns use
+SEX_VALUES = {"m": "M", "male": "M", "f": "F", "female": "F"}
+MARITAL_VALUES = {"single": "Single", "unmarried": "Single", "married": "Married"}
+
+# Excel stores dates as days since 1899-12-30
+EXCEL_EPOCH = "1899-12-30"
+
+
+def _as_text(series):
+    """Object series -> stripped strings, NaN kept as NaN"""
+    text = series.astype("string").str.strip()
+    return text.astype(object).where(series.notna())
+
+
+def build_date():
+    """Any Excel/ISO/dd-mm-yyyy date -> 'yyyy-mm-dd'; unparseable values pass through"""
+    def transform(series):
+        text = _as_text(series)
+        parsed = pd.to_datetime(text.str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+        parsed = parsed.fillna(pd.to_datetime(text, format="%d/%m/%Y", errors="coerce"))
+        parsed = parsed.fillna(pd.to_datetime(text, format="%d.%m.%Y", errors="coerce"))
+        parsed = parsed.fillna(pd.to_datetime(text, format="%d-%m-%Y", errors="coerce"))
+        # Raw Excel serial numbers (cells not formatted as dates); bool is an int subclass
+        is_serial = series.map(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool))
+        serial = pd.to_numeric(series.where(is_serial), errors="coerce")
+        parsed = parsed.fillna(pd.Timestamp(EXCEL_EPOCH) + pd.to_timedelta(serial, unit="D"))
+        return parsed.dt.strftime("%Y-%m-%d").astype(object).where(parsed.notna(), text)
+    return transform
+
+
+def build_phone():
+    """Strip spaces, dashes, dots and brackets; drop the '.0' Excel adds to numeric cells"""
+    def transform(series):
+        text = _as_text(series)
+        digits = text.str.replace(r"\.0$", "", regex=True)
+        digits = digits.str.replace(r"(?!^\+)[^\d]", "", regex=True)
+        # Leave values with no digits at all for validation to report
+        return digits.where(digits.str.contains(r"\d", na=False), text)
+    return transform
+
+
+def build_mapping(mapping):
+    """Case-insensitive enum mapping; unknown values pass through unchanged"""
+    def transform(series):
+        text = _as_text(series)
+        return text.str.lower().map(mapping).fillna(text)
+    return transform
+
+
+TRANSFORM_BUILDERS = {
+    "date": build_date,
+    "phone": build_phone,
+    "sex": lambda: build_mapping(SEX_VALUES),
+    "marital": lambda: build_mapping(MARITAL_VALUES),
+}
+
+
+class TransformPipeline:
+    """A FIELD_TRANSFORMS-style spec compiled into column functions
+
+    apply() runs each transform once over a whole column of a batch
+    (records x fields DataFrame of raw cell values), so records reach the
+    browser stage already in the format the form expects.
+    """
+
+    def __init__(self, spec):
+        self.spec = dict(spec)
+        self.transforms = {field: TRANSFORM_BUILDERS[name]() for field, name in self.spec.items()}
+
+    @property
+    def identifier(self):
+        """Stable text naming this spec, e.g. for cache keys"""
+        return ",".join(f"{field}={name}" for field, name in sorted(self.spec.items()))
+
+    def apply(self, frame):
+        frame = frame.copy()
+        for field, transform in self.transforms.items():
+            if field in frame.columns:
+                frame[field] = transform(frame[field].astype(object))
+        return frame
+
+
+DEFAULT_PIPELINE = TransformPipeline(FIELD_TRANSFORMS)
@@ -0,0 +1,341 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from BrowserAutomation import BrowserAutomation
+from DriverPool import DriverPool
+from Instrumentation import InMemoryAggregator, Tracer
+from OtpHandoff import OtpHandoff, ReviewHandoff
+from ProgressJournal import ProgressJournal
+from RecordValidator import DEFAULT_VALIDATOR
+
+
+class SessionStats:
+    """Throughput counters for one browser session"""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def records_per_minute(self):
+        if not self.busy_seconds:
+            return 0.0
+        return (self.completed + self.failed) * 60 / self.busy_seconds
+
+
+def start_booking(automation, record):
+    """Default first stage: launch/lease a browser and get to the OTP page"""
+    return automation.start_booking()
+
+
+def fill_form(automation, record):
+    """Default second stage: fill the form and keep the session open for review"""
+    return automation.fill_form(record)
+
+
+# Markers so handoff=None / review=None / journal=None can mean "no OTP step" /
+# "no review" / "no journal"
+_DEFAULT_HANDOFF = object()
+_DEFAULT_REVIEW = object()
+_DEFAULT_JOURNAL = object()
+
+
+class FillScheduler:
+    """Fill a queue of applicant records across several browser sessions at once
+
+    Every record runs in two stages. `prepare` gets a session to the point
+    where a human must do the OTP step; the session is then parked with an
+    OtpHandoff and the prepare worker moves straight on to the next record.
+    When the operator finishes OTP, `fill` is scheduled on a separate pool of
+    workers. A filled form is then parked with a ReviewHandoff and its
+    session is only released once the operator has submitted it (or closed
+    the tab); only then is the record journaled "filled". Up to `sessions` browsers are shared through a DriverPool, and a
+    process-wide semaphore caps running browsers across all schedulers.
+
+    Pass handoff=None for flows without an OTP step: fill then runs as soon
+    as prepare succeeds. review=None is a dry run: forms are filled, then
+    closed unsubmitted and never journaled "filled". Records that fail `validator` are reported and
+    marked failed up front, without ever leasing a browser (validator=None
+    queues everything). Sessions launch with the "interactive" LaunchProfile,
+    or "lean" (headless) when nobody has to see the browser (no OTP step and
+    no review); pass profile to override.
+    Each record's progress goes to `journal` (the
+    shared ProgressJournal by default, None to disable); records it already
+    lists as filled are skipped, so a batch restarted after a crash resumes
+    where it stopped.
+    """
+
+    # Global cap on concurrently running browser sessions (see set_global_limit)
+    _global_slots = threading.BoundedSemaphore(4)
+
+    def __init__(self, sessions=2, prepare=start_booking, fill=fill_form,
+                 handoff=_DEFAULT_HANDOFF, review=_DEFAULT_REVIEW, pool=None, automation_options=None, tracer=None,
+                 validator=DEFAULT_VALIDATOR, journal=_DEFAULT_JOURNAL, profile=None):
+        self.sessions = sessions
+        self.prepare = prepare
+        self.fill = fill
+        self.handoff = OtpHandoff() if handoff is _DEFAULT_HANDOFF else handoff
+        self.review = ReviewHandoff() if review is _DEFAULT_REVIEW else review
+        self.validator = validator
+        self.journal = ProgressJournal.default() if journal is _DEFAULT_JOURNAL else journal
+        # Only close the pool after a run if this scheduler created it
+        self._owns_pool = pool is None
+        if profile is None:
+            profile = "lean" if self.handoff is None and self.review is None else "interactive"
+        self.pool = pool or DriverPool(
+            functools.partial(BrowserAutomation.create_driver, profile), max_size=sessions
+        )
+        # Every session reports its stage spans here; the run report summarizes them
+        self.tracer = tracer or Tracer.from_env()
+        self.timings = self.tracer.add_sink(InMemoryAggregator())
+        self.automation_options = dict(automation_options or {})
+        self.automation_options.setdefault("tracer", self.tracer)
+        self.automation_options.setdefault("journal", self.journal)
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._session_ids = {}
+        # index -> the global semaphore a running record acquired (the cap may be replaced meanwhile)
+        self._held_slots = {}
+        self._finished = set()
+        self._results = []
+        self._remaining = 0
+        self._rejected = 0
+        self._resumed = 0
+        self._done = threading.Event()
+        self._fill_executor = None
+
+    @classmethod
+    def set_global_limit(cls, limit):
+        """Change the process-wide cap on concurrent browser sessions
+
+        Sessions already running keep (and release) a slot of the old cap;
+        the new one applies to sessions started afterwards.
+        """
+        cls._global_slots = threading.BoundedSemaphore(limit)
+
+    def run(self, records):
+        """Fill every record and return a list of per-record results (True/False)"""
+        records = list(records)
+        if self.validator is not None:
+            report = self.validator.validate(records)
+            report.print_report()
+            queued = report.valid_indexes
+            if self.journal is not None:
+                for index in sorted(report.problems):
+                    self.journal.mark(records[index], "failed", reason="validation")
+        else:
+            queued = list(range(len(records)))
+        self._results = [False] * len(records)
+        self._finished = set()
+        self._rejected = len(records) - len(queued)
+        self._resumed = 0
+        if self.journal is not None:
+            pending = [index for index in queued if not self.journal.is_filled(records[index])]
+            for index in set(queued) - set(pending):
+                self._results[index] = True
+            self._resumed = len(queued) - len(pending)
+            queued = pending
+            if self._resumed:
+                print(f"⏩ Skipping {self._resumed} record(s) already filled in a previous run")
+            for index in queued:
+                self.journal.mark(records[index], "queued")
+        self._remaining = len(queued)
+        self._done = threading.Event()
+        if not queued:
+            self._done.set()
+
+        print(f"🚀 Filling {len(queued)} record(s) with {self.sessions} session(s)...")
+        started = time.perf_counter()
+        prepare_executor = ThreadPoolExecutor(max_workers=self.sessions, thread_name_prefix="fill-prepare")
+        self._fill_executor = ThreadPoolExecutor(max_workers=self.sessions, thread_name_prefix="fill-session")
+        try:
+            for index in queued:
+                prepare_executor.submit(self._prepare_stage, index, records[index])
+            self._done.wait()
+        finally:
+            prepare_executor.shutdown(wait=True)
+            self._fill_executor.shutdown(wait=True)
+        elapsed = time.perf_counter() - started
+
+        if self._owns_pool:
+            self.pool.close()
+        self.print_report(elapsed)
+        return list(self._results)
+
+    def _prepare_stage(self, index, record):
+        slots = self._global_slots
+        slots.acquire()
+        with self._lock:
+            self._held_slots[index] = slots
+        automation = None
+        try:
+            automation = BrowserAutomation(pool=self.pool, **self.automation_options)
+            self._prepare(index, record, automation)
+        except Exception as e:
+            self._abort(index, record, automation, f"preparation failed: {e}")
+
+    def _prepare(self, index, record, automation):
+        started = time.perf_counter()
+        try:
+            prepared = bool(self.prepare(automation, record))
+        except Exception as e:
+            print(f"❌ Record {index + 1}: preparation failed: {e}")
+            prepared = False
+        session_id = self._session_id(automation)
+        self._add_busy(session_id, started)
+
+        if not prepared:
+            if not automation.cancel_event.is_set():
+                automation.journal_state(record, "failed")
+            automation.close_browser()
+            self._finish(index, session_id, False)
+        elif self.handoff is None:
+            self._fill_stage(index, record, automation, session_id)
+        else:
+            automation.journal_state(record, "needs-OTP")
+            parked_at = time.perf_counter()
+
+            def on_ready(automation):
+                self.tracer.record("otp_parked", (time.perf_counter() - parked_at) * 1000)
+                self._fill_executor.submit(self._fill_stage, index, record, automation, session_id)
+
+            self.handoff.park(
+                f"Record {index + 1} (session {session_id})",
+                automation,
+                on_ready=on_ready,
+                on_cancel=lambda automation: self._cancel_stage(index, automation, session_id),
+            )
+
+    def _fill_stage(self, index, record, automation, session_id):
+        try:
+            self._fill(index, record, automation, session_id)
+        except Exception as e:
+            self._abort(index, record, automation, f"filling failed: {e}")
+
+    def _fill(self, index, record, automation, session_id):
+        started = time.perf_counter()
+        try:
+            filled = bool(self.fill(automation, record))
+        except Exception as e:
+            print(f"❌ Record {index + 1}: filling failed: {e}")
+            filled = False
+        self._add_busy(session_id, started)
+
+        if not filled:
+            # Custom fill stages may not journal the failure themselves
+            if automation.journal is not None and automation.journal.state(record) != "failed":
+                automation.journal_state(record, "failed")
+            automation.close_browser()
+            self._finish(index, session_id, False)
+        elif automation.driver is None:
+            # A custom fill stage already finished with the session
+            self._finish(index, session_id, True)
+        elif self.review is None:
+            print(f"ℹ️ Record {index + 1}: filled, closed without review (dry run, not journaled as filled)")
+            automation.close_browser()
+            self._finish(index, session_id, True)
+        else:
+            self.review.park(
+                f"Record {index + 1} (session {session_id})",
+                automation,
+                on_done=lambda automation, submitted: self._review_done(
+                    index, record, automation, session_id, submitted
+                ),
+            )
+
+    def _review_done(self, index, record, automation, session_id, submitted):
+        try:
+            if submitted:
+                automation.journal_state(record, "filled")
+            else:
+                print(f"⚠️ Record {index + 1}: closed without submitting the form")
+                automation.journal_state(record, "failed")
+            automation.close_browser()
+        finally:
+            self._finish(index, session_id, submitted)
+
+    def _cancel_stage(self, index, automation, session_id):
+        print(f"⏹️ Record {index + 1}: OTP handoff cancelled")
+        try:
+            automation.close_browser()
+        finally:
+            self._finish(index, session_id, False)
+
+    def _abort(self, index, record, automation, reason):
+        """Fail a record after an unexpected error, freeing its browser and global slot"""
+        print(f"❌ Record {index + 1}: {reason}")
+        session_id = 0
+        try:
+            if self.journal is not None:
+                self.journal.mark(record, "failed", reason="error")
+            if automation is not None:
+                session_id = self._session_id(automation)
+                automation.close_browser()
+        except Exception as e:
+            print(f"⚠️ Record {index + 1}: cleanup failed: {e}")
+        finally:
+            self._finish(index, session_id, False)
+
+    def _session_id(self, automation):
+        """Stable number for the browser session an automation is using (0 = none)"""
+        if automation.driver is None:
+            return 0
+        with self._lock:
+            key = id(automation.driver)
+            if key not in self._session_ids:
+                self._session_ids[key] = len(self._session_ids) + 1
+            return self._session_ids[key]
+
+    def _stats_for(self, session_id):
+        if session_id not in self.stats:
+            self.stats[session_id] = SessionStats(session_id)
+        return self.stats[session_id]
+
+    def _add_busy(self, session_id, started):
+        with self._lock:
+            self._stats_for(session_id).busy_seconds += time.perf_counter() - started
+
+    def _finish(self, index, session_id, ok):
+        with self._lock:
+            # A stage that fails after finishing its record must not count it twice
+            if index in self._finished:
+                return
+            self._finished.add(index)
+            slots = self._held_slots.pop(index)
+            self._results[index] = ok
+            stats = self._stats_for(session_id)
+            if ok:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+            self._remaining -= 1
+            if self._remaining == 0:
+                self._done.set()
+        slots.release()
+
+    def print_report(self, elapsed):
+        """Print per-session throughput for the last run"""
+        print("\n" + "=" * 60)
+        print("📊 BATCH THROUGHPUT")
+        print("=" * 60)
+        total = 0
+        for session_id in sorted(self.stats):
+            stats = self.stats[session_id]
+            total += stats.completed + stats.failed
+            name = f"Session {session_id}" if session_id else "No browser"
+            print(
+                f"{name}: {stats.completed} filled, {stats.failed} failed, "
+                f"{stats.records_per_minute:.1f} records/min (busy time, excluding OTP waits)"
+            )
+        if elapsed:
+            print(f"Total: {total} record(s) in {elapsed:.1f}s ({total * 60 / elapsed:.1f} records/min)")
+        if self._rejected:
+            print(f"Rejected before filling: {self._rejected} record(s) failed validation")
+        if self._resumed:
+            print(f"Resumed: {self._resumed} record(s) already filled in a previous run")
+        print("=" * 60)
+        self.timings.report()
@@ -0,0 +1,20 @@
+# Settings shared by the Selenium and CDP backends. Kept free of selenium
+# imports so the CDP backend and the GUI can use them without loading it.
+
+# Upper bounds (seconds) for the condition-based waits; each wait returns as
+# soon as its condition holds, so these only matter when a page misbehaves.
+DEFAULT_TIMEOUTS = {
+    "page_load": 15,      # document.readyState == "complete"
+    "element": 10,        # element present / interactable
+    "cookie_banner": 10,  # OneTrust accept button
+    "book_now": 15,       # 'Book now' button clickable
+    "new_window": 10,     # booking tab opened
+    "form_ready": 10,     # form rendered and visible
+    "otp_check": 30,      # one observe cycle while waiting for the human OTP step
+}
+
+# Stages reported to progress_callback, in flow order
+FLOW_STAGES = ["setup", "open_page", "book_now", "otp", "first_form", "fill", "review"]
+
+# Elements that only exist once the user is past OTP and on the application form
+FORM_PAGE_SELECTOR = "[name='surname'], [name='user_type']"
@@ -0,0 +1,145 @@
+class ObservableRecord(dict):
+    """dict of record fields that tells subscribers which keys actually changed
+
+    Assigning the value a key already has is not a change. update() reports
+    every changed key of one call in a single notification, so loading a
+    record costs one callback no matter how many fields differ.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """callback(changed_keys) runs after each change; returns callback for unsubscribe()"""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def __setitem__(self, key, value):
+        if key in self and self[key] == value:
+            return
+        super().__setitem__(key, value)
+        self._notify([key])
+
+    def update(self, *args, **kwargs):
+        changed = []
+        for key, value in dict(*args, **kwargs).items():
+            if key not in self or self[key] != value:
+                super().__setitem__(key, value)
+                changed.append(key)
+        if changed:
+            self._notify(changed)
+
+    def _notify(self, keys):
+        for callback in list(self._subscribers):
+            callback(keys)
+
+
+class FormBinding:
+    """Keeps the form's field widgets in step with an ObservableRecord
+
+    Changed keys are collected and written to their widgets in one
+    after_idle flush, so several changes in a row (switching records,
+    clearing the form) become one pass. A widget is only touched when its
+    text differs from the record value. While `frozen` (the user is editing
+    the form) changes wait and are applied once it is unfrozen; edited_keys()
+    tells which widgets the user changed in the meantime.
+    """
+
+    def __init__(self, root, record, entries, defaults=None):
+        self.root = root
+        self.record = record
+        self.entries = entries  # key -> widget; may be filled in after the binding is created
+        self.defaults = defaults or {}  # shown in a dropdown when its field is empty
+        self.frozen = False
+        self._dirty = set()
+        self._frozen_texts = {}
+        self._flush_scheduled = False
+        record.subscribe(self.mark_changed)
+
+    def mark_changed(self, keys):
+        self._dirty.update(keys)
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        if not self._flush_scheduled and not self.frozen:
+            self._flush_scheduled = True
+            self.root.after_idle(self.flush)
+
+    def freeze(self):
+        self.frozen = True
+        self._frozen_texts = {key: self.widget_text(widget) for key, widget in self.entries.items()}
+
+    def edited_keys(self):
+        """{key: text} of the widgets whose text changed since freeze()"""
+        edited = {}
+        for key, widget in self.entries.items():
+            text = self.widget_text(widget)
+            if text != self._frozen_texts.get(key):
+                edited[key] = text
+        return edited
+
+    def thaw(self):
+        self.frozen = False
+        if self._dirty:
+            self.schedule_flush()
+
+    def flush(self):
+        """Write every pending key whose widget shows something else; returns widgets updated"""
+        self._flush_scheduled = False
+        if self.frozen:
+            return 0
+        updated = 0
+        pending, self._dirty = self._dirty, set()
+        for key in pending:
+            widget = self.entries.get(key)
+            if widget is not None and self.show(key, widget):
+                updated += 1
+        return updated
+
+    def sync(self):
+        """Mark every field as changed, e.g. after the widgets were rebuilt"""
+        self.mark_changed(self.record.keys())
+
+    def display_value(self, key):
+        value = self.record.get(key, "")
+        text = str(value) if value else ""
+        return text or self.defaults.get(key, "")
+
+    @staticmethod
+    def widget_text(widget):
+        if hasattr(widget, 'date_entry'):  # Custom date selector
+            widget = widget.date_entry
+        return widget.get()
+
+    def show(self, key, widget):
+        """Put the record value into widget if it differs; True if the widget changed"""
+        text = self.display_value(key)
+        if hasattr(widget, 'date_entry'):  # Custom date selector
+            widget = widget.date_entry
+        elif hasattr(widget, 'set'):  # ComboBox; set() is ignored while disabled, so unlock it too
+            if widget.get() == text:
+                return False
+            state = widget.cget("state")
+            if state != "normal":
+                widget.configure(state="normal")
+            widget.set(text)
+            if state != "normal":
+                widget.configure(state=state)
+            return True
+
+        if widget.get() == text:
+            return False
+        # A disabled entry ignores delete/insert, so unlock just this one
+        state = widget.cget("state")
+        if state != "normal":
+            widget.configure(state="normal")
+        widget.delete(0, "end")
+        if text:
+            widget.insert(0, text)
+        if state != "normal":
+            widget.configure(state=state)
+        return True
@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from AppState import ProcessDefault, cache_path
+from FormScripts import DISCOVER_FORM_SCRIPT, FORM_SIGNATURE_SCRIPT
+
+
+def iso_date(value):
+    """'yyyy-mm-dd[ hh:mm:ss]' or 'dd/mm/yyyy' -> 'yyyy-mm-dd' (what date inputs accept)"""
+    value = value.split(" ")[0]
+    for separator in ("/", "."):
+        parts = value.split(separator)
+        if len(parts) == 3 and len(parts[2]) == 4:
+            day, month, year = parts
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    return value
+
+
+class FieldPlan:
+    """How to locate and fill one form control"""
+
+    def __init__(self, name, index, widget, input_type, options):
+        self.name = name
+        self.index = index
+        self.widget = widget          # "select", "date" or "text"
+        self.input_type = input_type  # the control's type attribute
+        # Accepted spellings (value, lower-cased value and label) -> option value
+        self.options = options
+
+    @classmethod
+    def from_control(cls, control):
+        if control["tag"] == "select":
+            widget = "select"
+        elif control["type"] == "date":
+            widget = "date"
+        else:
+            widget = "text"
+
+        options = {}
+        for value, label in control["options"]:
+            if not value:
+                continue  # "Select..." placeholder
+            options.setdefault(value, value)
+            options.setdefault(value.lower(), value)
+            options.setdefault(label.lower(), value)
+        return cls(control["name"], control["index"], widget, control["type"], options)
+
+    def resolve(self, value):
+        """Turn a record value into what the control accepts; None if impossible"""
+        value = str(value)
+        if self.widget == "select":
+            return self.options.get(value) or self.options.get(value.strip().lower())
+        if self.widget == "date":
+            return iso_date(value)
+        return value
+
+    def to_dict(self):
+        return {
+            "name": self.name, "index": self.index, "widget": self.widget,
+            "input_type": self.input_type, "options": self.options,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["index"], data["widget"], data["input_type"], data["options"])
+
+
+class FormPlan:
+    """Compiled fill plan for one page layout: locators, widget types and option maps"""
+
+    def __init__(self, signature, fields):
+        self.signature = signature
+        self.fields = fields
+
+    @classmethod
+    def discover(cls, driver):
+        """Inspect the page once and compile a plan for its form controls"""
+        discovered = driver.execute_script(DISCOVER_FORM_SCRIPT)
+        fields = {}
+        for control in discovered["controls"]:
+            # Keep the first control per name, matching getElementsByName(name)[0]
+            fields.setdefault(control["name"], FieldPlan.from_control(control))
+        return cls(discovered["signature"], fields)
+
+    def prepare(self, values):
+        """Resolve values against the plan
+
+        Returns (rows, statuses): rows is [[name, index, value], ...] ready for
+        FILL_PLANNED_SCRIPT and statuses holds "missing"/"no-option" for
+        fields that cannot be filled, without touching the browser.
+        """
+        rows = []
+        statuses = {}
+        for name, value in values.items():
+            field = self.fields.get(name)
+            if field is None:
+                statuses[name] = "missing"
+                continue
+            resolved = field.resolve(value)
+            if resolved is None:
+                statuses[name] = "no-option"
+                continue
+            rows.append([name, field.index, resolved])
+        return rows, statuses
+
+    def widget(self, name):
+        field = self.fields.get(name)
+        return field.widget if field else None
+
+    def to_dict(self):
+        return {
+            "signature": self.signature,
+            "fields": {name: field.to_dict() for name, field in self.fields.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        fields = {name: FieldPlan.from_dict(field) for name, field in data["fields"].items()}
+        return cls(data["signature"], fields)
+
+
+class FormPlanCache(ProcessDefault):
+    """Form plans keyed by page URL, persisted to disk and checked against the live DOM
+
+    plan_for() costs one small script call on a hit: the page's structure
+    signature is compared with the cached plan's, and the plan is rebuilt
+    only when the layout has changed.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = cache_path("form_plans.json", "DATA_FILL_PLAN_CACHE")
+        self.path = path
+        self._lock = threading.Lock()
+        self.plans = self._load()
+
+    def plan_for(self, driver):
+        """Return a plan matching the current page, discovering it if needed"""
+        key = self.page_key(driver.current_url)
+        signature = driver.execute_script(FORM_SIGNATURE_SCRIPT)
+        with self._lock:
+            plan = self.plans.get(key)
+        if plan is not None and plan.signature == signature:
+            return plan
+
+        print("🧭 Form layout changed or unseen - building a new fill plan")
+        plan = FormPlan.discover(driver)
+        with self._lock:
+            self.plans[key] = plan
+            self._save()
+        return plan
+
+    @staticmethod
+    def page_key(url):
+        """Page URL without query string or fragment"""
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {key: FormPlan.from_dict(plan) for key, plan in data.items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({key: plan.to_dict() for key, plan in self.plans.items()}, f)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save form plans: {e}")
@@ -0,0 +1,253 @@
+# JavaScript snippets injected into the target page by the automation backends.
+# Kept free of selenium imports so every backend can share them.
+
+# Fill every field of a record in a single round trip.
+# arguments[0]: {field_name: value}. Returns {results, timings}: results maps each
+# field to "ok", "missing" (no element), "no-option" (select has no matching
+# option) or "rejected" (the page did not accept the value); timings maps each
+# field to the milliseconds spent on it inside the page.
+FILL_FORM_SCRIPT = """
+const data = arguments[0];
+const results = {};
+const timings = {};
+
+function nativeSetter(el) {
+    let proto = HTMLInputElement.prototype;
+    if (el instanceof HTMLSelectElement) {
+        proto = HTMLSelectElement.prototype;
+    } else if (el instanceof HTMLTextAreaElement) {
+        proto = HTMLTextAreaElement.prototype;
+    }
+    return Object.getOwnPropertyDescriptor(proto, 'value').set;
+}
+
+function toIsoDate(value) {
+    // Accept "yyyy-mm-dd[ hh:mm:ss]" and "dd/mm/yyyy"
+    value = value.split(' ')[0];
+    const dmy = value.match(/^(\\d{1,2})[\\/.](\\d{1,2})[\\/.](\\d{4})$/);
+    if (dmy) {
+        return dmy[3] + '-' + dmy[2].padStart(2, '0') + '-' + dmy[1].padStart(2, '0');
+    }
+    return value;
+}
+
+for (const [name, raw] of Object.entries(data)) {
+    const started = performance.now();
+    const el = document.getElementsByName(name)[0] || document.getElementById(name);
+    if (!el) {
+        results[name] = 'missing';
+        continue;
+    }
+
+    let value = String(raw);
+    if (el instanceof HTMLSelectElement) {
+        const wanted = value.trim().toLowerCase();
+        const options = Array.from(el.options);
+        const option = options.find(o => o.value === value)
+            || options.find(o => o.value.toLowerCase() === wanted || o.text.trim().toLowerCase() === wanted);
+        if (!option) {
+            results[name] = 'no-option';
+            timings[name] = performance.now() - started;
+            continue;
+        }
+        value = option.value;
+    } else if (el.type === 'date') {
+        value = toIsoDate(value);
+    }
+
+    nativeSetter(el).call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    results[name] = el.value === value ? 'ok' : 'rejected';
+    timings[name] = performance.now() - started;
+}
+return {results: results, timings: timings};
+"""
+
+# Async script: resolve once the document has finished loading and the element
+# matching arguments[0] is rendered and enabled. A MutationObserver plus the
+# load/readystatechange events re-check the page as it changes, so there is no
+# polling. Resolves false if arguments[1] milliseconds pass first.
+FORM_READY_SCRIPT = """
+const selector = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+
+function ready() {
+    if (document.readyState !== 'complete') {
+        return false;
+    }
+    const el = document.querySelector(selector);
+    return !!el && el.getClientRects().length > 0 && !el.disabled;
+}
+
+if (ready()) {
+    done(true);
+    return;
+}
+
+let finished = false;
+let timer = null;
+const observer = new MutationObserver(check);
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    window.removeEventListener('load', check);
+    document.removeEventListener('readystatechange', check);
+    done(result);
+}
+
+function check() {
+    if (ready()) {
+        finish(true);
+    }
+}
+
+observer.observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['class', 'style', 'hidden', 'disabled']
+});
+window.addEventListener('load', check);
+document.addEventListener('readystatechange', check);
+timer = setTimeout(() => finish(ready()), timeoutMs);
+"""
+
+# Async script: resolve true once no element matches arguments[0] any more (the
+# form was submitted or replaced in place), false after arguments[1] ms. A page
+# navigation aborts the script instead; the caller then checks the new page.
+FORM_GONE_SCRIPT = """
+const selector = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+
+if (!document.querySelector(selector)) {
+    done(true);
+    return;
+}
+
+const observer = new MutationObserver(() => {
+    if (!document.querySelector(selector)) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, timeoutMs);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+# Click the OneTrust "Accept All Cookies" button if it is showing, without waiting.
+ACCEPT_COOKIES_SCRIPT = """
+const button = document.getElementById('onetrust-accept-btn-handler');
+if (button && button.getClientRects().length > 0) {
+    button.click();
+    return true;
+}
+return false;
+"""
+
+# Answer the first form: arguments[0] is the user type, arguments[1] the number
+# of applicants. Returns false if the form is not on the page.
+FIRST_FORM_SCRIPT = """
+const userType = document.getElementsByName('user_type')[0];
+const applicants = document.getElementsByName('num_applicants')[0];
+const proceed = document.querySelector("button[onclick='proceedToMainForm()']");
+if (!userType || !applicants || !proceed) {
+    return false;
+}
+for (const [el, value] of [[userType, arguments[0]], [applicants, arguments[1]]]) {
+    el.value = value;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+proceed.click();
+return true;
+"""
+
+# Shared helper: a short hash of the form's structure (control names, tags,
+# types and option values). Any layout change produces a different signature.
+_FORM_SIGNATURE_FUNCTION = """
+function formControls() {
+    return Array.from(document.querySelectorAll('form [name]'))
+        .filter(el => ['INPUT', 'SELECT', 'TEXTAREA'].includes(el.tagName));
+}
+
+function formSignature(controls) {
+    const text = controls.map(el => [
+        el.name,
+        el.tagName,
+        el.type || '',
+        el.options ? Array.from(el.options).map(o => o.value).join('|') : ''
+    ].join(':')).join(';');
+    // 32-bit FNV-1a, hex encoded
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+    return controls.length + '-' + hash.toString(16);
+}
+"""
+
+# Return just the current form signature (cheap check against a cached plan).
+FORM_SIGNATURE_SCRIPT = _FORM_SIGNATURE_FUNCTION + """
+return formSignature(formControls());
+"""
+
+# Return the signature plus every named control: name, index among controls
+# sharing that name, tag, type and [value, label] option pairs for selects.
+DISCOVER_FORM_SCRIPT = _FORM_SIGNATURE_FUNCTION + """
+const controls = formControls();
+const seen = {};
+return {
+    signature: formSignature(controls),
+    controls: controls.map(el => {
+        seen[el.name] = (seen[el.name] || 0) + 1;
+        return {
+            name: el.name,
+            index: seen[el.name] - 1,
+            tag: el.tagName.toLowerCase(),
+            type: el.type || '',
+            options: el.options ? Array.from(el.options).map(o => [o.value, o.text.trim()]) : []
+        };
+    })
+};
+"""
+
+# Fill values already resolved by a FormPlan: arguments[0] is a list of
+# [name, index, value]. No type detection or option matching happens here.
+# Returns the same {results, timings} shape as FILL_FORM_SCRIPT.
+FILL_PLANNED_SCRIPT = """
+const results = {};
+const timings = {};
+for (const [name, index, value] of arguments[0]) {
+    const started = performance.now();
+    const el = document.getElementsByName(name)[index];
+    if (!el) {
+        results[name] = 'missing';
+        continue;
+    }
+    let proto = HTMLInputElement.prototype;
+    if (el instanceof HTMLSelectElement) {
+        proto = HTMLSelectElement.prototype;
+    } else if (el instanceof HTMLTextAreaElement) {
+        proto = HTMLTextAreaElement.prototype;
+    }
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    results[name] = el.value === value ? 'ok' : 'rejected';
+    timings[name] = performance.now() - started;
+}
+return {results: results, timings: timings};
+"""
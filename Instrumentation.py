@@ -0,0 +1,171 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is open-ended)
+BUCKET_BOUNDS_MS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+
+
+class JsonLinesSink:
+    """Append every span as one JSON object per line"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, span):
+        line = json.dumps(span, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class InMemoryAggregator:
+    """Collect span durations per stage and summarize them as histograms"""
+
+    def __init__(self):
+        self.durations = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+
+    def emit(self, span):
+        with self._lock:
+            self.durations.setdefault(span["name"], []).append(span["duration_ms"])
+            if not span.get("ok", True):
+                self.failures[span["name"]] = self.failures.get(span["name"], 0) + 1
+
+    def summary(self):
+        """Per-stage count, failures, mean, p50, p95, max and histogram bucket counts"""
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self.durations.items()}
+            failures = dict(self.failures)
+
+        summary = {}
+        for name, values in durations.items():
+            buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+            for value in values:
+                buckets[_bucket_index(value)] += 1
+            summary[name] = {
+                "count": len(values),
+                "failures": failures.get(name, 0),
+                "mean_ms": sum(values) / len(values),
+                "p50_ms": _percentile(values, 50),
+                "p95_ms": _percentile(values, 95),
+                "max_ms": values[-1],
+                "buckets": buckets,
+            }
+        return summary
+
+    def report(self):
+        """Print the per-stage summary, slowest total time first"""
+        summary = self.summary()
+        print("\n" + "=" * 78)
+        print("⏱️  STAGE TIMINGS")
+        print("=" * 78)
+        print(f"{'stage':<28}{'count':>7}{'fail':>6}{'p50 ms':>11}{'p95 ms':>11}{'max ms':>11}")
+        ordered = sorted(summary.items(), key=lambda item: item[1]["mean_ms"] * item[1]["count"], reverse=True)
+        for name, stats in ordered:
+            print(
+                f"{name:<28}{stats['count']:>7}{stats['failures']:>6}"
+                f"{stats['p50_ms']:>11.1f}{stats['p95_ms']:>11.1f}{stats['max_ms']:>11.1f}"
+            )
+            print(f"{'':<4}{_format_histogram(stats['buckets'])}")
+        print("=" * 78)
+
+
+class Tracer:
+    """Time flow stages and send each finished span to every sink"""
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+
+    @classmethod
+    def from_env(cls):
+        """Tracer writing to $DATA_FILL_TRACE (a .jsonl path) if set, else a no-op tracer"""
+        path = os.environ.get("DATA_FILL_TRACE")
+        return cls([JsonLinesSink(path)] if path else [])
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time the enclosed block; set span["ok"] = False inside to flag a failure"""
+        span = {"name": name, "start": time.time(), "ok": True,
+                "thread": threading.current_thread().name, **attrs}
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span["ok"] = False
+            raise
+        finally:
+            span["duration_ms"] = (time.perf_counter() - started) * 1000
+            self._emit(span)
+
+    def record(self, name, duration_ms, **attrs):
+        """Emit a span measured elsewhere (e.g. inside the page)"""
+        self._emit({"name": name, "start": time.time(), "ok": True, "duration_ms": duration_ms,
+                    "thread": threading.current_thread().name, **attrs})
+
+    def _emit(self, span):
+        for sink in self.sinks:
+            try:
+                sink.emit(span)
+            except Exception as e:
+                print(f"⚠️ Trace sink failed: {e}")
+
+
+def traced(name):
+    """Method decorator: time the call in self.tracer; a False result marks the span failed"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name) as span:
+                result = method(self, *args, **kwargs)
+                if result is False:
+                    span["ok"] = False
+                return result
+        return wrapper
+    return decorator
+
+
+def summarize_file(path):
+    """Aggregate a JSON-lines trace file into an InMemoryAggregator"""
+    aggregator = InMemoryAggregator()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                aggregator.emit(json.loads(line))
+    return aggregator
+
+
+def _bucket_index(value):
+    for index, bound in enumerate(BUCKET_BOUNDS_MS):
+        if value <= bound:
+            return index
+    return len(BUCKET_BOUNDS_MS)
+
+
+def _format_histogram(buckets):
+    """Render non-empty buckets as '<=50ms:3 <=100ms:1 >60000ms:2'"""
+    labels = [f"<={bound}ms" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"]
+    return " ".join(f"{label}:{count}" for label, count in zip(labels, buckets) if count)
+
+
+def _percentile(ordered, pct):
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+if __name__ == "__main__":
+    # python Instrumentation.py trace.jsonl  -> per-stage summary of a recorded batch
+    if len(sys.argv) != 2:
+        print("Usage: python Instrumentation.py <trace.jsonl>")
+        sys.exit(1)
+    summarize_file(sys.argv[1]).report()
@@ -0,0 +1,175 @@
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from AppState import cache_path
+
+# Third-party trackers and analytics the automation never needs. Patterns use
+# Network.setBlockedURLs wildcards. The OneTrust banner (cookielaw.org) is
+# left alone because the flow clicks through it.
+TRACKER_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*newrelic.com*",
+    "*nr-data.net*",
+]
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+
+PROFILE_ROOT = cache_path("profiles", "DATA_FILL_PROFILE_DIR")
+
+
+class LaunchProfile:
+    """How to launch Chrome for one kind of stage
+
+    Covers headless mode, images, fonts, extensions, blocked URLs and an
+    optional persistent user-data directory. Chrome allows only one running
+    instance per user-data directory, so a persistent profile is split into
+    slots (<root>/<name>/slot-N). Each concurrent session claims a free slot
+    and keeps that slot's HTTP cache warm for the next launch. A slot is
+    claimed by locking its slot-N.lock file, so separate processes (the GUI
+    and a batch run) never share one; the OS drops the lock if a process dies.
+    """
+
+    def __init__(self, name, headless=False, block_images=False, block_fonts=False,
+                 disable_extensions=False, blocked_urls=(), persistent=False, extra_args=()):
+        self.name = name
+        self.headless = headless
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.disable_extensions = disable_extensions
+        self.blocked_urls = list(blocked_urls)
+        self.persistent = persistent
+        self.extra_args = list(extra_args)
+        self._slots_lock = threading.Lock()
+        self._slot_locks = {}  # slot -> open lock file held while the slot is in use
+
+    @property
+    def url_block_patterns(self):
+        """Every URL pattern the profile blocks through request interception"""
+        return self.blocked_urls + (FONT_URL_PATTERNS if self.block_fonts else [])
+
+    def chrome_arguments(self, profile_dir=None):
+        """Command-line switches for this profile (shared by both backends)"""
+        args = ["--disable-blink-features=AutomationControlled"]
+        if self.headless:
+            args.append("--headless=new")
+        if self.block_images:
+            args.append("--blink-settings=imagesEnabled=false")
+        if self.disable_extensions:
+            args.extend(["--disable-extensions", "--disable-component-extensions-with-background-pages"])
+        if profile_dir:
+            args.append(f"--user-data-dir={profile_dir}")
+        return args + self.extra_args
+
+    def selenium_options(self, profile_dir=None):
+        # Imported here so the CDP backend can use profiles without selenium
+        from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        for arg in self.chrome_arguments(profile_dir):
+            options.add_argument(arg)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        if self.block_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        return options
+
+    def apply_to_driver(self, driver):
+        """Turn on URL blocking for the driver's current tab (Chrome only)
+
+        The CDP command only covers the current tab, so call it again after
+        switching to a new one.
+        """
+        patterns = self.url_block_patterns
+        if patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def claim_slot(self):
+        """Reserve a persistent profile directory; None for throwaway profiles"""
+        if not self.persistent:
+            return None
+        root = os.path.join(PROFILE_ROOT, self.name)
+        os.makedirs(root, exist_ok=True)
+        with self._slots_lock:
+            slot = 0
+            while True:
+                if slot not in self._slot_locks:
+                    lock_file = _try_lock(os.path.join(root, f"slot-{slot}.lock"))
+                    if lock_file is not None:
+                        self._slot_locks[slot] = lock_file
+                        break
+                slot += 1
+        path = os.path.join(root, f"slot-{slot}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def release_slot(self, profile_dir):
+        if profile_dir is None:
+            return
+        slot = int(os.path.basename(profile_dir).rsplit("-", 1)[1])
+        with self._slots_lock:
+            lock_file = self._slot_locks.pop(slot, None)
+        if lock_file is not None:
+            _unlock(lock_file)
+
+
+def _try_lock(path):
+    """Open path and take an exclusive non-blocking lock; the open file, or None if held"""
+    lock_file = open(path, "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def _unlock(lock_file):
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+    finally:
+        lock_file.close()
+
+# "interactive" is today's headed launch, kept for the OTP stage. "lean"
+# suits stages no human watches: headless, no images, fonts or extensions,
+# trackers blocked, and a warm per-slot disk cache.
+PROFILES = {
+    "interactive": LaunchProfile("interactive"),
+    "lean": LaunchProfile(
+        "lean", headless=True, block_images=True, block_fonts=True, disable_extensions=True,
+        blocked_urls=TRACKER_URL_PATTERNS, persistent=True,
+        extra_args=["--disable-dev-shm-usage", "--no-first-run", "--no-default-browser-check"],
+    ),
+}
+
+
+def get_profile(profile):
+    """A LaunchProfile from a name in PROFILES or a LaunchProfile instance"""
+    if isinstance(profile, LaunchProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown launch profile: {profile}") from None
@@ -1,9 +1,10 @@
 from ExcelReader import ExcelReader
 from ExcelReaderFrontEnd import ExcelReaderFrontEnd
+from RecordCache import RecordCache
 
 if __name__ == "__main__":
-    # Create ExcelReader instance
-    reader = ExcelReader()
+    # Create ExcelReader instance with an on-disk cache of parsed workbooks
+    reader = ExcelReader(cache=RecordCache())
     
     # Create frontend app with ExcelReader reference
     app = ExcelReaderFrontEnd(reader)
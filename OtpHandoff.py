@@ -0,0 +1,144 @@
+import threading
+
+
+def console_notify(label, message):
+    """Default operator notification: a bell and a banner on the console"""
+    print("\a\n" + "=" * 60)
+    print(f"🔔 {label}: {message}")
+    print("=" * 60)
+
+
+class ParkedSession:
+    """A browser session waiting for the operator (OTP step or form review)"""
+
+    def __init__(self, label, automation, on_ready, on_cancel):
+        self.label = label
+        self.automation = automation
+        self.on_ready = on_ready
+        self.on_cancel = on_cancel
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.timed_out = False
+        # Set by ReviewHandoff.confirm() to decide the outcome without the page
+        self.outcome = None
+
+
+class OtpHandoff:
+    """Hand sessions that need a human OTP step to the operator without blocking
+
+    park() registers a session and returns immediately. A watcher thread per
+    parked session blocks on the page's own MutationObserver signal (see
+    BrowserAutomation.watch_for_form_page) - nothing sleeps or polls - and
+    calls on_ready(automation) the moment the form page appears, so the
+    caller can schedule the fill while other sessions keep working. A
+    session still parked after `timeout` seconds is cancelled (on_cancel),
+    so an abandoned page gives its browser back.
+    """
+
+    PARK_MESSAGE = "Complete the email/OTP verification in its browser window"
+    READY_MESSAGE = "Form page detected - filling now"
+    TIMEOUT = 15 * 60
+
+    def __init__(self, notify=console_notify, timeout=None):
+        self.notify = notify
+        # Seconds a session may stay parked; None uses the class TIMEOUT
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+        self._parked = {}
+        self._lock = threading.Lock()
+
+    def park(self, label, automation, on_ready, on_cancel=None):
+        """Park a session until its form page appears, then call on_ready(automation)"""
+        session = ParkedSession(label, automation, on_ready, on_cancel)
+        with self._lock:
+            self._parked[label] = session
+        session.thread = threading.Thread(
+            target=self._watch, args=(session,), name=f"otp-{label}", daemon=True
+        )
+        session.thread.start()
+        self.notify(label, self.PARK_MESSAGE)
+        return session
+
+    def cancel(self, label):
+        """Stop waiting for a parked session; its on_cancel callback is called"""
+        with self._lock:
+            session = self._parked.get(label)
+        if session is not None:
+            session.stop_event.set()
+
+    def cancel_all(self):
+        for label in self.parked:
+            self.cancel(label)
+
+    @property
+    def parked(self):
+        """Labels of the sessions currently waiting on the operator"""
+        with self._lock:
+            return list(self._parked)
+
+    def _wait(self, session):
+        """Block until the session is ready (True) or given up (False)"""
+        return session.automation.watch_for_form_page(stop_event=session.stop_event)
+
+    def _watch(self, session):
+        timer = threading.Timer(self.timeout, self._time_out, args=(session,))
+        timer.daemon = True
+        timer.start()
+        try:
+            ready = self._wait(session)
+        except Exception as e:
+            print(f"⚠️ {session.label}: stopped watching the browser: {e}")
+            ready = False
+        finally:
+            timer.cancel()
+        if session.timed_out and not ready:
+            print(f"⌛ {session.label}: nobody finished the page within {self.timeout:.0f}s; giving up")
+
+        with self._lock:
+            self._parked.pop(session.label, None)
+
+        if ready:
+            self.notify(session.label, self.READY_MESSAGE)
+            session.on_ready(session.automation)
+        elif session.on_cancel is not None:
+            session.on_cancel(session.automation)
+
+
+    @staticmethod
+    def _time_out(session):
+        session.timed_out = True
+        session.stop_event.set()
+
+
+class ReviewHandoff(OtpHandoff):
+    """Keep filled forms open until the operator has reviewed and submitted them
+
+    Same pattern as OtpHandoff: park() returns at once and a watcher thread
+    per session blocks in the page (BrowserAutomation.watch_for_submission)
+    until the form leaves it. on_done(automation, submitted) is then called
+    with True; closing the tab or cancel() gives False. confirm(label,
+    submitted) lets a UI decide without waiting for the page.
+    """
+
+    PARK_MESSAGE = "Review the filled form and submit it in its browser window"
+    READY_MESSAGE = "Form submitted - releasing the session"
+    TIMEOUT = 60 * 60
+
+    def park(self, label, automation, on_done):
+        """Park a filled session until the operator is done, then call on_done(automation, submitted)"""
+        return super().park(
+            label, automation,
+            on_ready=lambda automation: on_done(automation, True),
+            on_cancel=lambda automation: on_done(automation, False),
+        )
+
+    def confirm(self, label, submitted=True):
+        """End the review of a parked session with the operator's verdict"""
+        with self._lock:
+            session = self._parked.get(label)
+        if session is not None:
+            session.outcome = submitted
+            session.stop_event.set()
+
+    def _wait(self, session):
+        submitted = session.automation.watch_for_submission(stop_event=session.stop_event)
+        return submitted if session.outcome is None else session.outcome
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from AppState import ProcessDefault, cache_path
+
+# Per-record states, in the order a record normally moves through them
+# "in-review": the form is filled and waits for the operator to check and submit it
+JOURNAL_STATES = ["queued", "needs-OTP", "filling", "in-review", "filled", "failed"]
+
+
+class ProgressJournal(ProcessDefault):
+    """Append-only JSON-lines log of each record's progress through a batch
+
+    Every state change is one line ({"key", "state", "time", ...}) flushed
+    and fsynced before the call returns, so the journal survives a crash or
+    a dead Chrome. Records are keyed by a hash of their field values, which
+    lets a restarted batch skip the records already filled regardless of
+    their position in the workbook.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = cache_path("journal.jsonl", "DATA_FILL_JOURNAL")
+        self.path = path
+        self._lock = threading.Lock()
+        self.states = self._load()
+
+    @staticmethod
+    def record_key(record):
+        """Stable identity of a record: a hash of its non-empty field values"""
+        values = {key: str(value) for key, value in record.items() if value not in ("", None)}
+        payload = json.dumps(values, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def mark(self, record, state, **attrs):
+        """Append a state change for record"""
+        if state not in JOURNAL_STATES:
+            raise ValueError(f"Unknown journal state: {state}")
+        key = self.record_key(record)
+        line = json.dumps({"key": key, "state": state, "time": time.time(), **attrs}, default=str)
+        with self._lock:
+            self.states[key] = state
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"⚠️ Could not write progress journal: {e}")
+
+    def state(self, record):
+        """Last journaled state of record, or None if it was never seen"""
+        with self._lock:
+            return self.states.get(self.record_key(record))
+
+    def is_filled(self, record):
+        return self.state(record) == "filled"
+
+    def pending_indexes(self, records):
+        """Indexes of the records that still need filling"""
+        return [index for index, record in enumerate(records) if not self.is_filled(record)]
+
+    def forget(self, records):
+        """Drop records from the journal so the next batch fills them again"""
+        with self._lock:
+            for record in records:
+                self.states.pop(self.record_key(record), None)
+            self._rewrite()
+
+    def clear(self):
+        with self._lock:
+            self.states = {}
+            self._rewrite()
+
+    def _load(self):
+        """Replay the journal; the last line per key wins, torn lines are ignored"""
+        states = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        states[entry["key"]] = entry["state"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return states
+
+    def _rewrite(self):
+        """Replace the log with one line per remaining record (caller holds the lock)"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+                for key, state in self.states.items():
+                    f.write(json.dumps({"key": key, "state": state, "time": time.time()}) + "\n")
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            print(f"⚠️ Could not rewrite progress journal: {e}")
@@ -0,0 +1,180 @@
+import customtkinter as ctk
+
+# Columns shown per record: (record key, heading, width in pixels)
+BROWSER_COLUMNS = [
+    ("surname", "Surname", 130),
+    ("other_name", "Other Name", 130),
+    ("P_num", "Passport", 110),
+    ("dob", "Date of birth", 110),
+    ("email", "Email", 190),
+]
+
+
+class RecordBrowser(ctk.CTkFrame):
+    """Scrollable, editable table over a large record list that only renders visible rows
+
+    A fixed pool of visible_rows x columns widgets is created once. Scrolling
+    only moves `first` and rewrites the text of pooled cells whose value
+    changed, so widget count and redraw cost stay the same whether 10 or
+    50,000 records are loaded. Cell edits are written back through
+    on_edit(index, key, value) on Enter, on focus-out, and before the
+    visible rows change. Clicking a row number calls on_select(index).
+    """
+
+    def __init__(self, parent, get_records, colors, on_select, on_edit,
+                 columns=BROWSER_COLUMNS, visible_rows=16):
+        super().__init__(parent, fg_color=colors['surface_variant'], corner_radius=15)
+        self.get_records = get_records  # callable, so a newly loaded batch is picked up
+        self.colors = colors
+        self.on_select = on_select
+        self.on_edit = on_edit
+        self.columns = columns
+        self.visible_rows = visible_rows
+        self.first = 0
+        self.current_index = None
+        self.index_buttons = []
+        self.cells = []   # [row][column] -> CTkEntry
+        self._shown = []  # [row][column] -> text currently in the cell
+        self._row_looks = []  # [row] -> (label, selected) last applied to the row, to skip no-op configures
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        table = ctk.CTkFrame(self, fg_color="transparent")
+        table.pack(side="left", fill="both", expand=True, padx=(15, 5), pady=15)
+
+        heading_font = ctk.CTkFont(family="Arial", size=12, weight="bold")
+        cell_font = ctk.CTkFont(family="Arial", size=12)
+        ctk.CTkLabel(table, text="#", font=heading_font, width=60,
+                     text_color=self.colors['text_secondary']).grid(row=0, column=0, padx=2, pady=(0, 6))
+        for column, (_, heading, width) in enumerate(self.columns, 1):
+            ctk.CTkLabel(table, text=heading, font=heading_font, width=width, anchor="w",
+                         text_color=self.colors['text_secondary']).grid(row=0, column=column, padx=2, pady=(0, 6))
+
+        for row in range(self.visible_rows):
+            button = ctk.CTkButton(
+                table, text="", width=60, height=28, corner_radius=6, font=cell_font,
+                fg_color=self.colors['secondary'], hover_color=self.colors['accent'],
+                command=lambda row=row: self._select_row(row)
+            )
+            button.grid(row=row + 1, column=0, padx=2, pady=2)
+            self.index_buttons.append(button)
+
+            cells = []
+            for column, (key, _, width) in enumerate(self.columns, 1):
+                entry = ctk.CTkEntry(table, width=width, height=28, corner_radius=6, border_width=0, font=cell_font)
+                entry.grid(row=row + 1, column=column, padx=2, pady=2)
+                entry.bind("<Return>", lambda event: self.commit_edits())
+                entry.bind("<FocusOut>", lambda event: self.commit_edits())
+                cells.append(entry)
+            self.cells.append(cells)
+            self._shown.append([""] * len(self.columns))
+            self._row_looks.append(None)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar,
+                                          button_color=self.colors['accent'],
+                                          button_hover_color=self.colors['primary'])
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 10), pady=15)
+
+        for widget in [self, table] + self.index_buttons + [cell for row in self.cells for cell in row]:
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", lambda event: self.scroll_by(-3))
+            widget.bind("<Button-5>", lambda event: self.scroll_by(3))
+
+    @property
+    def record_count(self):
+        return len(self.get_records())
+
+    def refresh(self, current_index=None):
+        """Redraw the visible rows, scrolling so current_index (if given) is on screen"""
+        self.commit_edits()
+        if current_index is not None:
+            self.current_index = current_index
+            if current_index < self.first:
+                self.first = current_index
+            elif current_index >= self.first + self.visible_rows:
+                self.first = current_index - self.visible_rows + 1
+        self._render()
+
+    def scroll_to(self, first):
+        self.commit_edits()
+        self.first = first
+        self._render()
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+
+    def commit_edits(self):
+        """Write every visible cell whose text differs from what was rendered back to its record"""
+        records = self.get_records()
+        for row, cells in enumerate(self.cells):
+            index = self.first + row
+            if index >= len(records):
+                break
+            for column, entry in enumerate(cells):
+                value = entry.get()
+                if value != self._shown[row][column]:
+                    self._shown[row][column] = value
+                    self.on_edit(index, self.columns[column][0], value)
+
+    def _render(self):
+        records = self.get_records()
+        count = len(records)
+        self.first = max(0, min(self.first, count - self.visible_rows))
+
+        for row, cells in enumerate(self.cells):
+            index = self.first + row
+            filled = index < count
+            looks = (index + 1, index == self.current_index) if filled else None
+            if looks != self._row_looks[row]:
+                self._apply_row_looks(row, looks)
+
+            record = records[index] if filled else {}
+            for column, entry in enumerate(cells):
+                text = str(record.get(self.columns[column][0], ""))
+                if entry.get() != text:
+                    entry.delete(0, "end")
+                    entry.insert(0, text)
+                self._shown[row][column] = text
+
+        if count:
+            self.scrollbar.set(self.first / count, min(1.0, (self.first + self.visible_rows) / count))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _apply_row_looks(self, row, looks):
+        """Number, highlight and enable/disable a pooled row; looks=None blanks it"""
+        was_filled = self._row_looks[row] is not None
+        self._row_looks[row] = looks
+        button = self.index_buttons[row]
+        if looks is None:
+            for entry in self.cells[row]:
+                entry.delete(0, "end")
+                entry.configure(state="disabled")
+            button.configure(text="", state="disabled", fg_color=self.colors['surface_variant'])
+            return
+        if not was_filled:
+            for entry in self.cells[row]:
+                entry.configure(state="normal")
+        number, selected = looks
+        button.configure(
+            text=str(number), state="normal",
+            fg_color=self.colors['primary'] if selected else self.colors['secondary']
+        )
+
+    def _select_row(self, row):
+        index = self.first + row
+        if index < self.record_count:
+            self.commit_edits()
+            self.on_select(index)
+
+    def _on_scrollbar(self, action, *args):
+        count = self.record_count
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * count))
+        elif action == "scroll":
+            amount = int(args[0])
+            self.scroll_by(amount * self.visible_rows if len(args) > 1 and args[1] == "pages" else amount)
+
+    def _on_mousewheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
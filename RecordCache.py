@@ -0,0 +1,166 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from AppState import cache_path
+from RecordStore import RecordStore
+
+
+class RecordCache:
+    """On-disk cache of parsed workbook records
+
+    Entries are gzip-compressed columnar JSON (no pickle), named after the
+    workbook's content hash. An index maps path/size/mtime to that hash so an
+    unchanged file is a hit without re-hashing it. The least recently used
+    entries are evicted once the cache grows past max_bytes.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir=None, max_bytes=200 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = cache_path("records", "DATA_FILL_CACHE_DIR")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index = self._load_index()
+        # Hashes computed during this session, so a miss followed by put() hashes once
+        self._hash_memo = {}
+
+    def get(self, file_path, variant=""):
+        """Return the cached records for file_path, or None on a miss"""
+        try:
+            stat = os.stat(file_path)
+            content_hash = self._content_hash(file_path, stat)
+            entry_name = self._entry_name(content_hash, variant)
+            entry = self.index["entries"].get(entry_name)
+            if entry is None or not os.path.exists(self._entry_path(entry_name)):
+                return None
+
+            records = self._read_entry(entry_name)
+            entry.update(
+                path=os.path.abspath(file_path),
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                last_used=time.time()
+            )
+            self._save_index()
+            print(f"⚡ Cache hit for {file_path}")
+            return records
+        except Exception as e:
+            print(f"ℹ️ Cache lookup failed for {file_path}: {e}")
+            return None
+
+    def put(self, file_path, records, field_keys, variant=""):
+        """Store records for file_path and evict old entries past the size cap"""
+        try:
+            stat = os.stat(file_path)
+            content_hash = self._content_hash(file_path, stat)
+            entry_name = self._entry_name(content_hash, variant)
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = {
+                "keys": list(field_keys),
+                "columns": [
+                    records.column(key) if isinstance(records, RecordStore)
+                    else [record.get(key, "") for record in records]
+                    for key in field_keys
+                ],
+            }
+            tmp_path = self._entry_path(entry_name) + ".tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self._entry_path(entry_name))
+
+            self.index["entries"][entry_name] = {
+                "path": os.path.abspath(file_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": content_hash,
+                "variant": variant,
+                "bytes": os.path.getsize(self._entry_path(entry_name)),
+                "last_used": time.time(),
+            }
+            self._evict()
+            self._save_index()
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not cache records for {file_path}: {e}")
+            return False
+
+    def clear(self):
+        """Remove every cached entry"""
+        for entry_name in list(self.index["entries"]):
+            self._remove_entry(entry_name)
+        self._save_index()
+
+    @staticmethod
+    def file_hash(file_path, chunk_size=1024 * 1024):
+        """BLAKE2b digest of the file contents"""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _content_hash(self, file_path, stat):
+        """Reuse the content hash recorded for an unchanged path/size/mtime, else hash the file"""
+        path = os.path.abspath(file_path)
+        memo_key = (path, stat.st_size, stat.st_mtime_ns)
+        if memo_key in self._hash_memo:
+            return self._hash_memo[memo_key]
+        for entry in self.index["entries"].values():
+            if (entry["path"] == path and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns):
+                return entry["hash"]
+        content_hash = self.file_hash(file_path)
+        self._hash_memo[memo_key] = content_hash
+        return content_hash
+
+    def _entry_name(self, content_hash, variant):
+        variant_tag = hashlib.blake2b(variant.encode("utf-8"), digest_size=4).hexdigest()
+        return f"{content_hash}-{variant_tag}.json.gz"
+
+    def _entry_path(self, entry_name):
+        return os.path.join(self.cache_dir, entry_name)
+
+    def _read_entry(self, entry_name):
+        with gzip.open(self._entry_path(entry_name), "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        keys = payload["keys"]
+        return RecordStore.from_columns(keys, payload["columns"])
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = self.index["entries"]
+        total = sum(entry["bytes"] for entry in entries.values())
+        for entry_name in sorted(entries, key=lambda name: entries[name]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[entry_name]["bytes"]
+            self._remove_entry(entry_name)
+
+    def _remove_entry(self, entry_name):
+        self.index["entries"].pop(entry_name, None)
+        try:
+            os.remove(self._entry_path(entry_name))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index.get("entries"), dict):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"entries": {}}
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(index_path + ".tmp", index_path)
@@ -0,0 +1,208 @@
+from array import array
+from collections.abc import MutableMapping
+
+# Fields with a handful of distinct values, stored as small integer codes
+CATEGORICAL_FIELDS = ("sex", "marital", "nationality", "cob")
+
+
+class CategoricalColumn:
+    """Values of an enum-like field as integer codes into a list of distinct values"""
+
+    __slots__ = ("codes", "categories", "_lookup")
+
+    def __init__(self):
+        self.codes = array("I")
+        self.categories = [""]
+        self._lookup = {"": 0}
+
+    def append(self, value):
+        self.codes.append(self._encode(value))
+
+    def get(self, index):
+        return self.categories[self.codes[index]]
+
+    def set(self, index, value):
+        self.codes[index] = self._encode(value)
+
+    def values(self):
+        categories = self.categories
+        return [categories[code] for code in self.codes]
+
+    def _encode(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+
+class TextColumn:
+    """Free-text values packed into one UTF-8 buffer with an array of end offsets
+
+    A str object per cell costs ~50 bytes before its first character; here a
+    cell costs its encoded length plus 4 bytes. The buffer is append-only, so
+    values assigned after loading (GUI edits) and non-str values are kept in
+    the small `edits` dict, which takes precedence over the buffer.
+    """
+
+    __slots__ = ("data", "ends", "edits")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.ends = array("I")
+        self.edits = {}
+
+    def append(self, value):
+        if isinstance(value, str):
+            self.data += value.encode("utf-8")
+        else:
+            self.edits[len(self.ends)] = value
+        self.ends.append(len(self.data))
+
+    def get(self, index):
+        if self.edits and index in self.edits:
+            return self.edits[index]
+        start = self.ends[index - 1] if index else 0
+        return self.data[start:self.ends[index]].decode("utf-8")
+
+    def set(self, index, value):
+        self.edits[index] = value
+
+    def values(self):
+        return [self.get(index) for index in range(len(self.ends))]
+
+
+class RecordStore:
+    """Column-per-field store for a batch of applicant records
+
+    The schema (field_keys) is fixed. Categorical fields are CategoricalColumns,
+    so "Sri Lankan" is stored once for the whole batch instead of once per
+    applicant; every other field is a TextColumn. Indexing returns a
+    RecordRow, a dict-like view that reads and writes the columns in place,
+    so code written for a list of record dicts (records[i][key] = value,
+    .get(), .items(), dict(record)) keeps working without a dict per
+    applicant.
+    """
+
+    def __init__(self, field_keys, categorical=CATEGORICAL_FIELDS):
+        self.field_keys = list(field_keys)
+        self._fields = frozenset(self.field_keys)
+        self._length = 0
+        self._columns = {
+            key: CategoricalColumn() if key in categorical else TextColumn()
+            for key in self.field_keys
+        }
+
+    @classmethod
+    def from_records(cls, field_keys, records):
+        """Store built from an iterable of record dicts (missing fields become "")"""
+        store = cls(field_keys)
+        store.extend(records)
+        return store
+
+    @classmethod
+    def from_columns(cls, field_keys, columns):
+        """Store built from one list of values per field, in field_keys order"""
+        store = cls(field_keys)
+        columns = [list(column) for column in columns]
+        store._length = len(columns[0]) if columns else 0
+        for key, values in zip(store.field_keys, columns):
+            if len(values) != store._length:
+                raise ValueError("Columns have different lengths")
+            column = store._columns[key]
+            for value in values:
+                column.append(value)
+        return store
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RecordRow(self, i) for i in range(*index.indices(self._length))]
+        return RecordRow(self, self._check_index(index))
+
+    def __setitem__(self, index, record):
+        """Replace the fields of one record from a dict"""
+        index = self._check_index(index)
+        for key in self.field_keys:
+            value = record.get(key, "")
+            if self.get_value(index, key) != value:
+                self.set_value(index, key, value)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield RecordRow(self, index)
+
+    def __repr__(self):
+        return f"<RecordStore {self._length} record(s) x {len(self.field_keys)} fields>"
+
+    def append(self, record):
+        for key, column in self._columns.items():
+            column.append(record.get(key, ""))
+        self._length += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def get_value(self, index, key):
+        return self._columns[key].get(index)
+
+    def set_value(self, index, key, value):
+        self._columns[key].set(index, value)
+
+    def column(self, key):
+        """All values of one field, decoded, as a list"""
+        return self._columns[key].values()
+
+    def categories(self, key):
+        """Distinct values seen so far in a categorical field"""
+        return list(self._columns[key].categories)
+
+    def _check_index(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return index
+
+
+class RecordRow(MutableMapping):
+    """dict-like view of one record in a RecordStore
+
+    Reads and writes go straight to the store's columns. The keys are the
+    store's fixed schema: assigning an unknown key raises KeyError, and
+    fields cannot be deleted. dict(row) makes an independent copy.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        if key not in self.store._fields:
+            raise KeyError(key)
+        return self.store.get_value(self.index, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.store._fields:
+            raise KeyError(f"{key!r} is not a field of this record store")
+        self.store.set_value(self.index, key, value)
+
+    def __delitem__(self, key):
+        raise TypeError("Record fields cannot be deleted; assign \"\" to clear one")
+
+    def __iter__(self):
+        return iter(self.store.field_keys)
+
+    def __len__(self):
+        return len(self.store.field_keys)
+
+    def __contains__(self, key):
+        return key in self.store._fields
+
+    def __repr__(self):
+        return repr(dict(self))
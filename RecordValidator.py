@@ -0,0 +1,172 @@
+import os
+from html.parser import HTMLParser
+
+from FieldTransforms import build_date, build_phone
+from LazyImports import lazy_import
+
+pd = lazy_import("pandas")
+
+# Saved copy of the applicant form; FORM_SCHEMA is derived from it
+FORM_PAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.html")
+
+# Field rules of the applicant form: "required" fields must be non-empty,
+# "kind" selects a format check and "options" lists the values a dropdown
+# accepts. Used when index.html is missing or has no form fields.
+FALLBACK_FORM_SCHEMA = {
+    "surname": {"required": True},
+    "other_name": {"required": True},
+    "dob": {"required": True, "kind": "date"},
+    "sex": {"required": True, "options": ["M", "F"]},
+    "P_num": {"required": True},
+    "P_exp": {"required": True, "kind": "date"},
+    "nationality": {"required": True},
+    "marital": {"options": ["Single", "Married"]},
+    "email": {"required": True, "kind": "email"},
+    "phone1": {"required": True, "kind": "tel"},
+    "phone2": {"kind": "tel"},
+    "address": {"required": True},
+}
+
+
+class _FormSchemaParser(HTMLParser):
+    """Collect required flags, input types and option values per named control"""
+
+    def __init__(self):
+        super().__init__()
+        self.schema = {}
+        self._select = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ("input", "select", "textarea") and attrs.get("name"):
+            rules = self.schema.setdefault(attrs["name"], {})
+            if "required" in attrs:
+                rules["required"] = True
+            if attrs.get("type") in ("date", "email", "tel"):
+                rules["kind"] = attrs["type"]
+            self._select = rules if tag == "select" else None
+        elif tag == "option" and self._select is not None and attrs.get("value"):
+            self._select.setdefault("options", []).append(attrs["value"])
+
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._select = None
+
+
+def schema_from_html(path, skip=("user_type", "num_applicants")):
+    """Derive a FORM_SCHEMA-style dict from a saved copy of the form page"""
+    parser = _FormSchemaParser()
+    with open(path, encoding="utf-8") as f:
+        parser.feed(f.read())
+    return {name: rules for name, rules in parser.schema.items() if name not in skip and rules}
+
+
+def load_form_schema(path=FORM_PAGE_PATH):
+    """FORM_SCHEMA from the saved form page, or FALLBACK_FORM_SCHEMA if it cannot be read"""
+    try:
+        schema = schema_from_html(path)
+    except (OSError, UnicodeDecodeError):
+        schema = None
+    return schema or dict(FALLBACK_FORM_SCHEMA)
+
+
+FORM_SCHEMA = load_form_schema()
+
+# Fields a filled form must contain before a record counts as filled
+REQUIRED_FIELDS = [name for name, rules in FORM_SCHEMA.items() if rules.get("required")]
+
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+# Phones arrive digit-only from FieldTransforms, optionally with a leading +
+PHONE_PATTERN = r"^\+?\d{7,15}$"
+
+
+class ValidationReport:
+    """Problems found per record, plus the indexes that passed"""
+
+    def __init__(self, count, problems, numbers=None):
+        self.count = count
+        self.problems = problems  # {record index: ["field: problem", ...]}
+        # Record number shown for each index (e.g. its place in the loaded batch); default index + 1
+        self.numbers = numbers
+
+    @property
+    def valid_indexes(self):
+        return [index for index in range(self.count) if index not in self.problems]
+
+    @property
+    def rejected_count(self):
+        return len(self.problems)
+
+    def describe(self, limit=10):
+        """Multi-line summary naming the first `limit` rejected records"""
+        lines = [f"{self.count - self.rejected_count}/{self.count} record(s) passed validation"]
+        for index in sorted(self.problems)[:limit]:
+            number = self.numbers[index] if self.numbers is not None else index + 1
+            lines.append(f"Record {number}: {', '.join(self.problems[index])}")
+        if self.rejected_count > limit:
+            lines.append(f"... and {self.rejected_count - limit} more")
+        return "\n".join(lines)
+
+    def print_report(self):
+        icon = "✅" if not self.problems else "⚠️"
+        print(f"{icon} {self.describe()}")
+
+
+class RecordValidator:
+    """Check a whole batch of records against the form schema before any browser starts
+
+    Every rule runs once per field over a column of all records (pandas
+    string operations), so validating thousands of applicants costs a few
+    vectorized passes rather than a Python loop per cell.
+    """
+
+    def __init__(self, schema):
+        self.schema = dict(schema)
+        # Accept the same spellings the loader and the fill step accept
+        self._normalize_date = build_date()
+        self._normalize_phone = build_phone()
+
+    def validate(self, records, numbers=None):
+        """Return a ValidationReport for a list of record dicts
+
+        numbers gives the record number to report for each record, when
+        records is a subset of the loaded batch.
+        """
+        records = list(records)
+        frame = pd.DataFrame(records, columns=list(self.schema), dtype=object)
+        frame = frame.fillna("").astype(str).apply(lambda column: column.str.strip())
+
+        problems = {}
+        for field, rules in self.schema.items():
+            column = frame[field]
+            empty = column == ""
+            if rules.get("required"):
+                self._flag(problems, empty, f"{field}: missing")
+
+            kind = rules.get("kind")
+            if kind == "date":
+                parsed = pd.to_datetime(self._normalize_date(column), format="%Y-%m-%d", errors="coerce")
+                self._flag(problems, ~empty & parsed.isna(), f"{field}: not a date")
+            elif kind == "email":
+                self._flag(problems, ~empty & ~column.str.match(EMAIL_PATTERN), f"{field}: invalid email")
+            elif kind == "tel":
+                self._flag(problems, ~empty & ~self._normalize_phone(column).str.match(PHONE_PATTERN), f"{field}: invalid phone")
+
+            if "options" in rules:
+                options = [option.lower() for option in rules["options"]]
+                self._flag(problems, ~empty & ~column.str.lower().isin(options), f"{field}: unknown option")
+        return ValidationReport(len(records), problems, numbers)
+
+    def filter(self, records, numbers=None):
+        """Split records into (valid records, ValidationReport)"""
+        records = list(records)
+        report = self.validate(records, numbers)
+        return [records[index] for index in report.valid_indexes], report
+
+    @staticmethod
+    def _flag(problems, mask, message):
+        for index in mask[mask].index:
+            problems.setdefault(index, []).append(message)
+
+
+DEFAULT_VALIDATOR = RecordValidator(FORM_SCHEMA)
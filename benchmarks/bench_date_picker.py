@@ -0,0 +1,112 @@
+"""Date picker per-click latency and widget churn: pooled DatePicker vs rebuild
+
+Opens the shared DatePicker, then clicks "next month" N times and reports
+the time per click (including the Tk redraw) and how many new Tk widgets
+each click created. The "rebuild" line is the previous behaviour: on every
+click, destroy the day grid and build a new one. It also times the first
+open against later opens, where the popup is only shown again. Needs a
+display (or xvfb-run).
+
+Run from the repository root:
+    python benchmarks/bench_date_picker.py [clicks]
+"""
+import calendar
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import customtkinter as ctk
+from DatePicker import DatePicker
+
+COLORS = {
+    'primary': '#1f538d', 'secondary': '#14375e', 'accent': '#36719f',
+    'surface': '#212121', 'surface_variant': '#2d2d2d',
+    'text_primary': '#ffffff', 'text_secondary': '#b3b3b3', 'success': '#4caf50',
+}
+
+
+def widget_paths(widget):
+    """Tk path names of widget and all its descendants"""
+    paths = {str(widget)}
+    for child in widget.winfo_children():
+        paths |= widget_paths(child)
+    return paths
+
+
+def rebuild_grid(picker, frame, buttons):
+    """What every click used to do: destroy the day widgets and create new ones"""
+    for button in buttons:
+        button.destroy()
+    buttons.clear()
+    for week_num, week in enumerate(calendar.monthcalendar(picker.current_year, picker.current_month), 1):
+        for day_num, day in enumerate(week):
+            if day == 0:
+                widget = ctk.CTkLabel(frame, text="", width=45, height=40, fg_color="transparent")
+            else:
+                widget = ctk.CTkButton(
+                    frame, text=str(day), width=45, height=40,
+                    font=ctk.CTkFont(family="Arial", size=13),
+                    fg_color=COLORS['primary'] if day == picker.selected_day else COLORS['surface'],
+                    hover_color=COLORS['accent'], text_color="white"
+                )
+            widget.grid(row=week_num, column=day_num, padx=3, pady=3, sticky="nsew")
+            buttons.append(widget)
+
+
+def measure(root, picker, click, clicks):
+    """([ms per click], [new widgets per click]) over `clicks` calls of click()"""
+    times, churn = [], []
+    for _ in range(clicks):
+        before = widget_paths(picker.window)
+        started = time.perf_counter()
+        click()
+        root.update_idletasks()
+        times.append((time.perf_counter() - started) * 1000)
+        churn.append(len(widget_paths(picker.window) - before))
+    return times, churn
+
+
+def report(name, times, churn):
+    print(f"    {name:<10} median {statistics.median(times):6.2f} ms   max {max(times):6.2f} ms   "
+          f"{statistics.mean(churn):5.1f} new widgets/click")
+
+
+if __name__ == "__main__":
+    clicks = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("ℹ️ No display; run under xvfb-run")
+        sys.exit(0)
+
+    root = ctk.CTk()
+    root.geometry("900x700")
+    root.update()
+    target = ctk.CTkEntry(root)
+    target.insert(0, "1990-01-31")
+    picker = DatePicker(root, COLORS)
+
+    opens = []
+    for _ in range(5):
+        started = time.perf_counter()
+        picker.open(target)
+        root.update_idletasks()
+        opens.append((time.perf_counter() - started) * 1000)
+        picker.close()
+    print(f"📊 Open: first {opens[0]:.1f} ms, reopen median {statistics.median(opens[1:]):.1f} ms")
+
+    picker.open(target)
+    print(f"📊 {clicks} month changes")
+    report("pooled", *measure(root, picker, picker.next_month, clicks))
+
+    frame = picker.day_buttons[0].master
+    for button in picker.day_buttons:
+        button.grid_remove()
+    rebuilt = []
+
+    def rebuild_click():
+        picker.current_month = picker.current_month % 12 + 1
+        rebuild_grid(picker, frame, rebuilt)
+
+    report("rebuild", *measure(root, picker, rebuild_click, clicks))
+    root.destroy()
@@ -0,0 +1,211 @@
+"""Offline end-to-end fill benchmark against the bundled index.html
+
+Serves the repository over a local HTTP server, drives headless Chrome
+through BrowserAutomation.handle_first_form + insert_data for N synthetic
+applicants and reports per-form latency (p50/p95), fields/second and the
+browser's resident memory. Needs no network access, only Chrome and a
+chromedriver that DriverLocator can find (PATH or CHROMEDRIVER_PATH).
+
+--backend=cdp runs the same stages through AsyncBrowserAutomation instead
+(Chrome on PATH or CHROME_PATH, no chromedriver needed).
+
+Run from the repository root:
+    python benchmarks/bench_fill_offline.py [applicant_count] [--verbose] [--backend=selenium|cdp]
+"""
+import asyncio
+import contextlib
+import functools
+import io
+import os
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+from AsyncBrowserAutomation import AsyncBrowser, AsyncBrowserAutomation, backend_from_env
+from BrowserAutomation import BrowserAutomation
+from DriverLocator import DriverLocator
+from Instrumentation import InMemoryAggregator, Tracer
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    """Serve the repository root on a free localhost port"""
+    handler = functools.partial(QuietHandler, directory=REPO_ROOT)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_headless_driver():
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-dev-shm-usage")
+    locator = DriverLocator.default()
+    if locator.chrome():
+        options.binary_location = locator.chrome()
+    return webdriver.Chrome(service=Service(locator.chromedriver()), options=options)
+
+
+def synthetic_applicant(i):
+    return {
+        "surname": f"Surname{i}",
+        "other_name": "Other",
+        "dob": f"1990-{1 + i % 12:02d}-{1 + i % 28:02d} 00:00:00",
+        "P_num": f"N{i:07d}",
+        "P_exp": "2030-06-01 00:00:00",
+        "sex": "M" if i % 2 else "F",
+        "nationality": "Sri Lankan",
+        "email": f"user{i}@example.com",
+        "nic": f"{199000000000 + i}",
+        "phone1": f"0771{i:06d}",
+        "phone2": "",
+        "pob": "Colombo",
+        "cob": "Sri Lanka",
+        "marital": "Single" if i % 3 else "Married",
+        "address": f"{i} Main Street, Colombo",
+        "d_name": "",
+        "d_passport": "",
+        "dnic": "",
+    }
+
+
+def browser_rss_mb(root_pid):
+    """Resident memory of a process and all its descendants, from /proc (Linux)"""
+    children = {}
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(pid))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(applicants, verbose=False):
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    timings = InMemoryAggregator()
+    automation = BrowserAutomation(tracer=Tracer([timings]))
+    automation.driver = create_headless_driver()
+
+    latencies = []
+    fields_filled = 0
+    fill_seconds = 0.0
+    peak_rss = 0.0
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        for i in range(applicants):
+            automation.driver.get(url)
+            record = synthetic_applicant(i)
+            with output:
+                started = time.perf_counter()
+                first_form_ok = automation.handle_first_form()
+                fill_started = time.perf_counter()
+                fill_ok = automation.insert_data(record)
+                finished = time.perf_counter()
+            if not (first_form_ok and fill_ok):
+                print(f"❌ Applicant {i + 1} failed: {automation.fill_results}")
+                continue
+            latencies.append(finished - started)
+            fill_seconds += finished - fill_started
+            fields_filled += sum(1 for status in automation.fill_results.values() if status == "ok")
+            peak_rss = max(peak_rss, browser_rss_mb(automation.driver.service.process.pid))
+    finally:
+        automation.driver.quit()
+        server.shutdown()
+
+    print_results(applicants, latencies, fields_filled, fill_seconds, peak_rss, timings)
+
+
+async def run_cdp(applicants, verbose=False):
+    """Same measurements through the asyncio CDP backend (one tab per applicant)"""
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    timings = InMemoryAggregator()
+    browser = await AsyncBrowser.launch(extra_args=["--no-sandbox", "--disable-gpu"])
+
+    latencies = []
+    fields_filled = 0
+    fill_seconds = 0.0
+    peak_rss = 0.0
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        for i in range(applicants):
+            automation = AsyncBrowserAutomation(browser, tracer=Tracer([timings]))
+            with output:
+                await automation.setup_browser()
+                await automation.page.goto(url, automation.timeouts["page_load"])
+                started = time.perf_counter()
+                first_form_ok = await automation.handle_first_form()
+                fill_started = time.perf_counter()
+                fill_ok = await automation.insert_data(synthetic_applicant(i))
+                finished = time.perf_counter()
+                await automation.close_browser()
+            if not (first_form_ok and fill_ok):
+                print(f"❌ Applicant {i + 1} failed: {automation.fill_results}")
+                continue
+            latencies.append(finished - started)
+            fill_seconds += finished - fill_started
+            fields_filled += sum(1 for status in automation.fill_results.values() if status == "ok")
+            peak_rss = max(peak_rss, browser_rss_mb(browser.process.pid))
+    finally:
+        await browser.close()
+        server.shutdown()
+
+    print_results(applicants, latencies, fields_filled, fill_seconds, peak_rss, timings)
+
+
+def print_results(applicants, latencies, fields_filled, fill_seconds, peak_rss, timings):
+    if not latencies:
+        print("❌ No form was filled")
+        return
+    print(f"📊 {len(latencies)}/{applicants} forms filled")
+    print(f"Per-form latency  p50 {percentile(latencies, 50) * 1000:8.1f} ms   "
+          f"p95 {percentile(latencies, 95) * 1000:8.1f} ms")
+    print(f"Fill throughput   {fields_filled / fill_seconds:8.1f} fields/s")
+    print(f"Browser RSS peak  {peak_rss:8.1f} MB (all browser processes)")
+    timings.report()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    backends = [arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--backend=")]
+    backend = backends[-1] if backends else backend_from_env()
+    applicants = int(args[0]) if args else 20
+    if backend == "cdp":
+        asyncio.run(run_cdp(applicants, verbose="--verbose" in sys.argv))
+    else:
+        run(applicants, verbose="--verbose" in sys.argv)
@@ -0,0 +1,83 @@
+"""Chrome startup time and memory per session for each LaunchProfile
+
+Launches N sessions per profile one after another, loads the bundled
+index.html from a local server in each, and reports launch time (p50/p95)
+and resident memory per session (chromedriver + Chrome processes). The
+default comparison is today's "interactive" launch against "lean". The
+interactive profile is headed and needs a display (or xvfb-run).
+
+Run from the repository root:
+    python benchmarks/bench_launch_profiles.py [sessions] [profile ...]
+"""
+import os
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+from DriverLocator import DriverLocator
+from LaunchProfiles import get_profile
+from bench_fill_offline import browser_rss_mb, percentile, start_server
+
+
+def launch(profile):
+    """Start a session for profile; returns (driver, profile_dir)"""
+    locator = DriverLocator.default()
+    service = Service(locator.chromedriver())
+    profile_dir = profile.claim_slot()
+    options = profile.selenium_options(profile_dir)
+    if locator.chrome():
+        options.binary_location = locator.chrome()
+    # Needed to run Chrome as root inside containers
+    options.add_argument("--no-sandbox")
+    try:
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception:
+        profile.release_slot(profile_dir)
+        raise
+    profile.apply_to_driver(driver)
+    return driver, profile_dir
+
+
+def measure(profile, sessions, url):
+    launch_seconds = []
+    rss = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        driver, profile_dir = launch(profile)
+        try:
+            driver.get(url)
+            launch_seconds.append(time.perf_counter() - started)
+            rss.append(browser_rss_mb(driver.service.process.pid))
+        finally:
+            driver.quit()
+            profile.release_slot(profile_dir)
+    return launch_seconds, rss
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sessions = int(args.pop(0)) if args and args[0].isdigit() else 5
+    names = args or ["interactive", "lean"]
+
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    print(f"📊 {sessions} session(s) per profile, launch + load of index.html")
+    print(f"{'profile':<14}{'p50 launch s':>14}{'p95 launch s':>14}{'RSS MB/session':>16}")
+    try:
+        for name in names:
+            try:
+                launch_seconds, rss = measure(get_profile(name), sessions, url)
+            except Exception as e:
+                print(f"{name:<14} ❌ {e.__class__.__name__}: {str(e).splitlines()[0] if str(e) else ''}")
+                continue
+            print(
+                f"{name:<14}{percentile(launch_seconds, 50):>14.2f}{percentile(launch_seconds, 95):>14.2f}"
+                f"{sum(rss) / len(rss):>16.1f}"
+            )
+    finally:
+        server.shutdown()
@@ -0,0 +1,60 @@
+"""Memory per record: list of record dicts vs the columnar RecordStore
+
+Builds the same batch both ways from ExcelReader's vectorized extraction
+and measures with tracemalloc the memory each keeps allocated, cell
+strings included. It also times reading one field from every record and
+switching the form to every record (raw_data.update(records[i])).
+
+Run from the repository root:
+    python benchmarks/bench_record_store.py [applicant_count]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+from ExcelReader import ExcelReader
+from RecordStore import RecordStore
+from bench_read_data import build_sheet
+
+
+def retained_bytes(build):
+    """(result, bytes still allocated by build() once it returns)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def time_ms(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    applicants = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    reader = ExcelReader()
+    reader.data_frame = build_sheet(applicants)
+    # Warm-up run, so pandas' own caches are not counted against either layout
+    count = len(list(reader.iter_records()))
+
+    dicts, dict_bytes = retained_bytes(lambda: list(reader.iter_records()))
+    store, store_bytes = retained_bytes(lambda: RecordStore.from_records(reader.field_keys, reader.iter_records()))
+
+    print(f"📊 {count} applicants x {len(reader.field_keys)} fields")
+    print(f"    {'list of dicts':<16}{dict_bytes / count:8.0f} bytes/record")
+    print(f"    {'RecordStore':<16}{store_bytes / count:8.0f} bytes/record"
+          f"   ({dict_bytes / store_bytes:.1f}x smaller)")
+
+    for name, records in (("list of dicts", dicts), ("RecordStore", store)):
+        read = time_ms(lambda: [record["email"] for record in records])
+        switch = time_ms(lambda: [reader.raw_data.update(records[i]) for i in range(len(records))])
+        print(f"    {name:<16}read one field {read:7.1f} ms   switch record {switch / len(records) * 1000:6.1f} us")
@@ -0,0 +1,112 @@
+"""GUI startup cost: import time of Main.py and time to the first painted frame
+
+Runs `python -X importtime -c "import Main"` in a fresh interpreter and
+reports the total plus the slowest imports. It fails (exit status 1) if any
+module in DEFERRED_MODULES is loaded during startup, because those belong on
+first use and not on the path to the first frame. When a display is
+available it also launches the GUI and measures time-to-first-frame.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py [--budget-ms N]
+"""
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies that must stay out of the startup path
+DEFERRED_MODULES = ["pandas", "numpy", "openpyxl", "selenium"]
+
+FIRST_FRAME_SCRIPT = """
+import time
+started = time.perf_counter()
+from ExcelReader import ExcelReader
+from ExcelReaderFrontEnd import ExcelReaderFrontEnd
+
+app = ExcelReaderFrontEnd(ExcelReader())
+marks = {}
+
+def on_map(event):
+    if event.widget is app.root and "frame" not in marks:
+        app.root.update_idletasks()
+        marks["frame"] = (time.perf_counter() - started) * 1000
+        app.root.after_idle(lambda: app.root.after(0, fields_ready))
+
+def fields_ready():
+    marks["fields"] = (time.perf_counter() - started) * 1000
+    print(f"{marks['frame']:.1f} {marks['fields']:.1f}")
+    app.root.destroy()
+
+app.root.bind("<Map>", on_map, add="+")
+app.root.mainloop()
+"""
+
+
+def import_times(statement="import Main"):
+    """{module: (self_us, cumulative_us)} for statement in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def first_frame_ms():
+    """(first frame ms, fields built ms), or None without a display"""
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        return None
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    frame, fields = result.stdout.split()[-2:]
+    return float(frame), float(fields)
+
+
+if __name__ == "__main__":
+    budget_ms = None
+    if "--budget-ms" in sys.argv:
+        budget_ms = float(sys.argv[sys.argv.index("--budget-ms") + 1])
+
+    times = import_times()
+    # Modules the bare interpreter loads anyway (site, .pth hooks) are not ours
+    interpreter = import_times("pass")
+    total_ms = times["Main"][1] / 1000
+    print(f"📊 import Main: {total_ms:.1f} ms ({len(times)} modules)")
+    top_level = sorted(
+        (
+            (name, cumulative) for name, (_, cumulative) in times.items()
+            if "." not in name and name != "Main" and name not in interpreter
+        ),
+        key=lambda item: item[1], reverse=True
+    )
+    for name, cumulative in top_level[:10]:
+        print(f"    {name:<32}{cumulative / 1000:>10.1f} ms")
+
+    failed = False
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    if loaded:
+        print(f"❌ Loaded at startup but should be deferred: {', '.join(loaded)}")
+        failed = True
+    else:
+        print(f"✅ Deferred until first use: {', '.join(DEFERRED_MODULES)}")
+    if budget_ms is not None and total_ms > budget_ms:
+        print(f"❌ Import time {total_ms:.1f} ms is over the {budget_ms:.0f} ms budget")
+        failed = True
+
+    frame = first_frame_ms()
+    if frame is None:
+        print("ℹ️ Time-to-first-frame skipped (no display)")
+    else:
+        print(f"🖼️ First frame {frame[0]:.1f} ms, field rows ready {frame[1]:.1f} ms")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,113 @@
+"""DriverPool leasing at capacity, with a fake driver instead of Chrome
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import queue
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from DriverPool import DriverPool
+
+
+class FakeSwitchTo:
+    def window(self, handle):
+        pass
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for DriverPool; `alive` False fails the health check"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo()
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("session gone")
+        return 1
+
+    def get(self, url):
+        if not self.alive:
+            raise RuntimeError("session gone")
+
+    def close(self):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class DriverPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+        self.pool = DriverPool(self.factory, max_size=1)
+
+    def factory(self):
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+    def lease_in_thread(self):
+        """Start a lease() that has to wait; returns (thread, result list)"""
+        result = []
+        thread = threading.Thread(target=lambda: result.append(self.pool.lease(timeout=5)))
+        thread.start()
+        return thread, result
+
+    def test_release_wakes_waiting_lease(self):
+        driver = self.pool.lease()
+        thread, result = self.lease_in_thread()
+        self.pool.release(driver)
+        thread.join(5)
+        self.assertEqual(result, [driver])
+        self.assertEqual(self.pool.size, 1)
+
+    def test_discard_wakes_waiting_lease(self):
+        driver = self.pool.lease()
+        thread, result = self.lease_in_thread()
+        # A dead session fails its reset on release and is discarded
+        driver.alive = False
+        self.pool.release(driver)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(driver.quit_called)
+        self.assertEqual(len(result), 1)
+        self.assertIsNot(result[0], driver)
+        self.assertEqual(self.pool.size, 1)
+
+    def test_unhealthy_idle_session_is_replaced(self):
+        driver = self.pool.lease()
+        self.pool.release(driver)
+        driver.alive = False
+        replacement = self.pool.lease()
+        self.assertIsNot(replacement, driver)
+        self.assertTrue(driver.quit_called)
+        self.assertEqual(self.pool.size, 1)
+
+    def test_lease_times_out_at_capacity(self):
+        self.pool.lease()
+        with self.assertRaises(queue.Empty):
+            self.pool.lease(timeout=0.05)
+
+    def test_failed_factory_frees_its_slot(self):
+        def failing():
+            raise RuntimeError("chrome did not start")
+
+        self.pool.factory = failing
+        with self.assertRaises(RuntimeError):
+            self.pool.lease()
+        self.pool.factory = self.factory
+        self.assertIsNotNone(self.pool.lease(timeout=0.05))
+
+
+if __name__ == "__main__":
+    unittest.main()
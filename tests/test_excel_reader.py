@@ -0,0 +1,53 @@
+"""ExcelReader sheet selection, streaming and the record cache key
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import openpyxl
+from ExcelReader import ExcelReader
+from RecordCache import RecordCache
+
+
+class ExcelReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "applicants.xlsx")
+        workbook = openpyxl.Workbook()
+        # Column orientation: fields down the rows, one applicant per column
+        workbook.active.title = "s1"
+        workbook.active.append(["Perera", "Silva"])
+        workbook.create_sheet("s2").append(["Fernando"])
+        workbook.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def surnames(self, reader):
+        self.assertTrue(reader.select_file(self.path))
+        return [record["surname"] for record in reader.records]
+
+    def test_sheet_selection(self):
+        self.assertEqual(self.surnames(ExcelReader()), ["Perera", "Silva"])
+        self.assertEqual(self.surnames(ExcelReader(sheet_name="s2")), ["Fernando"])
+        self.assertEqual(self.surnames(ExcelReader(sheet_name=None)), ["Perera", "Silva", "Fernando"])
+
+    def test_cache_is_keyed_by_sheet(self):
+        cache = RecordCache(os.path.join(self.directory, "cache"))
+        self.assertEqual(self.surnames(ExcelReader(sheet_name="s1", cache=cache)), ["Perera", "Silva"])
+        self.assertEqual(self.surnames(ExcelReader(sheet_name="s2", cache=cache)), ["Fernando"])
+
+    def test_cache_is_keyed_by_pipeline(self):
+        cache = RecordCache(os.path.join(self.directory, "cache"))
+        self.assertNotEqual(ExcelReader(cache=cache)._cache_variant(),
+                            ExcelReader(cache=cache, pipeline=None)._cache_variant())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""FieldTransforms date, phone and enum parsing
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pandas as pd
+from FieldTransforms import (
+    DEFAULT_PIPELINE, MARITAL_VALUES, TransformPipeline, build_date, build_mapping, build_phone
+)
+
+
+def run(transform, values):
+    return transform(pd.Series(values, dtype=object)).tolist()
+
+
+class DateTest(unittest.TestCase):
+    def test_accepted_spellings(self):
+        values = ["1990-01-31", "1990-01-31 00:00:00", "31/01/1990", "31.01.1990", "31-01-1990"]
+        self.assertEqual(run(build_date(), values), ["1990-01-31"] * len(values))
+
+    def test_excel_serials(self):
+        self.assertEqual(run(build_date(), [32874, 32874.0]), ["1990-01-01", "1990-01-01"])
+
+    def test_booleans_are_not_serials(self):
+        self.assertEqual(run(build_date(), [True, False]), ["True", "False"])
+
+    def test_unparseable_values_pass_through(self):
+        result = run(build_date(), ["soon", None])
+        self.assertEqual(result[0], "soon")
+        self.assertTrue(pd.isna(result[1]))
+
+
+class PhoneTest(unittest.TestCase):
+    def test_separators_and_excel_suffix_are_stripped(self):
+        self.assertEqual(
+            run(build_phone(), ["077 123-4567", "(011) 234.5678", "771234567.0", "+94 77 123 4567"]),
+            ["0771234567", "0112345678", "771234567", "+94771234567"],
+        )
+
+    def test_values_without_digits_are_kept_for_validation(self):
+        self.assertEqual(run(build_phone(), ["n/a"]), ["n/a"])
+
+
+class MappingTest(unittest.TestCase):
+    def test_case_insensitive_with_unknown_values_kept(self):
+        self.assertEqual(
+            run(build_mapping(MARITAL_VALUES), ["MARRIED", "unmarried", "Widowed"]),
+            ["Married", "Single", "Widowed"],
+        )
+
+
+class PipelineTest(unittest.TestCase):
+    def test_identifier_depends_only_on_the_spec(self):
+        self.assertEqual(
+            TransformPipeline({"dob": "date", "phone1": "phone"}).identifier,
+            TransformPipeline({"phone1": "phone", "dob": "date"}).identifier,
+        )
+        self.assertNotEqual(TransformPipeline({"dob": "date"}).identifier, DEFAULT_PIPELINE.identifier)
+
+    def test_apply_skips_missing_columns(self):
+        frame = pd.DataFrame({"dob": ["31/01/1990"], "sex": ["female"]}, dtype=object)
+        result = DEFAULT_PIPELINE.apply(frame)
+        self.assertEqual(result.iloc[0].tolist(), ["1990-01-31", "F"])
+        self.assertEqual(frame.iloc[0, 0], "31/01/1990")
+
+
+if __name__ == "__main__":
+    unittest.main()
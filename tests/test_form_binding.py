@@ -0,0 +1,127 @@
+"""ObservableRecord notifications and FormBinding's diff-based widget updates
+
+Fake widgets stand in for customtkinter; like the real ones they ignore
+writes while disabled.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from FormBinding import FormBinding, ObservableRecord
+
+
+class FakeEntry:
+    def __init__(self, text="", state="normal"):
+        self.text = text
+        self.state = state
+        self.writes = 0
+
+    def get(self):
+        return self.text
+
+    def cget(self, option):
+        return self.state
+
+    def configure(self, state):
+        self.state = state
+
+    def delete(self, first, last):
+        if self.state == "normal":
+            self.text = ""
+            self.writes += 1
+
+    def insert(self, index, text):
+        if self.state == "normal":
+            self.text = text
+
+
+class FakeComboBox(FakeEntry):
+    """CTkComboBox.set(): unlocks only a readonly box, so a disabled one keeps its text"""
+
+    def set(self, text):
+        if self.state in ("normal", "readonly"):
+            self.text = text
+            self.writes += 1
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after_idle(self, callback):
+        self.callbacks.append(callback)
+
+    def run_idle(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class ObservableRecordTest(unittest.TestCase):
+    def test_only_changed_keys_are_reported_once_per_update(self):
+        record = ObservableRecord(surname="Perera", sex="M")
+        seen = []
+        record.subscribe(seen.append)
+        record["surname"] = "Perera"
+        record.update(surname="Silva", sex="M")
+        record["sex"] = "F"
+        self.assertEqual(seen, [["surname"], ["sex"]])
+
+
+class FormBindingTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.record = ObservableRecord(surname="Perera", sex="M", marital="")
+        self.entries = {
+            "surname": FakeEntry("Perera", state="disabled"),
+            "sex": FakeComboBox("M", state="disabled"),
+            "marital": FakeComboBox("Single", state="disabled"),
+        }
+        self.binding = FormBinding(self.root, self.record, self.entries, defaults={"marital": "Single"})
+
+    def test_changes_are_flushed_once_and_only_to_changed_widgets(self):
+        self.record.update(surname="Silva")
+        self.record["surname"] = "Fernando"
+        self.assertEqual(len(self.root.callbacks), 1)
+        self.root.run_idle()
+        self.assertEqual(self.entries["surname"].text, "Fernando")
+        self.assertEqual(self.entries["sex"].writes, 0)
+
+    def test_disabled_widgets_are_updated_and_relocked(self):
+        self.record.update(surname="Silva", sex="F")
+        self.root.run_idle()
+        self.assertEqual(self.entries["surname"].text, "Silva")
+        self.assertEqual(self.entries["sex"].text, "F")
+        self.assertEqual(self.entries["surname"].state, "disabled")
+        self.assertEqual(self.entries["sex"].state, "disabled")
+
+    def test_empty_dropdown_shows_its_default(self):
+        self.binding.sync()
+        self.root.run_idle()
+        self.assertEqual(self.entries["marital"].text, "Single")
+        self.assertEqual(self.entries["marital"].writes, 0)
+
+    def test_frozen_form_keeps_edits_and_applies_other_changes_on_thaw(self):
+        for widget in self.entries.values():
+            widget.state = "normal"
+        self.binding.freeze()
+        self.entries["surname"].text = "Typed"
+        # Changed elsewhere (the record table) while the form is being edited
+        self.record["sex"] = "F"
+        self.root.run_idle()
+        self.assertEqual(self.entries["sex"].text, "M")
+        self.assertEqual(self.binding.edited_keys(), {"surname": "Typed"})
+
+        self.record.update(self.binding.edited_keys())
+        self.binding.thaw()
+        self.root.run_idle()
+        self.assertEqual(dict(self.record), {"surname": "Typed", "sex": "F", "marital": ""})
+        self.assertEqual(self.entries["sex"].text, "F")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""ProgressJournal states, resume and forget
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ProgressJournal import ProgressJournal
+
+RECORDS = [{"surname": "Perera"}, {"surname": "Silva"}, {"surname": "Fernando"}]
+
+
+class ProgressJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "journal.jsonl")
+        self.journal = ProgressJournal(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_restart_skips_filled_records(self):
+        self.journal.mark(RECORDS[0], "filling")
+        self.journal.mark(RECORDS[0], "filled")
+        self.journal.mark(RECORDS[1], "in-review")
+        self.journal.mark(RECORDS[2], "failed")
+        resumed = ProgressJournal(self.path)
+        self.assertEqual(resumed.pending_indexes(RECORDS), [1, 2])
+        self.assertEqual(resumed.state(RECORDS[1]), "in-review")
+
+    def test_record_key_ignores_empty_fields_and_order(self):
+        self.assertEqual(
+            ProgressJournal.record_key({"surname": "Perera", "email": ""}),
+            ProgressJournal.record_key({"email": None, "surname": "Perera"}),
+        )
+
+    def test_torn_last_line_is_ignored(self):
+        self.journal.mark(RECORDS[0], "filled")
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"key": "abc", "sta')
+        self.assertTrue(ProgressJournal(self.path).is_filled(RECORDS[0]))
+
+    def test_forget_makes_records_pending_again(self):
+        for record in RECORDS:
+            self.journal.mark(record, "filled")
+        self.journal.forget(RECORDS[:1])
+        self.assertEqual(ProgressJournal(self.path).pending_indexes(RECORDS), [0])
+
+    def test_unknown_state_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.journal.mark(RECORDS[0], "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""RecordCache round trips, variants and LRU eviction
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from RecordCache import RecordCache
+
+KEYS = ["surname", "email"]
+RECORDS = [{"surname": "Perera", "email": "p@example.com"}, {"surname": "Silva", "email": ""}]
+
+
+class RecordCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def workbook(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_round_trip_survives_a_new_instance(self):
+        path = self.workbook("a.xlsx", b"workbook a")
+        self.assertIsNone(RecordCache(self.cache_dir).get(path))
+        self.assertTrue(RecordCache(self.cache_dir).put(path, RECORDS, KEYS))
+        records = RecordCache(self.cache_dir).get(path)
+        self.assertEqual([dict(record) for record in records], RECORDS)
+
+    def test_variants_are_separate_entries(self):
+        path = self.workbook("a.xlsx", b"workbook a")
+        cache = RecordCache(self.cache_dir)
+        cache.put(path, RECORDS, KEYS, variant="sheet:'s1'")
+        self.assertIsNone(cache.get(path, variant="sheet:'s2'"))
+        self.assertIsNotNone(cache.get(path, variant="sheet:'s1'"))
+
+    def test_changed_contents_miss(self):
+        path = self.workbook("a.xlsx", b"workbook a")
+        cache = RecordCache(self.cache_dir)
+        cache.put(path, RECORDS, KEYS)
+        self.workbook("a.xlsx", b"workbook a, edited")
+        self.assertIsNone(RecordCache(self.cache_dir).get(path))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        first = self.workbook("a.xlsx", b"workbook a")
+        second = self.workbook("b.xlsx", b"workbook b")
+        cache = RecordCache(self.cache_dir)
+        cache.put(first, RECORDS, KEYS)
+        entry_bytes = sum(entry["bytes"] for entry in cache.index["entries"].values())
+        # Room for exactly one entry: storing the second evicts the first
+        cache.max_bytes = entry_bytes
+        cache.put(second, RECORDS, KEYS)
+        self.assertIsNone(cache.get(first))
+        self.assertIsNotNone(cache.get(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""RecordStore columns and the dict-like RecordRow view
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from RecordStore import CategoricalColumn, RecordStore, TextColumn
+
+
+class TextColumnTest(unittest.TestCase):
+    def test_values_round_trip_through_the_buffer(self):
+        column = TextColumn()
+        values = ["Perera", "", "Jayasūriya", "ශ්‍රී ලංකා", "x"]
+        for value in values:
+            column.append(value)
+        self.assertEqual(column.values(), values)
+        self.assertEqual(column.get(0), "Perera")
+        self.assertEqual(column.get(3), "ශ්‍රී ලංකා")
+
+    def test_edits_and_non_str_values_take_precedence(self):
+        column = TextColumn()
+        column.append("a")
+        column.append(None)
+        column.append("c")
+        column.set(0, "edited")
+        self.assertEqual(column.values(), ["edited", None, "c"])
+
+
+class CategoricalColumnTest(unittest.TestCase):
+    def test_repeated_values_share_one_category(self):
+        column = CategoricalColumn()
+        for value in ["M", "F", "M", "M"]:
+            column.append(value)
+        column.set(1, "M")
+        self.assertEqual(column.values(), ["M", "M", "M", "M"])
+        self.assertEqual(column.categories, ["", "M", "F"])
+
+
+class RecordStoreTest(unittest.TestCase):
+    KEYS = ["surname", "sex", "email"]
+
+    def setUp(self):
+        self.store = RecordStore.from_records(self.KEYS, [
+            {"surname": "Perera", "sex": "M", "email": "p@example.com"},
+            {"surname": "Silva", "sex": "F"},
+        ])
+
+    def test_rows_read_like_dicts(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(dict(self.store[1]), {"surname": "Silva", "sex": "F", "email": ""})
+        self.assertEqual(self.store[-1]["surname"], "Silva")
+        self.assertEqual([row["sex"] for row in self.store[0:2]], ["M", "F"])
+        with self.assertRaises(IndexError):
+            self.store[2]
+
+    def test_row_writes_go_to_the_columns(self):
+        self.store[0]["email"] = "new@example.com"
+        self.store[1] = {"surname": "Fernando", "sex": "M"}
+        self.assertEqual(self.store.column("email"), ["new@example.com", ""])
+        self.assertEqual(self.store.column("surname"), ["Perera", "Fernando"])
+
+    def test_schema_is_fixed(self):
+        row = self.store[0]
+        with self.assertRaises(KeyError):
+            row["unknown"] = "x"
+        with self.assertRaises(TypeError):
+            del row["surname"]
+
+    def test_from_columns_checks_lengths(self):
+        store = RecordStore.from_columns(self.KEYS, [["a", "b"], ["M", "F"], ["", ""]])
+        self.assertEqual(store[1]["surname"], "b")
+        with self.assertRaises(ValueError):
+            RecordStore.from_columns(self.KEYS, [["a", "b"], ["M"], ["", ""]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""RecordValidator rules, report numbering and the schema read from index.html
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from RecordValidator import (
+    DEFAULT_VALIDATOR, FALLBACK_FORM_SCHEMA, FORM_PAGE_PATH, load_form_schema, schema_from_html
+)
+
+VALID = {
+    "surname": "Perera", "other_name": "Nimal", "dob": "1990-01-31", "sex": "M",
+    "P_num": "N1234567", "P_exp": "31/12/2030", "nationality": "Sri Lankan", "marital": "single",
+    "email": "nimal@example.com", "phone1": "077 123 4567", "phone2": "", "address": "Colombo",
+}
+
+
+def with_fields(**fields):
+    return {**VALID, **fields}
+
+
+class RecordValidatorTest(unittest.TestCase):
+    def test_valid_record_passes(self):
+        report = DEFAULT_VALIDATOR.validate([VALID])
+        self.assertEqual(report.valid_indexes, [0])
+        self.assertEqual(report.rejected_count, 0)
+
+    def test_each_rule_is_reported(self):
+        records = [
+            with_fields(surname=""),
+            with_fields(email="not-an-email"),
+            with_fields(dob="someday"),
+            with_fields(phone2="12"),
+            with_fields(sex="X"),
+        ]
+        report = DEFAULT_VALIDATOR.validate(records)
+        self.assertEqual(report.valid_indexes, [])
+        self.assertEqual(report.problems[0], ["surname: missing"])
+        self.assertEqual(report.problems[1], ["email: invalid email"])
+        self.assertEqual(report.problems[2], ["dob: not a date"])
+        self.assertEqual(report.problems[3], ["phone2: invalid phone"])
+        self.assertEqual(report.problems[4], ["sex: unknown option"])
+
+    def test_filter_reports_the_given_record_numbers(self):
+        valid, report = DEFAULT_VALIDATOR.filter([VALID, with_fields(email="")], numbers=[4, 9])
+        self.assertEqual(valid, [VALID])
+        self.assertIn("Record 9: email: missing", report.describe())
+
+
+class FormSchemaTest(unittest.TestCase):
+    def test_fallback_matches_the_saved_form(self):
+        # Update FALLBACK_FORM_SCHEMA whenever index.html changes
+        self.assertEqual(schema_from_html(FORM_PAGE_PATH), FALLBACK_FORM_SCHEMA)
+
+    def test_missing_page_uses_the_fallback(self):
+        self.assertEqual(load_form_schema(os.path.join(os.path.dirname(FORM_PAGE_PATH), "missing.html")),
+                         FALLBACK_FORM_SCHEMA)
+
+
+if __name__ == "__main__":
+    unittest.main()